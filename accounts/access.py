@@ -0,0 +1,77 @@
+# accounts/access.py
+app_name = 'accounts'
+
+import time
+import atexit
+import logging
+import threading
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.utils.timezone import now
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+
+# Last Access Tracker
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class LastAccessTracker:
+    """
+    last_access 를 요청마다 저장하지 않고 프로세스 메모리에 모아 LAST_ACCESS_FLUSH_INTERVAL 초마다 한 번의 UPDATE 로 반영한다.
+    저장된 값이 LAST_ACCESS_GRANULARITY 초 이내이면 기록하지 않는다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.thread = None
+
+    def touch(self, user):
+        # The in-memory user always carries the new value (e.g. for AuthResponseBuilder)
+        timestamp = now()
+        previous, user.last_access = user.last_access, timestamp
+        if previous is not None and timestamp - previous < timedelta(seconds=settings.LAST_ACCESS_GRANULARITY):
+            return False
+
+        with self.lock:
+            self.pending[user.pk] = timestamp
+        if settings.LAST_ACCESS_FLUSH_INTERVAL <= 0:
+            self.flush()
+        else:
+            self.start()
+        return True
+
+    def start(self):
+        # Started lazily so that each forked worker runs its own flusher
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="last-access-flusher", daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            time.sleep(settings.LAST_ACCESS_FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush last_access")
+            finally:
+                connection.close()      # This thread's own connection
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        if not pending:
+            return 0
+
+        # One UPDATE ... SET last_access = CASE id WHEN ... END WHERE id IN (...)
+        User.objects.bulk_update([User(pk=pk, last_access=timestamp) for pk, timestamp in pending.items()], ["last_access"])
+        return len(pending)
+
+
+tracker = LastAccessTracker()
+atexit.register(tracker.flush)
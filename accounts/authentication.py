@@ -0,0 +1,166 @@
+# accounts/authentication.py
+app_name = 'accounts'
+
+import time
+import threading
+
+from collections import OrderedDict
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+
+from server.cache import get_tag_versions, invalidate_tags, make_key
+
+from .models import User, UserSocialAccount
+
+# Copied into every token so that permission checks need no User row
+CLAIM_FIELDS = ("is_active", "is_staff", "is_admin", "is_business")
+VERSION_CLAIM = "ver"
+
+
+# User Versions
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def user_tag(pk):
+    return f"accounts.user.{pk}"
+
+
+def get_user_version(pk):
+    # Shared cache counter (server.cache tag versions), bumped on every User save / delete
+    return get_tag_versions([user_tag(pk)])[0]
+
+
+def invalidate_user(sender, instance, **kwargs):
+    # post_save / post_delete receiver
+    invalidate_tags(user_tag(instance.pk))
+    user_cache.discard(instance.pk)
+
+
+def token_claims(user):
+    claims = {VERSION_CLAIM: get_user_version(user.pk)}
+    for field in CLAIM_FIELDS:
+        claims[field] = getattr(user, field)
+    return claims
+
+
+# User Cache
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class UserCache:
+    """
+    프로세스별 User 행 캐시. (id, version) 이 같고 USER_CACHE_TTL 이내이면 DB 를 조회하지 않는다.
+    version 은 공유 캐시에 있으므로 다른 프로세스에서 저장된 변경도 다음 요청에 반영된다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()        # pk -> (version, expires_at, values)
+        self.field_names = [field.attname for field in User._meta.concrete_fields]
+
+    def get(self, pk, version=None):
+        if version is None:
+            version = get_user_version(pk)
+
+        with self.lock:
+            entry = self.entries.get(pk)
+        if entry is not None and entry[0] == version and entry[1] > time.monotonic():
+            values = entry[2]
+        else:
+            # The version is read first: a concurrent save leaves this row under the old version only
+            values = User.objects.filter(pk=pk).values_list(*self.field_names).first()
+            if values is None:
+                raise User.DoesNotExist()
+            with self.lock:
+                self.entries[pk] = (version, time.monotonic() + settings.USER_CACHE_TTL, values)
+                self.entries.move_to_end(pk)
+                while len(self.entries) > settings.USER_CACHE_SIZE:
+                    self.entries.popitem(last=False)
+
+        # A new instance per request: views may modify and save it
+        return User.from_db(router.db_for_read(User), self.field_names, values)
+
+    def discard(self, pk):
+        with self.lock:
+            self.entries.pop(pk, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+user_cache = UserCache()
+
+
+def claims_user(user_id, validated_token):
+    # Only id and CLAIM_FIELDS are set; any other field is loaded from user_cache on first access (User.refresh_from_db)
+    claims = {User._meta.pk.attname: user_id, **{field: validated_token[field] for field in CLAIM_FIELDS}}
+    field_names = [field.attname for field in User._meta.concrete_fields if field.attname in claims]
+    user = User.from_db(router.db_for_read(User), field_names, [claims[name] for name in field_names])
+    user.from_claims = True
+    return user
+
+
+# Social Accounts
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def social_account_key(provider, provider_user_id):
+    return make_key("social", provider, provider_user_id)
+
+
+def invalidate_social_account(sender, instance, **kwargs):
+    # post_save / post_delete receiver (also sent for accounts deleted with their User)
+    cache.delete(social_account_key(instance.provider, instance.provider_user_id))
+
+
+def get_social_user(provider, provider_user_id):
+    """
+    소셜 로그인 사용자 조회. (provider, provider_user_id) -> user_id 매핑을 공유 캐시에 저장하고, User 는 user_cache 에서 가져온다.
+    캐시가 없으면 select_related 쿼리 한 번으로 조회한다. 연결된 계정이 없으면 UserSocialAccount.DoesNotExist.
+    """
+    key = social_account_key(provider, provider_user_id)
+    user_id = cache.get(key)
+    if user_id is not None:
+        try:
+            return user_cache.get(user_id)
+        except User.DoesNotExist:
+            cache.delete(key)
+
+    social_account = UserSocialAccount.objects.select_related("user").get(provider=provider, provider_user_id=provider_user_id)
+    cache.set(key, social_account.user_id, settings.SOCIAL_ACCOUNT_CACHE_TTL)
+    return social_account.user
+
+
+# Authentication
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    Default: request.user is built from the token claims while the token's version is current (one cache read, no DB query).
+    Older tokens fall back to the per-process user cache.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])     # The claim is a string
+        except (KeyError, ValidationError):
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        version = get_user_version(user_id)
+        if validated_token.get(VERSION_CLAIM) == version and all(field in validated_token for field in CLAIM_FIELDS):
+            user = claims_user(user_id, validated_token)
+        else:
+            try:
+                user = user_cache.get(user_id, version)
+            except User.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+class FreshJWTAuthentication(JWTAuthentication):
+    """Opt-in per view (authentication_classes) where the current DB row is required: loads User on every request"""
@@ -0,0 +1,23 @@
+# accounts/extensions.py
+app_name = "accounts"
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from drf_spectacular.drainage import set_override
+
+from .authentication import StatelessJWTAuthentication, FreshJWTAuthentication
+
+
+# OpenAPI Authentication Extensions
+# <-------------------------------------------------------------------------------------------------------------------------------->
+# Registered on import (OPENAPI_EXTENSION_MODULES, at schema generation): both authenticators read the same Bearer JWT as simplejwt's JWTAuthentication
+class StatelessJWTScheme(SimpleJWTScheme):
+    target_class = "accounts.authentication.StatelessJWTAuthentication"
+
+
+class FreshJWTScheme(SimpleJWTScheme):
+    target_class = "accounts.authentication.FreshJWTAuthentication"
+
+
+# Identical jwtAuth definitions: one security scheme component, not a name collision
+for authenticator in (StatelessJWTAuthentication, FreshJWTAuthentication):
+    set_override(authenticator, "suppress_collision_warning", True)
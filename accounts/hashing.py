@@ -0,0 +1,110 @@
+# accounts/hashing.py
+app_name = 'accounts'
+
+import time
+import threading
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from server.metrics import CacheCounter, ProcessHistogram
+
+hash_latency = ProcessHistogram("auth.password_hash_ms")   # Slot wait + hashing, per call (per process: no cache round trips on login)
+hash_rejected = CacheCounter("auth.password_hash_busy")
+
+
+# Hasher
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class TunablePBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """pbkdf2_sha256 with PASSWORD_HASH_ITERATIONS. Hashes with another count are re-encoded on the next successful login."""
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS
+
+
+# Hashing Pool
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class PasswordHashingBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many sign-in requests are being processed. Please try again shortly."
+    default_code = "password_hashing_busy"
+    wait = 1        # Retry-After
+
+
+class PasswordHashingPool:
+    """
+    비밀번호 해시 / 검증을 요청 스레드 대신 프로세스 풀(PASSWORD_HASHING_WORKERS)에서 실행한다.
+    동시에 처리하거나 기다릴 수 있는 요청은 PASSWORD_HASHING_CONCURRENCY 개로 제한해, 로그인이 몰려도 다른 API 의 스레드를 모두 붙잡지 않는다.
+    PASSWORD_HASHING_WAIT 초 안에 자리가 나지 않으면 PasswordHashingBusy (503) 를 발생시킨다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executor = None
+        self.slots = None
+
+    def get_slots(self):
+        if self.slots is None:
+            with self.lock:
+                if self.slots is None:
+                    self.slots = threading.BoundedSemaphore(settings.PASSWORD_HASHING_CONCURRENCY)
+        return self.slots
+
+    def get_executor(self):
+        # Created on first use, i.e. after the gunicorn fork. forkserver / spawn: never fork a multi-threaded web worker
+        if self.executor is None and settings.PASSWORD_HASHING_WORKERS > 0:
+            with self.lock:
+                if self.executor is None:
+                    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                    self.executor = ProcessPoolExecutor(
+                        settings.PASSWORD_HASHING_WORKERS, mp_context=multiprocessing.get_context(method), initializer=django.setup
+                    )
+        return self.executor
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, function, *args):
+        start = time.perf_counter()
+        slots = self.get_slots()
+        if not slots.acquire(timeout=settings.PASSWORD_HASHING_WAIT):
+            hash_rejected.inc()
+            raise PasswordHashingBusy()
+        try:
+            executor = self.get_executor()
+            if executor is None:
+                return function(*args)
+            try:
+                return executor.submit(function, *args).result()
+            except BrokenProcessPool:
+                # A hashing process died (OOM kill): start a new pool next time, answer this request inline
+                with self.lock:
+                    if self.executor is executor:
+                        self.executor = None
+                return function(*args)
+        finally:
+            slots.release()
+            hash_latency.observe((time.perf_counter() - start) * 1000)
+
+    def make_password(self, password):
+        return self.run(hashers.make_password, password)
+
+    def verify_password(self, password, encoded):
+        """Returns (is_correct, must_update) as django.contrib.auth.hashers.verify_password"""
+        return self.run(hashers.verify_password, password, encoded)
+
+
+hashing_pool = PasswordHashingPool()
@@ -0,0 +1,91 @@
+# accounts/jwks.py
+app_name = 'accounts'
+
+# Standalone (PyJWT only, no Django) so that sidecars and other services can import it.
+
+import re
+import json
+import time
+import threading
+import urllib.request
+
+import jwt
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+# Verifier
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class JWKSVerifier:
+    """
+    /.well-known/jwks.json 의 공개키로 토큰을 로컬에서 검증한다. 키는 kid 별로 프로세스에 캐시되고,
+    응답의 Cache-Control max-age 가 지나거나 모르는 kid (키 교체) 가 오면 다시 받아온다 (min_refresh_interval 마다 최대 한 번).
+
+        verifier = JWKSVerifier("https://api.example.com/.well-known/jwks.json")
+        payload = verifier.verify(token)        # raises jwt.InvalidTokenError
+    """
+
+    def __init__(self, url, audience=None, issuer=None, leeway=0, default_max_age=300, min_refresh_interval=30, timeout=5):
+        self.url = url
+        self.audience = audience
+        self.issuer = issuer
+        self.leeway = leeway
+        self.default_max_age = default_max_age
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+
+        self.lock = threading.Lock()
+        self.keys = {}              # kid -> jwt.PyJWK
+        self.expires_at = 0
+        self.fetched_at = 0
+
+    def fetch(self):
+        with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+            data = json.loads(response.read())
+            match = MAX_AGE_PATTERN.search(response.headers.get("Cache-Control", ""))
+
+        keys = {}
+        for jwk in data.get("keys", []):
+            try:
+                keys[jwk["kid"]] = jwt.PyJWK(jwk)
+            except (KeyError, jwt.PyJWKError):
+                continue        # Unsupported key types are skipped
+        max_age = int(match.group(1)) if match else self.default_max_age
+        return keys, max_age
+
+    def refresh(self, force=False):
+        with self.lock:
+            now = time.monotonic()
+            if not force and now < self.expires_at:
+                return
+            if force and now - self.fetched_at < self.min_refresh_interval:
+                return
+            self.keys, max_age = self.fetch()
+            self.fetched_at = now
+            self.expires_at = now + max_age
+
+    def get_key(self, kid):
+        if time.monotonic() >= self.expires_at:
+            self.refresh()
+        key = self.keys.get(kid)
+        if key is None:
+            self.refresh(force=True)
+            key = self.keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        return key
+
+    def verify(self, token, token_type="access"):
+        key = self.get_key(jwt.get_unverified_header(token).get("kid"))
+        payload = jwt.decode(
+            token,
+            key.key,
+            algorithms=[key.algorithm_name],
+            audience=self.audience,
+            issuer=self.issuer,
+            leeway=self.leeway,
+            options={"verify_aud": self.audience is not None, "require": ["exp", "jti"]},
+        )
+        if token_type is not None and payload.get("token_type") != token_type:
+            raise jwt.InvalidTokenError("Wrong token type")
+        return payload
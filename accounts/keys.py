@@ -0,0 +1,103 @@
+# accounts/keys.py
+app_name = 'accounts'
+
+import json
+import base64
+import hashlib
+import functools
+
+from collections import namedtuple
+
+import jwt
+
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+
+from rest_framework_simplejwt.settings import api_settings
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from server.conditional import make_etag
+
+# Asymmetric algorithms and the key type each one signs with
+KEY_TYPES = {
+    "RS256": rsa.RSAPublicKey,
+    "RS384": rsa.RSAPublicKey,
+    "RS512": rsa.RSAPublicKey,
+    "EdDSA": ed25519.Ed25519PublicKey,
+}
+
+SigningKey = namedtuple("SigningKey", ["kid", "algorithm", "private_key", "public_key", "jwk"])
+
+
+# Key Ring
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def thumbprint(jwk):
+    # RFC 7638: SHA-256 of the required members in lexicographic order
+    required = {"RSA": ("e", "kty", "n"), "OKP": ("crv", "kty", "x")}[jwk["kty"]]
+    canonical = json.dumps({name: jwk[name] for name in required}, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(hashlib.sha256(canonical.encode()).digest()).rstrip(b"=").decode()
+
+
+def load_key(path, algorithm):
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if b"PRIVATE KEY" in data:
+        private_key = load_pem_private_key(data, password=None)
+        public_key = private_key.public_key()
+    else:
+        private_key, public_key = None, load_pem_public_key(data)
+
+    if not isinstance(public_key, KEY_TYPES[algorithm]):
+        raise ImproperlyConfigured(f"{path} is not a {algorithm} key")
+
+    jwk = jwt.get_algorithm_by_name(algorithm).to_jwk(public_key, as_dict=True)
+    kid = thumbprint(jwk)
+    jwk.update({"kid": kid, "alg": algorithm, "use": "sig"})
+    return SigningKey(kid, algorithm, private_key, public_key, jwk)
+
+
+class KeyRing:
+    """
+    JWT 서명 키 목록. 첫 번째 키(JWT_PRIVATE_KEY_FILES[0])로 서명하고, 나머지 키는 검증에만 사용한다.
+    키 교체: 새 키를 맨 앞에 추가하고, 이전 키는 발급한 refresh 토큰이 만료될 때까지 JWT_PUBLIC_KEY_FILES 에 남겨 둔다.
+    kid 는 공개키의 RFC 7638 thumbprint 라서 노드마다 같은 값이 된다.
+    """
+
+    def __init__(self, algorithm, private_key_files=(), public_key_files=()):
+        self.algorithm = algorithm
+        self.keys = {}
+        self.active = None
+        if algorithm not in KEY_TYPES:
+            return      # HMAC: SIGNING_KEY is the shared secret, nothing to publish
+
+        private_keys = [load_key(path, algorithm) for path in private_key_files]
+        public_keys = [load_key(path, algorithm) for path in public_key_files]
+        if not private_keys or private_keys[0].private_key is None:
+            raise ImproperlyConfigured(f"JWT_ALGORITHM {algorithm} requires a private key in JWT_PRIVATE_KEY_FILES")
+
+        self.active = private_keys[0]
+        for key in (*private_keys, *public_keys):
+            self.keys.setdefault(key.kid, key)
+
+    @property
+    def asymmetric(self):
+        return self.active is not None
+
+    def get(self, kid):
+        return self.keys.get(kid)
+
+    @functools.cached_property
+    def jwks(self):
+        return {"keys": [key.jwk for key in self.keys.values()]}
+
+    @functools.cached_property
+    def etag(self):
+        return make_etag("jwks", *self.keys)
+
+
+@functools.lru_cache(maxsize=1)
+def get_keyring():
+    return KeyRing(api_settings.ALGORITHM, settings.JWT_PRIVATE_KEY_FILES, settings.JWT_PUBLIC_KEY_FILES)
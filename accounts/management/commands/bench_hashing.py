@@ -0,0 +1,81 @@
+# accounts/management/commands/bench_hashing.py
+app_name = 'accounts'
+
+import time
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from accounts.hashing import PasswordHashingBusy, PasswordHashingPool
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure PBKDF2 cost per PASSWORD_HASH_ITERATIONS value, then login throughput and latency of the hashing pool "
+        "for PASSWORD_HASHING_WORKERS / PASSWORD_HASHING_CONCURRENCY values under concurrent requests. No database access."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", default="260000,600000,1000000", help="Comma separated PBKDF2 iteration counts")
+        parser.add_argument("--samples", type=int, default=5, help="Hashes per iteration count")
+        parser.add_argument("--workers", default="0,1,2,4", help="Comma separated PASSWORD_HASHING_WORKERS values")
+        parser.add_argument("--concurrency", type=int, default=None, help="PASSWORD_HASHING_CONCURRENCY (default: setting)")
+        parser.add_argument("--requests", type=int, default=32, help="Simulated logins per pool configuration")
+        parser.add_argument("--threads", type=int, default=8, help="Request threads (gunicorn threads per worker)")
+
+    def handle(self, *args, **options):
+        hasher = PBKDF2PasswordHasher()
+        salt = hasher.salt()
+
+        self.stdout.write(f"{'iterations':>10}  {'ms/hash':>8}  {'hashes/s/core':>13}")
+        for iterations in [int(value) for value in options["iterations"].split(",")]:
+            hasher.encode("bench-password", salt, iterations)      # Warm up
+            start = time.perf_counter()
+            for _ in range(options["samples"]):
+                hasher.encode("bench-password", salt, iterations)
+            ms = (time.perf_counter() - start) / options["samples"] * 1000
+            marker = "  <- PASSWORD_HASH_ITERATIONS" if iterations == settings.PASSWORD_HASH_ITERATIONS else ""
+            self.stdout.write(f"{iterations:>10,}  {ms:>8.1f}  {1000 / ms:>13.1f}{marker}")
+
+        concurrency = options["concurrency"] or settings.PASSWORD_HASHING_CONCURRENCY
+        self.stdout.write("")
+        self.stdout.write(
+            f"{options['requests']} logins from {options['threads']} threads, PASSWORD_HASH_ITERATIONS={settings.PASSWORD_HASH_ITERATIONS:,}, "
+            f"PASSWORD_HASHING_CONCURRENCY={concurrency}"
+        )
+        self.stdout.write(f"{'workers':>7}  {'logins/s':>8}  {'p50 ms':>7}  {'max ms':>7}  {'503s':>5}")
+        for workers in [int(value) for value in options["workers"].split(",")]:
+            with override_settings(PASSWORD_HASHING_WORKERS=workers, PASSWORD_HASHING_CONCURRENCY=concurrency):
+                self.run_pool(workers, options)
+
+    def run_pool(self, workers, options):
+        pool = PasswordHashingPool()
+        encoded = pool.make_password("bench-password")      # Starts the processes outside the measurement
+        latencies, rejected, lock = [], [0], threading.Lock()
+
+        def login(_):
+            start = time.perf_counter()
+            try:
+                pool.verify_password("bench-password", encoded)
+            except PasswordHashingBusy:
+                with lock:
+                    rejected[0] += 1
+                return
+            with lock:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(options["threads"]) as threads:
+            list(threads.map(login, range(options["requests"])))
+        elapsed = time.perf_counter() - start
+        pool.shutdown()
+
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] if latencies else 0
+        maximum = latencies[-1] if latencies else 0
+        self.stdout.write(f"{workers:>7}  {len(latencies) / elapsed:>8.1f}  {p50:>7.0f}  {maximum:>7.0f}  {rejected[0]:>5}")
@@ -0,0 +1,40 @@
+# accounts/management/commands/bench_tokens.py
+app_name = 'accounts'
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import User
+from accounts.tokens import get_token, token_service
+from accounts.utils import AuthResponseBuilder
+
+
+class Command(BaseCommand):
+    help = "Measure per-login CPU time of token minting (simplejwt vs TokenService) and of AuthResponseBuilder.build. No database access."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        user = User(id=1, email="bench@example.com", name="bench", username="bench", referral_code="bench")
+
+        def simplejwt_pair():
+            token = get_token(user)
+            return str(token.access_token), str(token)
+
+        cases = [
+            ("simplejwt get_token", simplejwt_pair),
+            ("TokenService.pair", lambda: token_service.pair(user)),
+            ("AuthResponseBuilder.build", lambda: AuthResponseBuilder(user).build()),
+        ]
+
+        self.stdout.write(f"{'case':<28}  {'CPU us/login':>12}  {'logins/s/core':>14}")
+        for name, function in cases:
+            function()      # Warm up (key objects, templates, serializer fields)
+            start = time.process_time()
+            for _ in range(iterations):
+                function()
+            cpu_us = (time.process_time() - start) / iterations * 1_000_000
+            self.stdout.write(f"{name:<28}  {cpu_us:>12.1f}  {1_000_000 / cpu_us:>14,.0f}")
@@ -0,0 +1,180 @@
+# accounts/management/commands/fake_providers.py
+app_name = 'accounts'
+
+import json
+import time
+import random
+import hashlib
+import urllib.parse
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+
+def fake_identity(code):
+    # Same code -> same provider user; different codes -> different users
+    digest = hashlib.sha256(code.encode()).hexdigest()
+    return {
+        "id": digest[:16],
+        "email": f"{digest[:10]}@example.com",
+        "name": f"Fake {digest[:6]}",
+        "mobile": "010" + str(int(digest[:12], 16))[-8:].zfill(8),
+    }
+
+
+def code_from_token(handler):
+    # Access tokens are "fake:<code>" so that the profile call knows which user to return
+    token = handler.headers.get("Authorization", "").rpartition(" ")[2]
+    return token.partition(":")[2] or None
+
+
+# Provider Routes
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def token_response(code):
+    if not code or code.startswith("invalid"):
+        return 400, {"error": "invalid_grant", "error_description": "Invalid authorization code."}
+    return 200, {"access_token": f"fake:{code}", "token_type": "bearer", "expires_in": 3600}
+
+
+def naver_token(handler, query, form):
+    return token_response(form.get("code"))
+
+
+def naver_profile(handler, query, form):
+    code = code_from_token(handler)
+    if code is None:
+        return 401, {"resultcode": "024", "message": "Authentication failed"}
+    identity = fake_identity(code)
+    return 200, {"resultcode": "00", "message": "success", "response": {**identity, "mobile": identity["mobile"][:3] + "-" + identity["mobile"][3:7] + "-" + identity["mobile"][7:]}}
+
+
+def google_token(handler, query, form):
+    return token_response(form.get("code"))
+
+
+def google_profile(handler, query, form):
+    code = code_from_token(handler)
+    if code is None:
+        return 401, {"error": {"code": 401, "message": "Invalid Credentials"}}
+    identity = fake_identity(code)
+    return 200, {"id": identity["id"], "email": identity["email"], "name": identity["name"], "verified_email": True}
+
+
+def kakao_token(handler, query, form):
+    return token_response(query.get("code"))
+
+
+def kakao_profile(handler, query, form):
+    code = code_from_token(handler)
+    if code is None:
+        return 401, {"msg": "this access token does not exist", "code": -401}
+    identity = fake_identity(code)
+    return 200, {
+        "id": int(identity["id"][:12], 16),
+        "kakao_account": {"email": identity["email"], "name": identity["name"], "phone_number": "+82 " + identity["mobile"][1:3] + "-" + identity["mobile"][3:7] + "-" + identity["mobile"][7:]},
+        "properties": {"nickname": identity["name"]},
+    }
+
+
+def portone_verification(handler, query, form, verification_id):
+    if not handler.headers.get("Authorization", "").startswith("PortOne "):
+        return 401, {"type": "UNAUTHORIZED", "message": "Invalid API secret"}
+    if verification_id.startswith("unverified"):
+        return 200, {"id": verification_id, "status": "READY"}
+    identity = fake_identity(verification_id)
+    return 200, {
+        "id": verification_id,
+        "status": "VERIFIED",
+        "verifiedCustomer": {
+            "ci": hashlib.sha256(f"ci:{verification_id}".encode()).hexdigest(),
+            "di": hashlib.sha256(f"di:{verification_id}".encode()).hexdigest(),
+            "name": identity["name"],
+            "gender": "MALE",
+            "birthDate": "1990-01-01",
+            "phoneNumber": identity["mobile"],
+            "operator": "SKT",
+            "isForeigner": False,
+        },
+    }
+
+
+# (method, host, path) -> handler; paths are as rewritten by PROVIDER_URL_OVERRIDE (/<host>/<path>)
+ROUTES = {
+    ("POST", "nid.naver.com", "/oauth2.0/token"): naver_token,
+    ("GET", "openapi.naver.com", "/v1/nid/me"): naver_profile,
+    ("POST", "oauth2.googleapis.com", "/token"): google_token,
+    ("GET", "www.googleapis.com", "/oauth2/v2/userinfo"): google_profile,
+    ("GET", "kauth.kakao.com", "/oauth/token"): kakao_token,
+    ("POST", "kapi.kakao.com", "/v2/user/me"): kakao_profile,
+}
+
+
+class FakeProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # Keep-alive, as the real providers
+    delay = 0.0
+    fail_rate = 0.0
+
+    def handle_request(self, method):
+        url = urllib.parse.urlsplit(self.path)
+        host, _, path = url.path.lstrip("/").partition("/")
+        path = "/" + path
+        query = dict(urllib.parse.parse_qsl(url.query))
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        form = dict(urllib.parse.parse_qsl(body.decode())) if self.headers.get("Content-Type", "").startswith("application/x-www-form-urlencoded") else {}
+
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail_rate and random.random() < self.fail_rate:
+            return self.respond(503, {"error": "temporarily_unavailable"})
+
+        route = ROUTES.get((method, host, path))
+        if route is not None:
+            return self.respond(*route(self, query, form))
+        if method == "GET" and host == "api.portone.io" and path.startswith("/identity-verifications/"):
+            return self.respond(*portone_verification(self, query, form, urllib.parse.unquote(path.rpartition("/")[2])))
+        return self.respond(404, {"error": "not_found", "path": f"/{host}{path}"})
+
+    def respond(self, status, data):
+        content = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def log_message(self, format, *args):
+        if self.server.verbosity > 1:
+            super().log_message(format, *args)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local fake of the Naver / Google / Kakao / PortOne endpoints used by accounts.utils. "
+        "Point the server at it with PROVIDER_URL_OVERRIDE=http://127.0.0.1:<port>. "
+        "Codes starting with 'invalid' fail the token exchange; PortOne ids starting with 'unverified' are not verified."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8900)
+        parser.add_argument("--delay", type=float, default=0.0, help="Seconds added to every response (timeout testing)")
+        parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests answered with 503 (retry testing)")
+
+    def handle(self, *args, **options):
+        handler = type("Handler", (FakeProviderHandler,), {"delay": options["delay"], "fail_rate": options["fail_rate"]})
+        server = ThreadingHTTPServer((options["host"], options["port"]), handler)
+        server.verbosity = options["verbosity"]
+        self.stdout.write(f"Fake providers on http://{options['host']}:{options['port']} (PROVIDER_URL_OVERRIDE)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,37 @@
+# accounts/management/commands/generate_jwt_key.py
+app_name = 'accounts'
+
+import os
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.keys import load_key
+
+
+class Command(BaseCommand):
+    help = "Write a new JWT signing key (PEM, mode 0600). Prepend it to JWT_PRIVATE_KEY_FILES to rotate."
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Private key path")
+        parser.add_argument("--algorithm", choices=("RS256", "EdDSA"), default="EdDSA")
+        parser.add_argument("--rsa-bits", type=int, default=2048)
+
+    def handle(self, *args, **options):
+        if os.path.exists(options["output"]):
+            raise CommandError(f"{options['output']} already exists")
+
+        if options["algorithm"] == "EdDSA":
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        else:
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=options["rsa_bits"])
+
+        data = private_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+        descriptor = os.open(options["output"], os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+
+        key = load_key(options["output"], options["algorithm"])
+        self.stdout.write(f"Wrote {options['output']} (kid {key.kid})")
@@ -0,0 +1,286 @@
+# accounts/management/commands/import_users.py
+app_name = 'accounts'
+
+import os
+import csv
+import sys
+import json
+import time
+import uuid
+import hashlib
+import itertools
+
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from accounts.models import User
+
+IMPORT_FIELDS = ("email", "name", "mobile", "username", "password", "birthday", "gender", "profile_image", "ci", "referral_code")
+UNIQUE_FIELDS = ("email", "mobile", "username", "ci_hash", "referral_code")
+
+Candidate = namedtuple("Candidate", ["line", "row", "user", "password", "generated"])
+
+
+def detect_format(path, format):
+    if format:
+        return format
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".csv", ".jsonl", ".ndjson"):
+        return "csv" if extension == ".csv" else "jsonl"
+    raise CommandError("Cannot tell the format from the file name; pass --format csv or --format jsonl")
+
+
+def read_rows(file, format):
+    """Yields (line number, row dict or None for an unreadable line)"""
+    if format == "csv":
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Import users from CSV or JSONL (one object per line). Columns: " + ", ".join(IMPORT_FIELDS) + ". "
+        "Rows are validated per batch with one set-based uniqueness query, passwords are hashed in a process pool "
+        "and users are inserted with bulk_create. Missing username / referral_code are generated as in UserManager.create_user; "
+        "rows without a password get an unusable one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or '-' for stdin (requires --format)")
+        parser.add_argument("--format", choices=["csv", "jsonl"])
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Password hashing processes (1 hashes inline)")
+        parser.add_argument("--hashed-passwords", action="store_true", help="The password column already holds Django password hashes (export_users)")
+        parser.add_argument("--rejects", help="Write rejected rows with their errors to this JSONL file")
+        parser.add_argument("--dry-run", action="store_true", help="Validate only")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = detect_format(path, options["format"]) if path != "-" else options["format"]
+        if format is None:
+            raise CommandError("--format is required when reading stdin")
+
+        self.options = options
+        self.seen = {field: set() for field in UNIQUE_FIELDS}     # Values taken by earlier rows of this import
+        self.rejected = Counter()           # "field: message" -> rows
+        self.rejected_rows = 0
+        self.timings = Counter()
+        self.imported = 0
+        self.rows = 0
+        self.rejects = open(options["rejects"], "w", encoding="utf-8") if options["rejects"] else None
+
+        hashing = not (options["hashed_passwords"] or options["dry_run"])
+        self.workers = max(options["workers"], 1)
+        # initializer: spawned workers (macOS, Windows) configure Django again; forked ones already have it
+        executor = ProcessPoolExecutor(self.workers, initializer=django.setup) if hashing and self.workers > 1 else None
+
+        file = sys.stdin if path == "-" else open(path, encoding="utf-8-sig", newline="")
+        start = time.perf_counter()
+        try:
+            for batch in batched(read_rows(file, format), options["batch_size"]):
+                self.import_batch(batch, executor)
+                if options["verbosity"] > 1:
+                    elapsed = time.perf_counter() - start
+                    self.stdout.write(f"{self.rows} rows, {self.imported} imported, {self.rows / elapsed:,.0f} rows/s")
+        finally:
+            if file is not sys.stdin:
+                file.close()
+            if executor is not None:
+                executor.shutdown()
+            if self.rejects is not None:
+                self.rejects.close()
+
+        elapsed = time.perf_counter() - start
+        action = "validated" if options["dry_run"] else "imported"
+        self.stdout.write(self.style.SUCCESS(
+            f"{self.rows} rows in {elapsed:.2f}s: {self.imported} {action}, {self.rejected_rows} rejected "
+            f"({self.rows / elapsed if elapsed else 0:,.0f} rows/s)"
+        ))
+        self.stdout.write(
+            f"validation {self.timings['validation']:.2f}s, hashing {self.timings['hashing']:.2f}s "
+            f"({self.workers if executor is not None else 1} process{'es' if executor is not None else ''}), insert {self.timings['insert']:.2f}s"
+        )
+        for reason, count in self.rejected.most_common():
+            self.stdout.write(f"  {reason}: {count}")
+
+    # Validation
+    def reject(self, line, row, errors):
+        self.rejected_rows += 1
+        for field, messages in errors.items():
+            for message in messages:
+                self.rejected[f"{field}: {message}"] += 1
+        if self.rejects is not None:
+            row = {key: value for key, value in (row or {}).items() if key != "password"}
+            self.rejects.write(json.dumps({"line": line, "errors": errors, "row": row}, ensure_ascii=False, default=str) + "\n")
+
+    def build_user(self, row):
+        if row is None:
+            return None, None, {"row": ["Not a JSON object."]}
+
+        values = {}
+        for field in IMPORT_FIELDS:
+            value = row.get(field)
+            if isinstance(value, str):
+                value = value.strip()
+            values[field] = None if value in (None, "") else str(value)
+
+        errors = {}
+        password = values.pop("password")
+        if self.options["hashed_passwords"] and password is not None and not password.startswith(UNUSABLE_PASSWORD_PREFIX):
+            try:
+                identify_hasher(password)
+            except ValueError:
+                errors["password"] = ["Not a recognized password hash."]
+
+        user = User(**{field: value for field, value in values.items() if value is not None})
+        user.email = User.objects.normalize_email(user.email)
+        try:
+            user.clean_fields(exclude=["password"])     # Required fields, lengths, email format, dates
+        except ValidationError as error:
+            errors.update(error.message_dict)
+        user.ci_hash = hashlib.sha256(user.ci.encode("utf-8")).hexdigest() if user.ci else None       # As User.save
+        return user, password, errors
+
+    def assign_codes(self, candidate):
+        # As UserManager.create_user: referral code = 8 hex chars, default username = "오리무새" + the same code
+        user = candidate.user
+        while True:
+            code = uuid.uuid4().hex[:8]
+            if code in self.seen["referral_code"] or ("username" in candidate.generated and f"오리무새{code}" in self.seen["username"]):
+                continue
+            if "referral_code" in candidate.generated:
+                user.referral_code = code
+                self.seen["referral_code"].add(code)
+            if "username" in candidate.generated:
+                user.username = f"오리무새{code}"
+                self.seen["username"].add(user.username)
+            return
+
+    def existing_values(self, users):
+        # One query for every unique value in the batch
+        query = Q()
+        for field in UNIQUE_FIELDS:
+            values = {getattr(user, field) for user in users} - {None, ""}
+            if values:
+                query |= Q(**{f"{field}__in": values})
+
+        existing = {field: set() for field in UNIQUE_FIELDS}
+        for values in User.objects.filter(query).values_list(*UNIQUE_FIELDS):
+            for field, value in zip(UNIQUE_FIELDS, values):
+                existing[field].add(value)
+        for values in existing.values():
+            values -= {None, ""}
+        return existing
+
+    def validate_batch(self, batch):
+        candidates = []
+        for line, row in batch:
+            user, password, errors = self.build_user(row)
+            if not errors:
+                duplicates = [field for field in UNIQUE_FIELDS if getattr(user, field) and getattr(user, field) in self.seen[field]]
+                errors = {field: ["Duplicate of an earlier row."] for field in duplicates}
+            if errors:
+                self.reject(line, row, errors)
+                continue
+
+            for field in UNIQUE_FIELDS:
+                if getattr(user, field):
+                    self.seen[field].add(getattr(user, field))
+            generated = {field for field in ("username", "referral_code") if not getattr(user, field)}
+            candidate = Candidate(line, row, user, password, generated)
+            if generated:
+                self.assign_codes(candidate)
+            candidates.append(candidate)
+
+        accepted = []
+        while candidates:
+            existing = self.existing_values([candidate.user for candidate in candidates])
+            retry = []
+            for candidate in candidates:
+                taken = {field for field in UNIQUE_FIELDS if getattr(candidate.user, field) in existing[field]}
+                if taken - candidate.generated:
+                    self.reject(candidate.line, candidate.row, {field: ["Already exists."] for field in sorted(taken - candidate.generated)})
+                elif taken:
+                    self.assign_codes(candidate)        # A generated code collided with an existing user: draw again
+                    retry.append(candidate)
+                else:
+                    accepted.append(candidate)
+            candidates = retry
+        return accepted
+
+    # Import
+    def hash_passwords(self, passwords, executor):
+        if self.options["hashed_passwords"]:
+            return [password or make_password(None) for password in passwords]
+        if executor is None:
+            return [make_password(password) for password in passwords]
+        chunksize = max(len(passwords) // (self.workers * 4), 1)
+        return list(executor.map(make_password, passwords, chunksize=chunksize))
+
+    def insert(self, candidates):
+        users = [candidate.user for candidate in candidates]
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=self.options["batch_size"])
+            return len(users)
+        except IntegrityError:
+            pass
+
+        # A concurrent signup took a value after the check: insert row by row and reject only the conflicting rows
+        inserted = 0
+        for candidate in candidates:
+            candidate.user.pk = None
+            candidate.user._state.adding = True
+            try:
+                with transaction.atomic():
+                    candidate.user.save()
+                inserted += 1
+            except IntegrityError as error:
+                self.reject(candidate.line, candidate.row, {"row": [str(error)]})
+        return inserted
+
+    def import_batch(self, batch, executor):
+        self.rows += len(batch)
+
+        start = time.perf_counter()
+        candidates = self.validate_batch(batch)
+        self.timings["validation"] += time.perf_counter() - start
+        if self.options["dry_run"]:
+            self.imported += len(candidates)
+            return
+        if not candidates:
+            return
+
+        start = time.perf_counter()
+        for candidate, password in zip(candidates, self.hash_passwords([candidate.password for candidate in candidates], executor)):
+            candidate.user.password = password
+        self.timings["hashing"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.imported += self.insert(candidates)
+        self.timings["insert"] += time.perf_counter() - start
@@ -4,13 +4,22 @@ app_name = "accounts"
 import uuid
 import hashlib
 
+from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.db import models
 from django.utils import timezone
 from django_cryptography.fields import encrypt
 
+from .hashing import hashing_pool
+
 class UserManager(BaseUserManager):
     def create_user(self, email, name, username=None, password=None, **extra_fields):
+        user = self.make_user(email, name, username=username, password=password, **extra_fields)
+        user.save(using=self._db)
+        return user
+
+    def make_user(self, email, name, username=None, password=None, **extra_fields):
+        """create_user without the INSERT: the password is hashed before the caller opens its transaction"""
         if not email:
             raise ValueError("Email is required.")
         if not name:
@@ -31,7 +40,6 @@ class UserManager(BaseUserManager):
             **extra_fields
         )
         user.set_password(password)
-        user.save(using=self._db)
         return user
     
     def create_superuser(self, email, name, username=None, password=None, **extra_fields):
@@ -98,6 +106,31 @@ class User(AbstractBaseUser):
             self.ci_hash = None
         super().save(*args, **kwargs)
 
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Users built from token claims (accounts.authentication) load their deferred fields from the per-process user cache
+        if getattr(self, "from_claims", False) and fields is not None and using is None and from_queryset is None:
+            from .authentication import user_cache
+            self.from_claims = False
+            cached = user_cache.get(self.pk)
+            for attname in self.get_deferred_fields():
+                setattr(self, attname, getattr(cached, attname))
+            return
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
+    # Password hashing runs in accounts.hashing.hashing_pool (bounded, off the request thread)
+    def set_password(self, raw_password):
+        self.password = hashing_pool.make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        is_correct, must_update = hashing_pool.verify_password(raw_password, self.password)
+        if is_correct and must_update:
+            # As AbstractBaseUser.check_password: re-encode with the current hasher / PASSWORD_HASH_ITERATIONS
+            self.set_password(raw_password)
+            self._password = None
+            self.save(update_fields=["password"])
+        return is_correct
+
     def __str__(self):
         return self.email
 
@@ -145,7 +178,7 @@ class Verification(models.Model):
         unique_together = ('type', 'target')
 
     def is_expired(self):
-        return timezone.now() > self.created_at + timezone.timedelta(minutes=5)
+        return timezone.now() > self.created_at + timezone.timedelta(seconds=settings.VERIFICATION_TTL)
 
     def __str__(self):
         return f"{self.type} - {self.target}"
\ No newline at end of file
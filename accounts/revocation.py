@@ -0,0 +1,140 @@
+# accounts/revocation.py
+app_name = 'accounts'
+
+import time
+import hashlib
+import threading
+
+from rest_framework_simplejwt.settings import api_settings
+
+from django.conf import settings
+from django.core.cache import cache
+
+from server.cache import make_key
+
+
+# Bloom Filter
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class BloomFilter:
+    """No false negatives; about 1% false positives with 10 bits per entry and 7 hashes"""
+
+    def __init__(self, bits, hashes=7):
+        self.bits = bits
+        self.hashes = hashes
+        self.data = bytearray((bits + 7) // 8)
+
+    def positions(self, item):
+        # Double hashing (Kirsch-Mitzenmacher) from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big") | 1
+        return [(first + index * second) % self.bits for index in range(self.hashes)]
+
+    def add(self, item):
+        for position in self.positions(item):
+            self.data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(self.data[position >> 3] & (1 << (position & 7)) for position in self.positions(item))
+
+
+# Denylist
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class TokenDenylist:
+    """
+    jti 거부 목록. 캐시(Redis)에 jti 별 키를 토큰 만료 시각까지만(TTL) 저장한다.
+    access 토큰은 매 요청마다 확인하므로, 폐기된 jti 를 만료 구간(window)별 로그에도 추가하고 각 프로세스가 이를 bloom filter 로 유지한다.
+    bloom filter 에 없으면 Redis 조회 없이 통과하고, 있으면 (오탐일 수 있으므로) Redis 키로 확인한다.
+    다른 프로세스의 폐기는 TOKEN_DENYLIST_SYNC_INTERVAL 초 이내에 반영된다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.windows = {}       # window -> [BloomFilter, applied sequence, synced_at]
+
+    def key(self, jti):
+        return make_key("token", "denied", jti)
+
+    def window_size(self):
+        return max(int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()), 1)
+
+    def window_keys(self, window):
+        return make_key("token", "revoked", window, "count"), lambda sequence: make_key("token", "revoked", window, sequence)
+
+    # Writes
+    def revoke(self, token):
+        """Returns False when the token has already expired (nothing to deny)"""
+        jti, expires_at = token[api_settings.JTI_CLAIM], token["exp"]
+        timeout = int(expires_at - time.time()) + 1
+        if timeout <= 1:
+            return False
+
+        cache.set(self.key(jti), 1, timeout)
+        if token.get(api_settings.TOKEN_TYPE_CLAIM) == "access":
+            self.publish(jti, expires_at)
+        return True
+
+    def claim(self, token):
+        """Atomically denies a refresh token on rotation. False: the token was already used (replay or concurrent refresh)"""
+        timeout = max(int(token["exp"] - time.time()) + 1, 1)
+        return cache.add(self.key(token[api_settings.JTI_CLAIM]), 1, timeout)
+
+    def publish(self, jti, expires_at):
+        # Append-only log per window: no read-modify-write of a shared filter, so concurrent revocations are never lost
+        window = int(expires_at) // self.window_size()
+        timeout = (window + 1) * self.window_size() - int(time.time()) + 1
+        count_key, entry_key = self.window_keys(window)
+        cache.add(count_key, 0, timeout)
+        try:
+            sequence = cache.incr(count_key)
+        except ValueError:      # Evicted between add and incr
+            cache.add(count_key, 0, timeout)
+            sequence = cache.incr(count_key)
+        cache.set(entry_key(sequence), jti, timeout)
+
+        with self.lock:
+            entry = self.windows.get(window)
+        if entry is not None:
+            entry[0].add(jti)       # Visible in this process immediately
+
+    # Reads
+    def is_revoked(self, token):
+        jti = token[api_settings.JTI_CLAIM]
+        if token.get(api_settings.TOKEN_TYPE_CLAIM) == "access" and jti not in self.bloom(token["exp"]):
+            return False
+        return cache.get(self.key(jti)) is not None
+
+    def bloom(self, expires_at):
+        window = int(expires_at) // self.window_size()
+        with self.lock:
+            entry = self.windows.get(window)
+            if entry is None:
+                entry = self.windows[window] = [BloomFilter(settings.TOKEN_DENYLIST_BLOOM_BITS), 0, 0.0]
+                self.expire(window)
+
+        if time.monotonic() - entry[2] >= settings.TOKEN_DENYLIST_SYNC_INTERVAL:
+            self.sync(window, entry)
+        return entry[0]
+
+    def sync(self, window, entry):
+        entry[2] = time.monotonic()
+        count_key, entry_key = self.window_keys(window)
+        count, applied = cache.get(count_key) or 0, entry[1]
+        if count <= applied:
+            return
+
+        keys = [entry_key(sequence) for sequence in range(applied + 1, count + 1)]
+        found = cache.get_many(keys)
+        missing = [index for index, key in enumerate(keys) if key not in found]
+        with self.lock:
+            for jti in found.values():
+                entry[0].add(jti)
+            # An entry counted but not written yet is fetched again next time (adding twice is harmless)
+            entry[1] = max(entry[1], applied + (missing[0] if missing else len(keys)))
+
+    def expire(self, current):
+        # Tokens of earlier windows have expired; keep the current one and later ones (longer lifetimes after a settings change)
+        for window in [window for window in self.windows if window < current - 1]:
+            del self.windows[window]
+
+
+denylist = TokenDenylist()
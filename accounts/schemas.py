@@ -47,6 +47,10 @@ class UpdateAccountRequestSerializer(serializers.Serializer):
     password = serializers.CharField(write_only=True, required=False, help_text="새 비밀번호")
 
 
+class LogoutRequestSerializer(serializers.Serializer):
+    refresh_token = serializers.CharField(required=False, help_text="함께 폐기할 리프레시 토큰")
+
+
 class CheckEmailRequestSerializer(serializers.Serializer):
     email = serializers.EmailField(help_text="확인할 이메일 주소")
 
@@ -219,7 +223,7 @@ class AccountSchema:
     def token_refresh():
         return {
             'summary': "토큰 갱신",
-            'description': "리프레시 토큰을 사용하여 액세스 토큰을 갱신합니다.",
+            'description': "리프레시 토큰을 사용하여 액세스 토큰을 갱신합니다. 리프레시 토큰은 1회용이며 새 리프레시 토큰이 함께 발급됩니다.",
             'request': TokenRefreshSerializer,
             'responses': {
                 200: SuccessResponseSerializer,
@@ -241,6 +245,23 @@ class AccountSchema:
             ]
         }
 
+    @staticmethod
+    def logout():
+        return {
+            'summary': "로그아웃",
+            'description': "현재 액세스 토큰과 (전달된 경우) 리프레시 토큰을 만료 시각까지 폐기합니다.",
+            'request': LogoutRequestSerializer,
+            'responses': {
+                200: SuccessResponseSerializer,
+                401: ErrorResponseSerializer,
+            },
+            'examples': [
+                CommonExamples.success_example(
+                    message="로그아웃 성공"
+                ),
+            ]
+        }
+
     @staticmethod
     def get_account_info():
         return {
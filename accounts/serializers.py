@@ -3,8 +3,38 @@ app_name = "accounts"
 
 from rest_framework import serializers
 
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from users.utils import ReferralHandler
+
 from .models import User, UserSocialAccount, Verification
 
+# Unique User columns a sign-up can collide on, with their error messages
+UNIQUE_ERRORS = {
+    "email": "Email already exists.",
+    "mobile": "Mobile number already exists.",
+    "username": "Username already exists.",
+    "ci_hash": "Identity already verified by another account.",
+}
+
+
+def unique_conflicts(user):
+    # One query, only after an INSERT failed: which of the user's unique values are taken
+    query = Q()
+    for field in UNIQUE_ERRORS:
+        if getattr(user, field):
+            query |= Q(**{field: getattr(user, field)})
+    if not query:
+        return {}
+
+    errors = {}
+    for values in User.objects.filter(query).values_list(*UNIQUE_ERRORS):
+        for field, value in zip(UNIQUE_ERRORS, values):
+            if value and value == getattr(user, field):
+                errors[field] = [UNIQUE_ERRORS[field]]
+    return errors
+
 # User
 # <-------------------------------------------------------------------------------------------------------------------------------->
 class UserSerializer(serializers.ModelSerializer):
@@ -67,26 +97,51 @@ class UserSerializer(serializers.ModelSerializer):
         return value
 
 
+# Read-only representation with the fields built once per process (a ModelSerializer rebuilds them on every instantiation)
+user_representation = UserSerializer().to_representation
+
+
 class SignUpSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['email', 'mobile', 'name', 'username', 'password']
         extra_kwargs = {
             'password': {'write_only': True},
+            # Uniqueness is enforced by the INSERT (IntegrityError -> unique_conflicts), not by a query per field
+            'email': {'validators': []},
+            'mobile': {'validators': []},
+            'username': {'validators': []},
         }
 
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("Email already exists.")
-        return value
-
     def validate_mobile(self, value):
-        if value and value.strip() and User.objects.filter(mobile=value).exists():
-            raise serializers.ValidationError("Mobile number already exists.")
-        return value
+        # Blank is stored as NULL: '' would collide on the unique column
+        if not value:
+            return None
+        return value.strip() or None
 
     def create(self, validated_data):
-        return User.objects.create_user(**validated_data)
+        """
+        One INSERT for the user and its related rows in one transaction. save(referree=...) also creates the referral,
+        save(ci=..., ...) stores identity verification fields. Unique collisions (including races) raise ValidationError.
+        """
+        referree = validated_data.pop('referree', None)
+        user = User.objects.make_user(**self.user_data(validated_data))        # Password hashed outside the transaction
+
+        try:
+            with transaction.atomic():
+                user.save(force_insert=True)
+                self.create_related(user, validated_data)
+                if referree is not None:
+                    ReferralHandler(user, referree).create()
+        except IntegrityError:
+            raise serializers.ValidationError(unique_conflicts(user) or {"non_field_errors": ["Account could not be created. Please try again."]})
+        return user
+
+    def user_data(self, validated_data):
+        return validated_data
+
+    def create_related(self, user, validated_data):
+        pass
 
 
 # Verification
@@ -110,16 +165,12 @@ class SocialSignUpSerializer(SignUpSerializer):
     class Meta(SignUpSerializer.Meta):
         fields = SignUpSerializer.Meta.fields + ['provider', 'provider_user_id']
 
-    def create(self, validated_data):
-        provider = validated_data.pop('provider')
-        provider_user_id = validated_data.pop('provider_user_id')
-
-        user = super().create(validated_data)
+    def user_data(self, validated_data):
+        return {key: value for key, value in validated_data.items() if key not in ('provider', 'provider_user_id')}
 
+    def create_related(self, user, validated_data):
         UserSocialAccount.objects.create(
             user=user,
-            provider=provider,
-            provider_user_id=provider_user_id
-        )
-
-        return user
\ No newline at end of file
+            provider=validated_data['provider'],
+            provider_user_id=validated_data['provider_user_id']
+        )
\ No newline at end of file
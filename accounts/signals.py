@@ -0,0 +1,17 @@
+# accounts/signals.py
+app_name = 'accounts'
+
+from django.db.models.signals import post_save, post_delete
+
+from .authentication import invalidate_social_account, invalidate_user
+from .models import User, UserSocialAccount
+
+# User Cache Invalidation
+# <-------------------------------------------------------------------------------------------------------------------------------->
+post_save.connect(invalidate_user, sender=User, dispatch_uid="invalidate_accounts_user_on_save")
+post_delete.connect(invalidate_user, sender=User, dispatch_uid="invalidate_accounts_user_on_delete")
+
+# Social Account Mapping Invalidation
+# <-------------------------------------------------------------------------------------------------------------------------------->
+post_save.connect(invalidate_social_account, sender=UserSocialAccount, dispatch_uid="invalidate_accounts_social_account_on_save")
+post_delete.connect(invalidate_social_account, sender=UserSocialAccount, dispatch_uid="invalidate_accounts_social_account_on_delete")
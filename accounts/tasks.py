@@ -1,31 +1,129 @@
 # accounts/tasks.py
 app_name = "accounts"
 
+import time
+import atexit
+import logging
+import smtplib
+import threading
+
 from celery import shared_task
 
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.conf import settings
+from django.utils import timezone
+
+from server.mail import pool, delivery_latency, EmailTemplate
+
+from .models import Verification
+
+logger = logging.getLogger(__name__)
+
+# Retry SMTP and network failures with exponential backoff (jittered, capped at 5 minutes)
+RETRY_OPTIONS = {
+    "autoretry_for": (smtplib.SMTPException, OSError),
+    "retry_backoff": True,
+    "retry_backoff_max": 300,
+    "retry_jitter": True,
+    "max_retries": 5,
+    "acks_late": True,     # Idempotent enough: a redelivery re-sends the same code
+}
 
-@shared_task
-def send_verification_email(email, code):
-    subject = "Your Verification Code"
 
-    html_content = render_to_string("verification_email.html", {"code": code})
+# Rendered and MIME-encoded once per worker; each send only substitutes the recipient and code
+verification_email = EmailTemplate(
+    subject="Your Verification Code",
+    from_email="VAHANA <noreply@vahana.kr>",
+    html_template="verification_email.html",
+    text="Your verification code is: {code}",     # fallback text (메일 클라이언트가 HTML 지원 안할 때)
+    fields=("code",),
+)
 
-    # fallback text (메일 클라이언트가 HTML 지원 안할 때)
-    text_content = f"Your verification code is: {code}"
 
-    msg = EmailMultiAlternatives(
-        subject=subject,
-        body=text_content,
-        from_email="VAHANA <noreply@vahana.kr>",
-        to=[email],
-    )
-    msg.attach_alternative(html_content, "text/html")
-    msg.send(fail_silently=True)
+def build_verification_email(email, code):
+    return verification_email.build(email, code=code)
 
+
+@shared_task(**RETRY_OPTIONS)
+def send_verification_email(email, code, requested_at=None):
+    pool.send_messages([build_verification_email(email, code)])
+    if requested_at is not None:
+        delivery_latency.observe((time.time() - requested_at) * 1000)
     return True
 
-@shared_task
-def send_verification_sms(mobile, code):
+
+@shared_task(**RETRY_OPTIONS)
+def send_verification_emails(items, requested_at=None):
+    """[(email, code), ...] over one pooled SMTP connection, EMAIL_BATCH_SIZE messages per send. A retry re-sends the same codes."""
+    sent = 0
+    for start in range(0, len(items), settings.EMAIL_BATCH_SIZE):
+        sent += pool.send_messages([build_verification_email(email, code) for email, code in items[start:start + settings.EMAIL_BATCH_SIZE]])
+    if requested_at is not None:
+        delivery_latency.observe((time.time() - requested_at) * 1000)
+    return sent
+
+
+@shared_task(acks_late=True)
+def send_verification_sms(mobile, code, requested_at=None):
     pass
+
+
+@shared_task
+def sweep_expired_verifications():
+    # DatabaseVerificationBackend rows past VERIFICATION_TTL (the cache backend expires natively)
+    expired_before = timezone.now() - timezone.timedelta(seconds=settings.VERIFICATION_TTL)
+    deleted, _ = Verification.objects.filter(created_at__lt=expired_before).delete()
+    return deleted
+
+
+# Verification Mail Queue
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class VerificationMailQueue:
+    """
+    인증 메일마다 task 를 만들지 않고 웹 프로세스 메모리에 모아, EMAIL_BATCH_SIZE 개가 차거나 EMAIL_BATCH_INTERVAL 초가 지나면
+    send_verification_emails 한 번으로 보낸다. worker 는 묶음 전체를 하나의 SMTP 연결로 발송한다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = []
+        self.requested_at = None        # Oldest pending mail (delivery latency)
+        self.thread = None
+
+    def add(self, email, code):
+        with self.lock:
+            if not self.pending:
+                self.requested_at = time.time()
+            self.pending.append((email, code))
+            full = len(self.pending) >= settings.EMAIL_BATCH_SIZE
+        if full or settings.EMAIL_BATCH_INTERVAL <= 0:
+            self.flush()
+        else:
+            self.start()
+
+    def start(self):
+        # Started lazily so that each forked worker runs its own flusher
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="verification-mail-flusher", daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            time.sleep(settings.EMAIL_BATCH_INTERVAL)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to enqueue verification emails")
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, []
+            requested_at = self.requested_at
+        if not pending:
+            return 0
+        send_verification_emails.delay(pending, requested_at=requested_at)
+        return len(pending)
+
+
+verification_mail_queue = VerificationMailQueue()
+atexit.register(verification_mail_queue.flush)
@@ -1,6 +1,774 @@
 # accounts/tests.py
 app_name = 'accounts'
 
-from django.test import TestCase
+import io
+import sys
+import json
+import contextlib
+import smtplib
+import threading
+import tempfile
+import subprocess
 
-# Create your tests here.
+from pathlib import Path
+
+from http.server import ThreadingHTTPServer
+
+from unittest import mock
+
+import jwt
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from rest_framework.exceptions import ValidationError
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.settings import api_settings
+
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection, connections
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from users.models import Referral
+
+from server.http import ProviderClient, ProviderError
+from server.mail import pool
+
+from .models import User, UserSocialAccount, Verification
+from .serializers import SignUpSerializer
+from .utils import KakaoResponse
+from .tasks import RETRY_OPTIONS, VerificationMailQueue, send_verification_email, send_verification_emails, sweep_expired_verifications
+from .access import LastAccessTracker
+from .hashing import PasswordHashingPool, hash_latency, hash_rejected
+from .tokens import AccessToken, RefreshToken, get_token, get_token_backend, token_service
+from .revocation import BloomFilter, TokenDenylist
+from .authentication import FreshJWTAuthentication, StatelessJWTAuthentication, user_cache
+from .keys import get_keyring
+from .jwks import JWKSVerifier
+from .verification import CacheVerificationBackend, DatabaseVerificationBackend, VerificationError, VerificationExpired, VerificationAttemptsExceeded
+from .verification import get_verification_backend
+from .management.commands.fake_providers import FakeProviderHandler
+from .management.commands.import_users import Command as ImportUsersCommand
+
+# Hash inline with a cheap work factor: the tests exercise the flows, not PBKDF2
+FAST_HASHING = {"PASSWORD_HASHING_WORKERS": 0, "PASSWORD_HASH_ITERATIONS": 1000}
+
+
+# Verification Email
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", CELERY_TASK_ALWAYS_EAGER=True, EMAIL_BATCH_INTERVAL=0, **FAST_HASHING)
+class VerificationEmailTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        pool.close()
+        self.user = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+
+    def test_send_code_emails_the_issued_code(self):
+        response = self.client.post("/accounts/send-code", {"type": "email", "target": self.user.email}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 1)
+        message = mail.outbox[0]
+        self.assertEqual(message.to, [self.user.email])
+        code = message.body.rpartition(": ")[2]
+        self.assertEqual(len(code), 6)
+        self.assertIn(code.encode(), message.message().as_bytes())       # The prepared HTML part carries the same code
+        get_verification_backend().check(self.user.email, code)
+
+    def test_repeated_request_is_not_resent(self):
+        for _ in range(3):
+            response = self.client.post("/accounts/send-code", {"type": "email", "target": self.user.email}, content_type="application/json")
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_burst_reuses_one_connection(self):
+        with mock.patch("server.mail.get_connection", wraps=mail.get_connection) as get_connection:
+            for index in range(5):
+                send_verification_email(f"user{index}@example.com", f"{index:06d}")
+        self.assertEqual(get_connection.call_count, 1)
+        self.assertEqual([message.to for message in mail.outbox], [[f"user{index}@example.com"] for index in range(5)])
+
+    @override_settings(EMAIL_BATCH_SIZE=3, EMAIL_BATCH_INTERVAL=60)
+    def test_queue_enqueues_one_task_per_batch(self):
+        queue = VerificationMailQueue()
+        with mock.patch.object(queue, "start"), mock.patch.object(send_verification_emails, "delay", wraps=send_verification_emails.delay) as delay:
+            for index in range(4):
+                queue.add(f"user{index}@example.com", f"{index:06d}")
+            self.assertEqual(delay.call_count, 1)           # The first three (EMAIL_BATCH_SIZE)
+            self.assertEqual(len(mail.outbox), 3)
+            self.assertEqual(queue.flush(), 1)              # The rest, as the flusher thread does every EMAIL_BATCH_INTERVAL
+            self.assertEqual(queue.flush(), 0)
+        self.assertEqual(delay.call_count, 2)
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), [f"user{index}@example.com" for index in range(4)])
+
+    @override_settings(EMAIL_BATCH_SIZE=2)
+    def test_batch_task_sends_chunks_over_one_connection(self):
+        items = [(f"user{index}@example.com", f"{index:06d}") for index in range(5)]
+        with mock.patch("server.mail.get_connection", wraps=mail.get_connection) as get_connection, \
+                mock.patch.object(pool, "send_messages", wraps=pool.send_messages) as send_messages:
+            self.assertEqual(send_verification_emails(items), 5)
+        self.assertEqual([len(call.args[0]) for call in send_messages.call_args_list], [2, 2, 1])
+        self.assertEqual(get_connection.call_count, 1)
+        self.assertEqual([(message.to[0], message.body.rpartition(": ")[2]) for message in mail.outbox], items)
+
+    def test_smtp_errors_are_retried(self):
+        self.assertTrue(RETRY_OPTIONS["retry_backoff"] and RETRY_OPTIONS["retry_jitter"])
+        with mock.patch.object(pool, "send_messages", side_effect=[smtplib.SMTPServerDisconnected("gone"), OSError("reset"), 1]) as send_messages:
+            result = send_verification_emails.apply(args=[[("user@example.com", "123456")]])
+        self.assertTrue(result.successful())
+        self.assertEqual(result.get(), 1)
+        self.assertEqual(send_messages.call_count, 3)
+
+    def test_smtp_errors_give_up_after_max_retries(self):
+        with mock.patch.object(pool, "send_messages", side_effect=smtplib.SMTPException("unavailable")) as send_messages:
+            result = send_verification_emails.apply(args=[[("user@example.com", "123456")]])
+        self.assertTrue(result.failed())
+        self.assertIsInstance(result.result, smtplib.SMTPException)
+        self.assertEqual(send_messages.call_count, RETRY_OPTIONS["max_retries"] + 1)
+
+
+# Verification Backends
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(VERIFICATION_MAX_ATTEMPTS=3, VERIFICATION_TTL=300)
+class VerificationBackendTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def assert_attempt_limit(self, backend):
+        backend.issue("email", "member@example.com", "123456")
+        for _ in range(3):
+            with self.assertRaises(VerificationError) as raised:
+                backend.check("member@example.com", "000000")
+            self.assertNotIsInstance(raised.exception, VerificationAttemptsExceeded)
+        with self.assertRaises(VerificationAttemptsExceeded):
+            backend.check("member@example.com", "000000")
+
+        # The code is discarded: even the right code fails until a new one is issued
+        with self.assertRaises(VerificationError):
+            backend.check("member@example.com", "123456")
+        backend.issue("email", "member@example.com", "654321")
+        self.assertEqual(backend.check("member@example.com", "654321", consume=True).code, "654321")
+
+    def test_cache_backend_discards_the_code_after_max_attempts(self):
+        self.assert_attempt_limit(CacheVerificationBackend())
+
+    def test_database_backend_discards_the_code_after_max_attempts(self):
+        self.assert_attempt_limit(DatabaseVerificationBackend())
+
+    def test_success_resets_the_attempt_count(self):
+        backend = CacheVerificationBackend()
+        backend.issue("email", "member@example.com", "123456")
+        for _ in range(3):
+            with self.assertRaises(VerificationError):
+                backend.check("member@example.com", "000000")
+            backend.check("member@example.com", "123456")
+
+    def test_sweep_deletes_only_expired_rows(self):
+        backend = DatabaseVerificationBackend()
+        backend.issue("email", "old@example.com", "123456")
+        backend.issue("email", "new@example.com", "654321")
+        Verification.objects.filter(target="old@example.com").update(created_at=timezone.now() - timezone.timedelta(seconds=301))
+
+        with self.assertRaises(VerificationExpired):
+            backend.check("old@example.com", "123456")
+        self.assertEqual(sweep_expired_verifications(), 1)
+        self.assertEqual(list(Verification.objects.values_list("target", flat=True)), ["new@example.com"])
+
+
+# Last Access
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(LAST_ACCESS_FLUSH_INTERVAL=60, LAST_ACCESS_GRANULARITY=300, **FAST_HASHING)
+class LastAccessTrackerTests(TestCase):
+    def setUp(self):
+        self.users = [User.objects.create_user(email=f"user{index}@example.com", name="Member", password="password-1234") for index in range(3)]
+        self.tracker = LastAccessTracker()
+
+    def test_touches_flush_as_one_bulk_update(self):
+        with mock.patch.object(self.tracker, "start"), self.assertNumQueries(0):
+            for user in self.users + self.users[:1]:
+                self.tracker.touch(user)
+        pending = dict(self.tracker.pending)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.tracker.flush(), 3)
+        updates = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(dict(User.objects.values_list("pk", "last_access")), pending)
+        self.assertEqual(self.tracker.flush(), 0)
+
+    def test_recent_access_is_not_rewritten(self):
+        user = self.users[0]
+        with mock.patch.object(self.tracker, "start"):
+            self.assertTrue(self.tracker.touch(user))
+            self.assertFalse(self.tracker.touch(user))      # Within LAST_ACCESS_GRANULARITY
+        self.assertEqual(self.tracker.flush(), 1)
+
+
+# Tokens
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(LAST_ACCESS_FLUSH_INTERVAL=0, **FAST_HASHING)
+class TokenTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+        response = self.client.post("/accounts", {"email": self.user.email, "password": "password-1234"}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.token = response.json()["data"]["token"]
+
+    def refresh(self, refresh_token):
+        return self.client.post("/accounts/refresh", {"refresh_token": refresh_token}, content_type="application/json")
+
+    def test_refresh_rotates_and_rejects_replay(self):
+        response = self.refresh(self.token["refresh_token"])
+        self.assertEqual(response.status_code, 200)
+        rotated = response.json()["data"]["token"]["refresh_token"]
+        self.assertNotEqual(rotated, self.token["refresh_token"])
+
+        self.assertEqual(self.refresh(self.token["refresh_token"]).status_code, 401)
+        self.assertEqual(self.refresh(rotated).status_code, 200)
+
+    def test_concurrent_refreshes_only_one_succeeds(self):
+        user_cache.get(self.user.pk)        # Warm: the request threads use their own (empty) test database connections
+        barrier, statuses = threading.Barrier(2), []
+
+        def refresh():
+            try:
+                barrier.wait()
+                statuses.append(self.refresh(self.token["refresh_token"]).status_code)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=refresh) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(statuses), [200, 401])
+
+    def token_without_user(self, value=None):
+        refresh = RefreshToken.for_user(self.user)
+        if value is None:
+            del refresh[api_settings.USER_ID_CLAIM]
+        else:
+            refresh[api_settings.USER_ID_CLAIM] = value
+        return str(refresh)
+
+    def test_unrecognizable_user_claim_is_unauthorized(self):
+        self.assertEqual(self.refresh(self.token_without_user()).status_code, 401)
+        self.assertEqual(self.refresh(self.token_without_user("not-a-number")).status_code, 401)
+
+        response = self.client.post(
+            "/accounts/logout", {"refresh_token": self.token_without_user()},
+            content_type="application/json", HTTP_AUTHORIZATION=f"Bearer {self.token['access_token']}",
+        )
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(TOKEN_DENYLIST_SYNC_INTERVAL=0)
+    def test_logout_denies_access_token(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.token['access_token']}"}
+        self.assertEqual(self.client.get("/accounts", **headers).status_code, 200)
+
+        response = self.client.post("/accounts/logout", {"refresh_token": self.token["refresh_token"]}, content_type="application/json", **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get("/accounts", **headers).status_code, 401)
+        self.assertEqual(self.refresh(self.token["refresh_token"]).status_code, 401)
+
+        # Another process: a new denylist learns the revocation from the shared window log
+        other = TokenDenylist()
+        self.assertTrue(other.is_revoked(AccessToken(self.token["access_token"], verify=False)))
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(10 * 2000)
+        added = [f"jti-{index}" for index in range(2000)]
+        for jti in added:
+            bloom.add(jti)
+        self.assertTrue(all(jti in bloom for jti in added))
+        false_positives = sum(f"other-{index}" in bloom for index in range(2000))
+        self.assertLess(false_positives, 100)      # ~1% expected
+
+
+# Token Service
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def write_ed25519_key(directory, name):
+    path = Path(directory) / f"{name}.pem"
+    path.write_bytes(ed25519.Ed25519PrivateKey.generate().private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ))
+    return str(path)
+
+
+@contextlib.contextmanager
+def eddsa_settings(private_key_files, public_key_files=()):
+    # simplejwt rebinds its api_settings on a SIMPLE_JWT override, which modules that imported it never see: patch the shared object.
+    # Changing the key files resets the keyring, token backend and TokenService on enter and again on exit.
+    with override_settings(JWT_PRIVATE_KEY_FILES=list(private_key_files), JWT_PUBLIC_KEY_FILES=list(public_key_files)):
+        with mock.patch.object(api_settings, "ALGORITHM", "EdDSA"):
+            yield
+
+
+@override_settings(**FAST_HASHING)
+class TokenServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+        self.addCleanup(token_service.reset)
+
+    def assert_same_claims(self, token, reference, token_type):
+        self.assertEqual(set(token), set(reference.payload))
+        self.assertEqual(token[api_settings.TOKEN_TYPE_CLAIM], token_type)
+        self.assertEqual(token["exp"] - token["iat"], reference["exp"] - reference["iat"])
+        for claim in set(token) - {"exp", "iat", api_settings.JTI_CLAIM}:
+            self.assertEqual(token[claim], reference[claim], claim)
+
+    def test_hmac_fast_path_matches_simplejwt(self):
+        access, refresh, expires_in = token_service.pair(self.user)
+        self.assertIs(token_service.prepared, True)
+
+        backend = TokenBackend(api_settings.ALGORITHM, api_settings.SIGNING_KEY)       # Plain simplejwt, no keyring
+        reference = get_token(self.user)
+        self.assert_same_claims(backend.decode(access), reference.access_token, "access")
+        self.assert_same_claims(backend.decode(refresh), reference, "refresh")
+        self.assertEqual(expires_in, api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+        self.assertNotEqual(backend.decode(access)["jti"], backend.decode(refresh)["jti"])
+
+        # Accepted by the token classes and the authenticator
+        self.assertEqual(RefreshToken(refresh)[api_settings.USER_ID_CLAIM], str(self.user.pk))
+        self.assertEqual(StatelessJWTAuthentication().get_validated_token(access.encode())["token_type"], "access")
+
+    def test_asymmetric_keys_use_simplejwt(self):
+        with tempfile.TemporaryDirectory() as directory, eddsa_settings([write_ed25519_key(directory, "active")]):
+            access, refresh, expires_in = token_service.pair(self.user)
+            self.assertIs(token_service.prepared, False)
+
+            reference = get_token(self.user)
+            for token, expected, token_type in ((access, reference.access_token, "access"), (refresh, reference, "refresh")):
+                self.assertEqual(jwt.get_unverified_header(token)["kid"], get_keyring().active.kid)
+                self.assert_same_claims(get_token_backend().decode(token), expected, token_type)
+            self.assertEqual(expires_in, api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+# Key Rotation
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(**FAST_HASHING)
+class KeyRotationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        user_cache.clear()
+        self.user = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.previous_key = write_ed25519_key(directory.name, "previous")
+        self.current_key = write_ed25519_key(directory.name, "current")
+
+    def published(self):
+        response = self.client.get("/.well-known/jwks.json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def verifier(self, jwks):
+        verifier = JWKSVerifier("https://api.example.com/.well-known/jwks.json")
+        verifier.fetch = lambda: ({jwk["kid"]: jwt.PyJWK(jwk) for jwk in jwks["keys"]}, 300)
+        return verifier
+
+    def test_rotation(self):
+        with eddsa_settings([self.previous_key]):
+            previous_kid = get_keyring().active.kid
+            old_access, old_refresh, _ = token_service.pair(self.user)
+
+        # Rotated: the new key signs, the previous one is still published for verification
+        with eddsa_settings([self.current_key], [self.previous_key]):
+            current_kid = get_keyring().active.kid
+            access, _, _ = token_service.pair(self.user)
+            self.assertEqual(jwt.get_unverified_header(access)["kid"], current_kid)
+            self.assertNotEqual(current_kid, previous_kid)
+
+            jwks = self.published()
+            self.assertEqual([jwk["kid"] for jwk in jwks["keys"]], [current_kid, previous_kid])
+            self.assertNotIn("d", jwks["keys"][1])      # Public members only
+            for token in (old_access, access):
+                self.assertEqual(StatelessJWTAuthentication().get_validated_token(token.encode())[api_settings.USER_ID_CLAIM], str(self.user.pk))
+                self.assertEqual(self.verifier(jwks).verify(token)[api_settings.USER_ID_CLAIM], str(self.user.pk))
+            self.assertEqual(RefreshToken(old_refresh)[api_settings.USER_ID_CLAIM], str(self.user.pk))
+
+        # Retired: tokens signed with the previous key fail everywhere
+        with eddsa_settings([self.current_key]):
+            jwks = self.published()
+            self.assertEqual([jwk["kid"] for jwk in jwks["keys"]], [current_kid])
+            self.assertEqual(StatelessJWTAuthentication().get_validated_token(access.encode())[api_settings.USER_ID_CLAIM], str(self.user.pk))
+            with self.assertRaises(InvalidToken):
+                StatelessJWTAuthentication().get_validated_token(old_access.encode())
+            with self.assertRaises(TokenError):
+                RefreshToken(old_refresh)
+            with self.assertRaises(jwt.InvalidTokenError):
+                self.verifier(jwks).verify(old_access)
+
+    def test_unknown_kid_is_rejected(self):
+        with eddsa_settings([self.current_key]):
+            access, _, _ = token_service.pair(self.user)
+            forged = jwt.encode(
+                jwt.decode(access, options={"verify_signature": False}),
+                ed25519.Ed25519PrivateKey.generate(), algorithm="EdDSA", headers={"kid": "unknown"},
+            )
+            with self.assertRaises(InvalidToken):
+                StatelessJWTAuthentication().get_validated_token(forged.encode())
+
+    def test_jwks_etag_changes_with_the_key_set(self):
+        with eddsa_settings([self.previous_key]):
+            etag = self.client.get("/.well-known/jwks.json")["ETag"]
+            self.assertEqual(self.client.get("/.well-known/jwks.json", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with eddsa_settings([self.current_key], [self.previous_key]):
+            response = self.client.get("/.well-known/jwks.json", HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response["ETag"], etag)
+
+
+# Authentication
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(**FAST_HASHING)
+class AuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        user_cache.clear()
+        self.user = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+        self.access_token = token_service.pair(self.user)[0]
+
+    def authenticate(self, authentication_class, token=None):
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token or self.access_token}")
+        user, validated_token = authentication_class().authenticate(request)
+        return user
+
+    def test_current_token_authenticates_without_queries(self):
+        with self.assertNumQueries(0):
+            user = self.authenticate(StatelessJWTAuthentication)
+        self.assertEqual((user.pk, user.is_active, user.is_staff), (self.user.pk, True, False))
+
+        # Other fields are loaded once per process (user_cache), not per request
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, self.user.email)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate(StatelessJWTAuthentication).email, self.user.email)
+
+    def test_deactivation_rejects_issued_tokens(self):
+        self.user.is_active = False
+        self.user.save()        # Bumps the user version: the token's claims are no longer trusted
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(StatelessJWTAuthentication)
+
+    def test_saved_user_falls_back_to_the_current_row(self):
+        self.authenticate(StatelessJWTAuthentication).email      # Cached under the current version
+        self.user.set_password("password-5678")
+        self.user.is_staff = True
+        self.user.save()
+
+        with self.assertNumQueries(1):
+            user = self.authenticate(StatelessJWTAuthentication)
+        self.assertFalse(getattr(user, "from_claims", False))
+        self.assertTrue(user.is_staff)                              # Not the token's stale claim
+        self.assertEqual(user.password, self.user.password)
+
+        # A token issued after the change carries the new version again
+        with self.assertNumQueries(0):
+            self.assertTrue(self.authenticate(StatelessJWTAuthentication, token_service.pair(self.user)[0]).is_staff)
+
+    def test_fresh_authentication_reads_the_database(self):
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                user = self.authenticate(FreshJWTAuthentication)
+            self.assertEqual(user.email, self.user.email)
+
+
+# Password Hashing
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(PASSWORD_HASHING_CONCURRENCY=1, PASSWORD_HASHING_WAIT=0.05, **FAST_HASHING)
+class PasswordHashingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+        self.pool = PasswordHashingPool()
+        patcher = mock.patch("accounts.models.hashing_pool", self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def login(self):
+        return self.client.post("/accounts", {"email": self.user.email, "password": "password-1234"}, content_type="application/json")
+
+    def test_saturated_pool_answers_503(self):
+        slots = self.pool.get_slots()
+        self.assertTrue(slots.acquire(blocking=False))      # Another login holds the only slot
+        try:
+            response = self.login()
+        finally:
+            slots.release()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+        self.assertEqual(hash_rejected.value(), 1)
+
+        self.assertEqual(self.login().status_code, 200)     # The slot is free again
+
+    def test_latency_is_recorded_in_process(self):
+        hash_latency.clear()
+        with mock.patch("server.metrics.cache") as metrics_cache:
+            self.assertEqual(self.login().status_code, 200)
+        metrics_cache.incr.assert_not_called()
+        metrics_cache.add.assert_not_called()
+        self.assertEqual(hash_latency.snapshot()["count"], 1)
+
+
+# Providers
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class RecordingHandler(FakeProviderHandler):
+    requests = []
+
+    def handle_request(self, method):
+        self.requests.append((method, self.path.partition("?")[0]))
+        super().handle_request(method)
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        pass        # A client that timed out has closed the connection before the delayed response
+
+
+class FakeProviderTestCase(TestCase):
+    """Runs FakeProviderHandler on an ephemeral port and points every ProviderClient at it (PROVIDER_URL_OVERRIDE)"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = QuietHTTPServer(("127.0.0.1", 0), RecordingHandler)
+        cls.server.verbosity = 0
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.override = override_settings(PROVIDER_URL_OVERRIDE=f"http://127.0.0.1:{cls.server.server_address[1]}")
+        cls.override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.override.disable()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        RecordingHandler.requests.clear()
+        self.addCleanup(setattr, RecordingHandler, "fail_rate", 0.0)
+        self.addCleanup(setattr, RecordingHandler, "delay", 0.0)
+
+
+@override_settings(PROVIDER_RETRIES=2, PROVIDER_RETRY_BACKOFF=0, **FAST_HASHING)
+class ProviderTests(FakeProviderTestCase):
+    def test_get_is_retried_on_503(self):
+        RecordingHandler.fail_rate = 1.0
+        response = ProviderClient("test").get("https://openapi.naver.com/v1/nid/me")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(RecordingHandler.requests, [("GET", "/openapi.naver.com/v1/nid/me")] * 3)
+
+    def test_non_idempotent_request_is_not_retried(self):
+        # The Kakao token exchange is a GET that consumes the authorization code: idempotent=False
+        RecordingHandler.fail_rate = 1.0
+        with self.assertRaises(ValueError):
+            KakaoResponse.create_from_code("code", "client-key", "https://example.com/callback")
+        self.assertEqual(RecordingHandler.requests, [("GET", "/kauth.kakao.com/oauth/token")])
+
+    async def test_async_get_is_retried_on_503(self):
+        RecordingHandler.fail_rate = 1.0
+        response = await ProviderClient("test").aget("https://openapi.naver.com/v1/nid/me")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(RecordingHandler.requests, [("GET", "/openapi.naver.com/v1/nid/me")] * 3)
+
+    async def test_async_non_idempotent_request_is_not_retried(self):
+        RecordingHandler.fail_rate = 1.0
+        response = await ProviderClient("test").apost("https://nid.naver.com/oauth2.0/token", data={"code": "code"})
+        self.assertEqual(response.status_code, 503)
+        response = await ProviderClient("test").aget("https://kauth.kakao.com/oauth/token", params={"code": "code"}, idempotent=False)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(RecordingHandler.requests, [("POST", "/nid.naver.com/oauth2.0/token"), ("GET", "/kauth.kakao.com/oauth/token")])
+
+    async def test_async_success(self):
+        response = await ProviderClient("test").apost("https://nid.naver.com/oauth2.0/token", data={"code": "code"})
+        self.assertEqual(response.json()["access_token"], "fake:code")
+
+    @override_settings(PROVIDER_READ_TIMEOUT=0.2, PROVIDER_RETRIES=1)
+    def test_read_timeout_raises_provider_error(self):
+        RecordingHandler.delay = 1.0
+        with self.assertRaises(ProviderError):
+            ProviderClient("test").get("https://openapi.naver.com/v1/nid/me")
+        self.assertEqual(len(RecordingHandler.requests), 2)
+
+    def assert_login_round_trip(self, path, provider, data):
+        response = self.client.post(path, data, content_type="application/json")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["message"], "회원가입 성공")
+        account = UserSocialAccount.objects.select_related("user").get(provider=provider)
+
+        response = self.client.post(path, data, content_type="application/json")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertNotEqual(response.json()["message"], "회원가입 성공")
+        self.assertEqual(response.json()["data"]["user"]["email"], account.user.email)
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_naver_login_round_trip(self):
+        self.assert_login_round_trip("/accounts/naver", "naver", {"code": "naver-code", "state": "state"})
+
+    def test_kakao_login_round_trip(self):
+        self.assert_login_round_trip("/accounts/kakao", "kakao", {"code": "kakao-code"})
+
+    def test_invalid_code_is_rejected(self):
+        response = self.client.post("/accounts/naver", {"code": "invalid-code", "state": "state"}, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(User.objects.exists())
+
+
+# Sign Up
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class FailingRelatedSignUpSerializer(SignUpSerializer):
+    def create_related(self, user, validated_data):
+        raise IntegrityError("forced")
+
+
+@override_settings(**FAST_HASHING)
+class SignUpTests(FakeProviderTestCase):
+    def signup(self, **data):
+        data = {"email": "new@example.com", "name": "New", "mobile": "01012345678", "password": "password-1234", **data}
+        return self.client.post("/accounts/signup", data, content_type="application/json")
+
+    def test_signup_is_one_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.signup()
+        self.assertEqual(response.status_code, 200, response.content)
+        inserts = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 1, inserts)
+        self.assertEqual(User.objects.get().email, "new@example.com")
+
+    def test_duplicate_email_and_mobile_are_field_errors(self):
+        self.assertEqual(self.signup().status_code, 200)
+        response = self.signup()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["errors"]), {"email", "mobile"})
+
+        response = self.signup(email="other@example.com")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["errors"]), {"mobile"})
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_blank_mobile_is_stored_as_null(self):
+        self.assertEqual(self.signup(email="first@example.com", mobile="").status_code, 200)
+        self.assertEqual(self.signup(email="second@example.com", mobile="").status_code, 200)
+        self.assertEqual(list(User.objects.values_list("mobile", flat=True)), [None, None])
+
+    def test_verified_identity_collision(self):
+        self.assertEqual(self.signup(email="first@example.com", identity_code="identity-1").status_code, 200)
+        response = self.signup(email="second@example.com", mobile="01099998888", identity_code="identity-1")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["message"], "이미 본인인증된 아이디가 존재합니다.")
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_referral_is_written_with_the_user(self):
+        self.assertEqual(self.signup(email="owner@example.com", mobile="01011112222").status_code, 200)
+        owner = User.objects.get()
+
+        response = self.signup(referral_code=owner.referral_code)
+        self.assertEqual(response.status_code, 200, response.content)
+        user = User.objects.get(email="new@example.com")
+        self.assertTrue(Referral.objects.filter(referrer=user, referree=owner).exists())
+
+        # The same transaction: a failing referral insert leaves no user behind
+        with mock.patch("accounts.serializers.ReferralHandler.create", side_effect=IntegrityError("forced")):
+            response = self.signup(email="third@example.com", mobile="01033334444", referral_code=owner.referral_code)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(User.objects.filter(email="third@example.com").exists())
+
+    def test_failing_related_rows_roll_back_the_user(self):
+        serializer = FailingRelatedSignUpSerializer(data={"email": "new@example.com", "name": "New", "password": "password-1234"})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.assertRaises(ValidationError) as context:
+            serializer.save()
+        self.assertIn("non_field_errors", context.exception.detail)
+        self.assertFalse(User.objects.exists())
+
+
+# Import Users
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(**FAST_HASHING)
+class ImportUsersTests(TestCase):
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.directory = Path(temporary.name)
+        User.objects.create_user(email="existing@example.com", name="Existing", mobile="01000000000", password="password-1234")
+
+    def import_rows(self, rows, *args):
+        path = self.directory / "users.jsonl"
+        path.write_text("\n".join(json.dumps(row) for row in rows) + "\n")
+        rejects = self.directory / "rejects.jsonl"
+        call_command("import_users", str(path), "--workers", "1", "--rejects", str(rejects), *args, stdout=io.StringIO())
+        return {entry["line"]: entry["errors"] for entry in map(json.loads, rejects.read_text().splitlines())}
+
+    def test_duplicates_are_rejected(self):
+        rejects = self.import_rows([
+            {"email": "new@example.com", "name": "New", "password": "password-1234"},
+            {"email": " new@EXAMPLE.com", "name": "Again"},                          # Same normalized email as line 1
+            {"email": "other@example.com", "name": "Other", "mobile": "01000000000"},  # Mobile of an existing user
+            {"email": "existing@example.com", "name": "Existing"},
+            "not an object",
+        ])
+        self.assertEqual(rejects, {
+            2: {"email": ["Duplicate of an earlier row."]},
+            3: {"mobile": ["Already exists."]},
+            4: {"email": ["Already exists."]},
+            5: {"row": ["Not a JSON object."]},
+        })
+        user = User.objects.get(email="new@example.com")
+        self.assertTrue(user.check_password("password-1234"))
+        self.assertTrue(user.referral_code and user.username.endswith(user.referral_code))
+        self.assertEqual(User.objects.count(), 2)
+
+    def test_conflict_after_validation_falls_back_to_row_inserts(self):
+        # A concurrent signup takes a value between the uniqueness query and bulk_create
+        existing_values = ImportUsersCommand.existing_values
+
+        def before_signup(command, users):
+            values = existing_values(command, users)
+            values["email"].discard("existing@example.com")
+            return values
+
+        with mock.patch.object(ImportUsersCommand, "existing_values", before_signup):
+            rejects = self.import_rows([
+                {"email": "first@example.com", "name": "First"},
+                {"email": "existing@example.com", "name": "Taken"},
+                {"email": "third@example.com", "name": "Third"},
+            ])
+        self.assertEqual(list(rejects), [2])
+        self.assertEqual(set(User.objects.values_list("email", flat=True)), {"existing@example.com", "first@example.com", "third@example.com"})
+        self.assertEqual(User.objects.get(email="existing@example.com").name, "Existing")
+
+    def test_dry_run_writes_nothing(self):
+        self.assertEqual(self.import_rows([{"email": "new@example.com", "name": "New"}], "--dry-run"), {})
+        self.assertEqual(User.objects.count(), 1)
+
+
+# OpenAPI
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class OpenAPITests(TestCase):
+    def test_schema_declares_jwt_security(self):
+        from drf_spectacular.generators import SchemaGenerator
+
+        with mock.patch("drf_spectacular.plumbing.warn") as registry_warn, mock.patch("drf_spectacular.openapi.warn") as schema_warn:
+            schema = SchemaGenerator().get_schema(request=None, public=True)
+        warnings = [str(call) for call in registry_warn.call_args_list + schema_warn.call_args_list]
+        self.assertFalse([warning for warning in warnings if "jwtAuth" in warning or "authenticator" in warning])
+        self.assertIn("jwtAuth", schema["components"]["securitySchemes"])
+        self.assertEqual(schema["paths"]["/accounts"]["get"]["security"], [{"jwtAuth": []}])
+
+    def test_startup_does_not_import_schema_generation(self):
+        code = (
+            "import sys, django; django.setup(); "
+            "from django.urls import get_resolver; get_resolver().url_patterns; "
+            "print(sorted(module for module in sys.modules if module.startswith(('drf_spectacular.plumbing', 'drf_spectacular.contrib'))))"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
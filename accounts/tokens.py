@@ -0,0 +1,202 @@
+# accounts/tokens.py
+app_name = 'accounts'
+
+import hmac
+import json
+import time
+import base64
+import hashlib
+import secrets
+import functools
+import threading
+
+import jwt
+
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.utils.translation import gettext_lazy as _
+
+from .authentication import token_claims
+from .keys import get_keyring
+from .revocation import denylist
+
+HMAC_ALGORITHMS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+def b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Token Backend
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class KeyRingTokenBackend(TokenBackend):
+    """
+    Asymmetric algorithms: signs with the keyring's active key (kid header) and verifies with the key named by kid,
+    so tokens signed before a key rotation stay valid. HMAC algorithms behave as TokenBackend.
+    """
+
+    def __init__(self, keyring):
+        super().__init__(
+            api_settings.ALGORITHM,
+            api_settings.SIGNING_KEY,
+            api_settings.VERIFYING_KEY,
+            api_settings.AUDIENCE,
+            api_settings.ISSUER,
+            api_settings.JWK_URL,
+            api_settings.LEEWAY,
+            api_settings.JSON_ENCODER,
+        )
+        self.keyring = keyring
+
+    def encode(self, payload):
+        if not self.keyring.asymmetric:
+            return super().encode(payload)
+
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+        active = self.keyring.active
+        return jwt.encode(jwt_payload, active.private_key, algorithm=self.algorithm, headers={"kid": active.kid}, json_encoder=self.json_encoder)
+
+    def get_verifying_key(self, token):
+        if not self.keyring.asymmetric:
+            return super().get_verifying_key(token)
+
+        try:
+            key = self.keyring.get(jwt.get_unverified_header(token).get("kid"))
+        except jwt.InvalidTokenError as error:
+            raise TokenBackendError(_("Token is invalid")) from error
+        if key is None:
+            raise TokenBackendError(_("Token is invalid"))
+        return key.public_key
+
+
+@functools.lru_cache(maxsize=1)
+def get_token_backend():
+    return KeyRingTokenBackend(get_keyring())
+
+
+# Tokens
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class KeyRingTokenMixin:
+    @property
+    def token_backend(self):
+        return get_token_backend()
+
+
+class DenylistMixin:
+    def verify(self):
+        super().verify()
+        if denylist.is_revoked(self):
+            raise TokenError(_("Token is blacklisted"))
+
+
+class AccessToken(KeyRingTokenMixin, DenylistMixin, tokens.AccessToken):
+    pass
+
+
+class RefreshToken(KeyRingTokenMixin, DenylistMixin, tokens.RefreshToken):
+    access_token_class = AccessToken
+
+
+def get_token(user):
+    token = RefreshToken.for_user(user)
+    for claim, value in token_claims(user).items():
+        token[claim] = value
+    return token
+
+
+# Token Service
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class TokenService:
+    """
+    access / refresh 토큰 쌍을 한 번에 발급한다 (rest_framework_simplejwt 와 같은 클레임, 같은 서명).
+    헤더 세그먼트, 고정 클레임, 서명 키 객체는 프로세스당 한 번만 만들고, 토큰마다 JSON 직렬화와 서명만 수행한다.
+    fast path 는 HMAC 서명만 지원한다. 비대칭 키(RS256, EdDSA: 서명 비용이 대부분), CHECK_REVOKE_TOKEN, JSON_ENCODER, blacklist 앱이면 simplejwt 로 발급한다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.prepared = None
+
+    def prepare(self):
+        if (
+            get_keyring().asymmetric
+            or api_settings.ALGORITHM not in HMAC_ALGORITHMS
+            or api_settings.CHECK_REVOKE_TOKEN
+            or api_settings.JSON_ENCODER is not None
+            or "rest_framework_simplejwt.token_blacklist" in settings.INSTALLED_APPS
+        ):
+            return False
+
+        header = {"alg": api_settings.ALGORITHM, "typ": "JWT"}
+        mac = hmac.new(api_settings.SIGNING_KEY.encode(), digestmod=HMAC_ALGORITHMS[api_settings.ALGORITHM])     # Keyed once
+        self.signature = lambda signing_input: self.hmac_digest(mac, signing_input)
+
+        static_claims = {}
+        if api_settings.AUDIENCE is not None:
+            static_claims["aud"] = api_settings.AUDIENCE
+        if api_settings.ISSUER is not None:
+            static_claims["iss"] = api_settings.ISSUER
+
+        self.header = b64encode(json.dumps(header, separators=(",", ":"), sort_keys=True).encode()) + b"."
+        self.static_claims = static_claims
+        self.access_lifetime = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+        self.refresh_lifetime = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+        # Claims template: the per-token part is prepended to the user's shared claims
+        self.template = '{"%s":"%%s","exp":%%d,"iat":%%d,"%s":"%%s",' % (api_settings.TOKEN_TYPE_CLAIM, api_settings.JTI_CLAIM)
+        return True
+
+    def reset(self, **kwargs):
+        with self.lock:
+            self.prepared = None
+
+    @staticmethod
+    def hmac_digest(mac, signing_input):
+        mac = mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def sign(self, payload):
+        signing_input = self.header + b64encode(payload.encode())
+        return (signing_input + b"." + b64encode(self.signature(signing_input))).decode()
+
+    def pair(self, user):
+        """Returns (access_token, refresh_token, expires_in)"""
+        if self.prepared is None:
+            with self.lock:
+                if self.prepared is None:
+                    self.prepared = self.prepare()
+
+        if not self.prepared:
+            token = get_token(user)
+            return str(token.access_token), str(token), token.access_token.lifetime.total_seconds()
+
+        claims = {api_settings.USER_ID_CLAIM: str(getattr(user, api_settings.USER_ID_FIELD)), **token_claims(user), **self.static_claims}
+        shared = json.dumps(claims, separators=(",", ":"))[1:]       # '"user_id":"1",...}'
+
+        # As RefreshToken.access_token: both tokens share iat and the user claims
+        issued_at = int(time.time())
+        refresh = self.sign(self.template % ("refresh", issued_at + self.refresh_lifetime, issued_at, secrets.token_hex(16)) + shared)
+        access = self.sign(self.template % ("access", issued_at + self.access_lifetime, issued_at, secrets.token_hex(16)) + shared)
+        return access, refresh, float(self.access_lifetime)
+
+
+token_service = TokenService()
+
+
+def reload_token_settings(*args, setting, **kwargs):
+    if setting in ("SIMPLE_JWT", "SECRET_KEY", "INSTALLED_APPS", "JWT_PRIVATE_KEY_FILES", "JWT_PUBLIC_KEY_FILES"):
+        get_keyring.cache_clear()
+        get_token_backend.cache_clear()
+        token_service.reset()
+
+
+setting_changed.connect(reload_token_settings)
@@ -4,7 +4,7 @@ app_name = 'accounts'
 from django.contrib import admin
 from django.urls import path
 
-from .views import AccountAPIView, SignUpAPIView, CheckEmailAPIView, ResetPasswordAPIView, TokenRefreshAPIView, SendVerificationView, CheckVerificationView
+from .views import AccountAPIView, SignUpAPIView, CheckEmailAPIView, ResetPasswordAPIView, TokenRefreshAPIView, LogoutAPIView, SendVerificationView, CheckVerificationView
 from .views import NaverAPIView, GoogleAPIView, KakaoAPIView, AppleAPIView, PortOneAPIView
 
 urlpatterns = [
@@ -13,6 +13,7 @@ urlpatterns = [
     path("/check-email", CheckEmailAPIView.as_view()),
     path("/reset-password", ResetPasswordAPIView.as_view()),
     path("/refresh", TokenRefreshAPIView.as_view()),
+    path("/logout", LogoutAPIView.as_view()),
     path("/send-code", SendVerificationView.as_view()),
     path("/verify-code", CheckVerificationView.as_view()),
 
@@ -3,12 +3,24 @@ app_name = 'accounts'
 
 import string
 import secrets
-import requests
 import urllib.parse
 
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.conf import settings
+
+from server.cache import make_key
+from server.http import ProviderClient
+from server.metrics import CacheCounter
+from server.ratelimit import SlidingWindowLimiter
+
+from .tokens import token_service
+from .serializers import user_representation
+
+# Provider Clients (pooled sessions, timeouts and retries: server.http)
+naver_client = ProviderClient("naver")
+google_client = ProviderClient("google")
+kakao_client = ProviderClient("kakao")
+portone_client = ProviderClient("portone")
 
-from .serializers import UserSerializer
 
 # Auth Response Builder
 class AuthResponseBuilder:
@@ -26,16 +38,16 @@ class AuthResponseBuilder:
         return self
 
     def build(self) -> dict:
-        token = TokenObtainPairSerializer.get_token(self.user)
+        access_token, refresh_token, expires_in = token_service.pair(self.user)
         return {
             "code": self.code,
             "message": self.message,
             "data": {
-                "user": UserSerializer(self.user).data,
+                "user": user_representation(self.user),
                 "token": {
-                    "access_token": str(token.access_token),
-                    "refresh_token": str(token),
-                    "expires_in": token.access_token.lifetime.total_seconds(),
+                    "access_token": access_token,
+                    "refresh_token": refresh_token,
+                    "expires_in": expires_in,
                 },
             },
         }
@@ -49,6 +61,22 @@ def generate_random_password(length=12):
     return password
 
 
+# Verification Throttle
+# <-------------------------------------------------------------------------------------------------------------------------------->
+verification_ip_limiter = SlidingWindowLimiter("verification:ip", settings.VERIFICATION_IP_LIMIT, settings.VERIFICATION_IP_WINDOW)
+verification_target_limiter = SlidingWindowLimiter("verification:target", settings.VERIFICATION_TARGET_LIMIT, settings.VERIFICATION_TARGET_WINDOW)
+
+verification_counters = {
+    name: CacheCounter(f"verification.{name}")
+    for name in ("sent", "deduplicated", "throttled_ip", "throttled_target")
+}
+
+
+def verification_sent_key(type, target):
+    # Set for VERIFICATION_RESEND_SECONDS after a code is sent; repeated requests are answered from the cache
+    return make_key("verification", "sent", type, target)
+
+
 # Mobile Generator
 # <-------------------------------------------------------------------------------------------------------------------------------->
 def generate_random_mobile():
@@ -145,7 +173,7 @@ class NaverResponse:
             'state': state
         }
         
-        token_response = requests.post("https://nid.naver.com/oauth2.0/token", data=token_data)
+        token_response = naver_client.post("https://nid.naver.com/oauth2.0/token", data=token_data)
         token_response_json = token_response.json()
         
         # 2. 토큰 요청 에러 처리
@@ -160,7 +188,7 @@ class NaverResponse:
             raise ValueError("Missing naver_access_token")
         
         # 4. 네이버 프로필 정보 요청
-        profile_response = requests.get(
+        profile_response = naver_client.get(
             "https://openapi.naver.com/v1/nid/me",
             headers={"Authorization": f"Bearer {naver_access_token}"}
         )
@@ -248,7 +276,7 @@ class GoogleResponse:
             'code': decoded_code
         }
         
-        token_response = requests.post("https://oauth2.googleapis.com/token", data=token_data)
+        token_response = google_client.post("https://oauth2.googleapis.com/token", data=token_data)
         token_response_json = token_response.json()
         
         # 3. 토큰 요청 에러 처리
@@ -263,7 +291,7 @@ class GoogleResponse:
             raise ValueError("Missing google_access_token")
         
         # 5. 구글 프로필 정보 요청
-        profile_response = requests.get(
+        profile_response = google_client.get(
             "https://www.googleapis.com/oauth2/v2/userinfo", 
             headers={"Authorization": f"Bearer {google_access_token}"}
         )
@@ -450,7 +478,8 @@ class KakaoResponse:
             'code': code
         }
         
-        token_response = requests.get(token_url, params=token_params)
+        # The authorization code is single use: not retried after it may have reached Kakao
+        token_response = kakao_client.get(token_url, params=token_params, idempotent=False)
         token_data = token_response.json()
         
         # 2. 토큰 요청 에러 처리
@@ -468,7 +497,8 @@ class KakaoResponse:
         profile_url = "https://kapi.kakao.com/v2/user/me"
         profile_headers = {"Authorization": f"Bearer {access_token}"}
         
-        profile_response = requests.post(profile_url, headers=profile_headers)
+        # Read-only despite POST
+        profile_response = kakao_client.post(profile_url, headers=profile_headers, idempotent=True)
         if profile_response.status_code != 200:
             raise ValueError("Failed to get profile from Kakao")
         
@@ -558,7 +588,7 @@ class PortOneResponse:
             "Content-Type": "application/json"
         }
         
-        response = requests.get(url, headers=headers)
+        response = portone_client.get(url, headers=headers)
         
         if not response.ok:
             error_detail = response.json() if response.content else "Unknown error"
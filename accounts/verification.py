@@ -0,0 +1,118 @@
+# accounts/verification.py
+app_name = 'accounts'
+
+import functools
+
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from django.utils.timezone import now
+
+from server.cache import make_key
+from server.metrics import cache_incr
+
+from .models import Verification
+
+VerificationRecord = namedtuple("VerificationRecord", ["type", "target", "code", "expired"], defaults=[False])
+
+
+# Errors
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class VerificationError(Exception):
+    message = "인증번호가 일치하지 않습니다."
+
+
+class VerificationExpired(VerificationError):
+    message = "인증번호가 만료되었습니다."
+
+
+class VerificationAttemptsExceeded(VerificationError):
+    message = "인증 시도 횟수를 초과했습니다. 인증번호를 다시 요청해주세요."
+
+
+# Backends
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class BaseVerificationBackend:
+    """
+    인증번호 저장소. issue 로 발급하고 check 로 확인한다 (consume=True 이면 1회용으로 삭제).
+    대상별 실패 횟수는 캐시에서 원자적으로 세고, VERIFICATION_MAX_ATTEMPTS 를 넘으면 코드를 폐기한다.
+    """
+
+    def __init__(self):
+        self.ttl = settings.VERIFICATION_TTL
+        self.max_attempts = settings.VERIFICATION_MAX_ATTEMPTS
+
+    def attempts_key(self, target):
+        return make_key("verification", "attempts", target)
+
+    def issue(self, type, target, code):
+        cache.delete(self.attempts_key(target))
+        self.store(type, target, code)
+
+    def check(self, target, code, consume=False):
+        record = self.load(target)
+        if record is not None and record.code == code:
+            if record.expired:
+                raise VerificationExpired()
+            if consume and not self.delete(target):
+                raise VerificationError()       # Consumed concurrently
+            cache.delete(self.attempts_key(target))
+            return record
+
+        if not cache.add(self.attempts_key(target), 1, self.ttl):
+            if cache_incr(self.attempts_key(target)) > self.max_attempts:
+                self.delete(target)
+                raise VerificationAttemptsExceeded()
+        raise VerificationError()
+
+    def store(self, type, target, code):
+        raise NotImplementedError
+
+    def load(self, target):
+        raise NotImplementedError
+
+    def delete(self, target):
+        raise NotImplementedError
+
+
+class CacheVerificationBackend(BaseVerificationBackend):
+    """Redis / 캐시 TTL 저장소: 만료는 캐시가 처리하고 DB 쓰기가 없다"""
+
+    def key(self, target):
+        return make_key("verification", "code", target)
+
+    def store(self, type, target, code):
+        cache.set(self.key(target), (type, code), self.ttl)
+
+    def load(self, target):
+        entry = cache.get(self.key(target))
+        if entry is None:
+            return None
+        return VerificationRecord(entry[0], target, entry[1])
+
+    def delete(self, target):
+        return cache.delete(self.key(target))
+
+
+class DatabaseVerificationBackend(BaseVerificationBackend):
+    """accounts.models.Verification 테이블 저장소 (만료 행은 sweep_expired_verifications 가 정리)"""
+
+    def store(self, type, target, code):
+        Verification.objects.update_or_create(type=type, target=target, defaults={'verification_code': code, 'created_at': now()})
+
+    def load(self, target):
+        verification = Verification.objects.filter(target=target).order_by('-created_at').first()
+        if verification is None:
+            return None
+        return VerificationRecord(verification.type, verification.target, verification.verification_code, verification.is_expired())
+
+    def delete(self, target):
+        deleted, _ = Verification.objects.filter(target=target).delete()
+        return deleted > 0
+
+
+@functools.lru_cache(maxsize=1)
+def get_verification_backend():
+    return import_string(settings.VERIFICATION_BACKEND)()
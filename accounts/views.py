@@ -1,6 +1,7 @@
 # accounts/views.py
 app_name = 'accounts'
 
+import time
 import random
 import hmac
 import hashlib
@@ -9,76 +10,86 @@ import base64
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.exceptions import ValidationError
 from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 
 from django.conf import settings
 from django.contrib.auth import authenticate
 from django.utils.timezone import now
 from django.db import IntegrityError
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_cache_control
 
-from drf_spectacular.utils import extend_schema
-
-from users.utils import ReferralHandler
+from server.schemas import lazy_schema
 from server.utils import SuccessResponseBuilder, ErrorResponseBuilder
+from server.cache import make_key
+from server.ratelimit import get_client_ip
 
-from .tasks import send_verification_email, send_verification_sms
+from .tasks import send_verification_sms, verification_mail_queue
 from .utils import AuthResponseBuilder, NaverResponse, KakaoResponse, GoogleResponse, PortOneResponse
-from .models import User, Verification, UserSocialAccount
+from .utils import verification_ip_limiter, verification_target_limiter, verification_counters, verification_sent_key
+from .models import User, UserSocialAccount
+from .verification import get_verification_backend, VerificationError
+from .access import tracker as last_access_tracker
+from .authentication import FreshJWTAuthentication, get_social_user, user_cache
+from .keys import get_keyring
+from .tokens import RefreshToken, token_service
+from .revocation import denylist
 from .serializers import UserSerializer, SignUpSerializer, VerificationCheckSerializer, VerificationRequestSerializer, SocialSignUpSerializer
 from .permissions import IsAuthenticated, AllowAny
-from .schemas import AccountSchema
 
 # User
 # <-------------------------------------------------------------------------------------------------------------------------------->
 # Sign Up API
 class SignUpAPIView(APIView):
-    @extend_schema(**AccountSchema.signup())
+    @lazy_schema("accounts.schemas.AccountSchema.signup")
     def post(self, request):
         serializer = SignUpSerializer(data=request.data)
-        if serializer.is_valid():                
-            user = serializer.save()
+        if not serializer.is_valid():
+            response = ErrorResponseBuilder().with_message("회원가입에 실패했습니다.").with_errors(serializer.errors).build()
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-            identity_code = request.data.get("identity_code")
-            if identity_code:
-                try:
-                    port_one_response = PortOneResponse.create_from_code(identity_code, settings.PORTONE_API_SECRET)
-                    user.ci = port_one_response.ci
-                    user.name = port_one_response.name
-                    user.mobile = port_one_response.mobile
-                    user.birthday = port_one_response.birthday
-                    user.gender = port_one_response.gender
-                    user.save()
-
-                except IntegrityError:
-                    response = ErrorResponseBuilder().with_message("이미 본인인증된 아이디가 존재합니다.").build()
-                    return Response(response, status=status.HTTP_400_BAD_REQUEST)
+        # External call and lookups first: the user row is then written once, with the referral, in one transaction
+        identity = {}
+        identity_code = request.data.get("identity_code")
+        if identity_code:
+            try:
+                port_one_response = PortOneResponse.create_from_code(identity_code, settings.PORTONE_API_SECRET)
+            except Exception as error:
+                response = ErrorResponseBuilder().with_message("사용자 인증에 실패했습니다.").with_errors({"error": str(error)}).build()
+                return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-                except Exception as error:
-                    user.delete()
-                    response = ErrorResponseBuilder().with_message("사용자 인증에 실패했습니다.").with_errors({"error": str(error)}).build()
-                    return Response(response, status=status.HTTP_400_BAD_REQUEST)
+            identity = {
+                "ci": port_one_response.ci,
+                "name": port_one_response.name,
+                "mobile": port_one_response.mobile,
+                "birthday": port_one_response.birthday,
+                "gender": port_one_response.gender,
+            }
 
-            referral_code = request.data.get("referral_code")
-            if referral_code:
-                referree = User.objects.filter(referral_code=referral_code).first()
-                if referree:
-                    referral_handler = ReferralHandler(user, referree)
-                    referral_handler.create()
+        referree = None
+        referral_code = request.data.get("referral_code")
+        if referral_code:
+            referree = User.objects.filter(referral_code=referral_code).only("pk").first()
 
-            response = AuthResponseBuilder(user).with_message("회원가입 성공").build()
-            return Response(response, status=status.HTTP_200_OK)
-        
-        else:
-            response = ErrorResponseBuilder().with_message("회원가입에 실패했습니다.").with_errors(serializer.errors).build()
+        try:
+            user = serializer.save(referree=referree, **identity)
+        except ValidationError as error:
+            if "ci_hash" in error.detail:
+                response = ErrorResponseBuilder().with_message("이미 본인인증된 아이디가 존재합니다.").build()
+            else:
+                response = ErrorResponseBuilder().with_message("회원가입에 실패했습니다.").with_errors(error.detail).build()
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
+        response = AuthResponseBuilder(user).with_message("회원가입 성공").build()
+        return Response(response, status=status.HTTP_200_OK)
+
 
 # Check Email API
 class CheckEmailAPIView(APIView):
-    @extend_schema(**AccountSchema.check_email())
+    @lazy_schema("accounts.schemas.AccountSchema.check_email")
     def post(self, request):
         email = request.data.get("email")
         if User.objects.filter(email=email).exists():
@@ -91,7 +102,7 @@ class CheckEmailAPIView(APIView):
 
 # Reset Password API
 class ResetPasswordAPIView(APIView):
-    @extend_schema(**AccountSchema.reset_password())
+    @lazy_schema("accounts.schemas.AccountSchema.reset_password")
     def post(self, request):
         try:    
             identity_code = request.data.get("identity_code")
@@ -106,11 +117,7 @@ class ResetPasswordAPIView(APIView):
 
                 target = serializer.validated_data['target']
                 verification_code = serializer.validated_data['verification_code']
-                verification = Verification.objects.get(target=target, verification_code=verification_code)
-
-                if verification.is_expired():
-                    response = ErrorResponseBuilder().with_message("인증번호가 만료되었습니다.").build()
-                    return Response(response, status=status.HTTP_400_BAD_REQUEST)
+                verification = get_verification_backend().check(target, verification_code, consume=True)
 
                 if verification.type == 'mobile':
                     user = User.objects.get(mobile=verification.target)
@@ -118,8 +125,6 @@ class ResetPasswordAPIView(APIView):
                 else:
                     user = User.objects.get(email=verification.target)
 
-                verification.delete()
-
             response = AuthResponseBuilder(user).with_message("임시 토큰 발급 성공").build()
             return Response(response, status=status.HTTP_200_OK)
 
@@ -127,8 +132,8 @@ class ResetPasswordAPIView(APIView):
             response = ErrorResponseBuilder().with_message("사용자를 찾을 수 없습니다.").build()
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-        except Verification.DoesNotExist:
-            response = ErrorResponseBuilder().with_message("인증번호가 일치하지 않습니다.").build()
+        except VerificationError as error:
+            response = ErrorResponseBuilder().with_message(error.message).build()
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
         except Exception as e:
@@ -138,38 +143,74 @@ class ResetPasswordAPIView(APIView):
 
 # Token Refresh API
 class TokenRefreshAPIView(APIView):
-    @extend_schema(**AccountSchema.token_refresh())
+    @lazy_schema("accounts.schemas.AccountSchema.token_refresh")
     def post(self, request):
         refresh_token = request.data.get("refresh_token")
-        serializer = TokenRefreshSerializer(data={"refresh": refresh_token})
 
-        try: 
-            serializer.is_valid(raise_exception=True)
-            access_token = serializer.validated_data["access"]
-            access_token_lifetime = api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
-
-            token_obj = RefreshToken(refresh_token)
-            user_id = token_obj["user_id"]
-            user = User.objects.get(id=user_id)
-            user.last_access = now()
-            user.save(update_fields=["last_access"])
-            
-            response = SuccessResponseBuilder().with_message("토큰 갱신 성공").with_data({
-                "token": {
-                    "access_token": access_token,
-                    "refresh_token": refresh_token,
-                    "expires_in": access_token_lifetime
-                }
-            }).build()
-            return Response(response, status=status.HTTP_200_OK)
-
-        except TokenError as error:
+        try:
+            if not refresh_token:
+                raise TokenError("Refresh token is required")
+            refresh = RefreshToken(refresh_token)           # Parsed and verified once (signature, expiry, denylist)
+
+            # Rotation: the presented token is denied atomically, so a replayed or concurrently used token fails here
+            if api_settings.ROTATE_REFRESH_TOKENS and not denylist.claim(refresh):
+                raise TokenError("Token is blacklisted")
+
+            try:
+                user_id = User._meta.pk.to_python(refresh[api_settings.USER_ID_CLAIM])
+            except (KeyError, DjangoValidationError):
+                raise TokenError("Token contained no recognizable user identification")
+            user = user_cache.get(user_id)
+            if not api_settings.USER_AUTHENTICATION_RULE(user):
+                raise TokenError("User is inactive")
+
+        except (TokenError, User.DoesNotExist) as error:
             response = ErrorResponseBuilder().with_message("토큰 갱신에 실패했습니다.").with_errors({"token_error": str(error)}).build()
             return Response(response, status=status.HTTP_401_UNAUTHORIZED)
-    
+
+        last_access_tracker.touch(user)
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            access_token, refresh_token, expires_in = token_service.pair(user)
+        else:
+            access_token, expires_in = str(refresh.access_token), api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+
+        response = SuccessResponseBuilder().with_message("토큰 갱신 성공").with_data({
+            "token": {
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "expires_in": expires_in
+            }
+        }).build()
+        return Response(response, status=status.HTTP_200_OK)
+
+
+# Logout API (Revoke Tokens)
+class LogoutAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @lazy_schema("accounts.schemas.AccountSchema.logout")
+    def post(self, request):
+        denylist.revoke(request.auth)       # The access token of this request
+
+        refresh_token = request.data.get("refresh_token")
+        if refresh_token:
+            try:
+                refresh = RefreshToken(refresh_token)
+                if str(refresh[api_settings.USER_ID_CLAIM]) == str(request.user.pk):
+                    denylist.revoke(refresh)
+            except TokenError:
+                pass        # Already expired or revoked
+            except KeyError:
+                response = ErrorResponseBuilder().with_message("로그아웃에 실패했습니다.").with_errors({"token_error": "Token contained no recognizable user identification"}).build()
+                return Response(response, status=status.HTTP_401_UNAUTHORIZED)
+
+        response = SuccessResponseBuilder().with_message("로그아웃 성공").build()
+        return Response(response, status=status.HTTP_200_OK)
+
 
 # Account Management API (Login, Fetch Info, Update, Delete)
 class AccountAPIView(APIView):
+    authentication_classes = [FreshJWTAuthentication]     # Reads and writes the current account row
     permission_classes = [IsAuthenticated]
 
     # Override permission for POST (Sign-In) to allow all users
@@ -179,21 +220,19 @@ class AccountAPIView(APIView):
         return super().get_permissions()
     
     # Get Account Info (Authenticated Users Only)
-    @extend_schema(**AccountSchema.get_account_info())
+    @lazy_schema("accounts.schemas.AccountSchema.get_account_info")
     def get(self, request):
         user = request.user
-        user.last_access = now()
-        user.save(update_fields=["last_access"])
+        last_access_tracker.touch(user)
         response = AuthResponseBuilder(user).with_message("로그인 성공").build()
         return Response(response, status=status.HTTP_200_OK)
         
     # Sign-In API (Issue JWT Token)
-    @extend_schema(**AccountSchema.signin())
+    @lazy_schema("accounts.schemas.AccountSchema.signin")
     def post(self, request):
         user = authenticate(email=request.data.get("email"), password=request.data.get("password"))
         if user is not None:
-            user.last_access = now()
-            user.save(update_fields=["last_access"])
+            last_access_tracker.touch(user)
             response = AuthResponseBuilder(user).with_message("로그인 성공").build()
             return Response(response, status=status.HTTP_200_OK)
         
@@ -202,7 +241,7 @@ class AccountAPIView(APIView):
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
         
     # Delete Account API
-    @extend_schema(**AccountSchema.delete_account())
+    @lazy_schema("accounts.schemas.AccountSchema.delete_account")
     def delete(self, request):
         user = request.user  # Authenticated user
         user.delete()
@@ -211,7 +250,7 @@ class AccountAPIView(APIView):
         return Response(response, status=status.HTTP_202_ACCEPTED)
         
     # Update Account Info API
-    @extend_schema(**AccountSchema.update_account())
+    @lazy_schema("accounts.schemas.AccountSchema.update_account")
     def put(self, request):
         user = request.user  # Authenticated user
         serializer = UserSerializer(instance=user, data=request.data, partial=True)
@@ -231,7 +270,7 @@ class AccountAPIView(APIView):
 # <-------------------------------------------------------------------------------------------------------------------------------->
 # Send Verification Code API
 class SendVerificationView(APIView):
-    @extend_schema(**AccountSchema.request_verification())
+    @lazy_schema("accounts.schemas.AccountSchema.request_verification")
     def post(self, request):
         serializer = VerificationRequestSerializer(data=request.data)
         try:
@@ -245,6 +284,22 @@ class SendVerificationView(APIView):
         target = serializer.validated_data['target']
         check_unique = request.data.get('check_unique')
 
+        # Throttle per IP and per target; a code sent moments ago is answered from the cache without touching the DB
+        allowed, retry_after = verification_ip_limiter.hit(get_client_ip(request))
+        if not allowed:
+            verification_counters["throttled_ip"].inc()
+            return self.throttled(retry_after)
+
+        if cache.get(verification_sent_key(type, target)):
+            verification_counters["deduplicated"].inc()
+            response = SuccessResponseBuilder().with_message("인증번호 발송 완료").build()
+            return Response(response, status=status.HTTP_200_OK)
+
+        allowed, retry_after = verification_target_limiter.hit(make_key(type, target))
+        if not allowed:
+            verification_counters["throttled_target"].inc()
+            return self.throttled(retry_after)
+
         # Send verification code
         if type == 'mobile':
             if check_unique:
@@ -257,14 +312,10 @@ class SendVerificationView(APIView):
                     response = ErrorResponseBuilder().with_message("가입되지 않은 전화번호입니다.").build()
                     return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-            # Update or create verification record
+            # Issue verification code (VERIFICATION_BACKEND)
             verification_code = f"{random.randint(0, 999999):06d}"
-            Verification.objects.update_or_create(
-                type=type,
-                target=target,
-                defaults={'verification_code': verification_code, 'created_at': now()}
-            )
-            send_verification_sms(target, verification_code)     # send_verification_sms.delay(target, verification_code) for celery
+            get_verification_backend().issue(type, target, verification_code)
+            send_verification_sms.delay(target, verification_code, requested_at=time.time())
 
         else:
             if check_unique:
@@ -277,22 +328,24 @@ class SendVerificationView(APIView):
                     response = ErrorResponseBuilder().with_message("가입되지 않은 이메일입니다.").build()
                     return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-            # Update or create verification record
+            # Issue verification code (VERIFICATION_BACKEND)
             verification_code = f"{random.randint(0, 999999):06d}"
-            Verification.objects.update_or_create(
-                type=type,
-                target=target,
-                defaults={'verification_code': verification_code, 'created_at': now()}
-            )
-            send_verification_email(target, verification_code)   # send_verification_email.delay(target, verification_code) for celery
+            get_verification_backend().issue(type, target, verification_code)
+            verification_mail_queue.add(target, verification_code)      # Sent in batches (EMAIL_BATCH_SIZE / EMAIL_BATCH_INTERVAL)
 
+        cache.set(verification_sent_key(type, target), True, settings.VERIFICATION_RESEND_SECONDS)
+        verification_counters["sent"].inc()
         response = SuccessResponseBuilder().with_message("인증번호 발송 완료").build()
         return Response(response, status=status.HTTP_200_OK)
 
+    def throttled(self, retry_after):
+        response = ErrorResponseBuilder().with_message(f"요청이 너무 많습니다. {retry_after}초 후 다시 시도해주세요.").build()
+        return Response(response, status=status.HTTP_429_TOO_MANY_REQUESTS, headers={"Retry-After": str(retry_after)})
+
 
 # Check Verification Code API
 class CheckVerificationView(APIView):
-    @extend_schema(**AccountSchema.check_verification())
+    @lazy_schema("accounts.schemas.AccountSchema.check_verification")
     def post(self, request):
         serializer = VerificationCheckSerializer(data=request.data)
         try:
@@ -303,15 +356,11 @@ class CheckVerificationView(APIView):
         target = serializer.validated_data['target']
         verification_code = serializer.validated_data['verification_code']
 
-        # Find verification record by target
+        # Check verification code by target
         try:
-            verification = Verification.objects.get(target=target, verification_code=verification_code)
-        except Verification.DoesNotExist:
-            response = ErrorResponseBuilder().with_message("인증번호가 일치하지 않습니다.").build()
-            return Response(response, status=status.HTTP_400_BAD_REQUEST)
-
-        if verification.is_expired():
-            response = ErrorResponseBuilder().with_message("인증번호가 만료되었습니다.").build()
+            get_verification_backend().check(target, verification_code)
+        except VerificationError as error:
+            response = ErrorResponseBuilder().with_message(error.message).build()
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
         response = SuccessResponseBuilder().with_message("인증 성공").build()
@@ -322,7 +371,7 @@ class CheckVerificationView(APIView):
 # <-------------------------------------------------------------------------------------------------------------------------------->
 # Naver API
 class NaverAPIView(APIView):
-    @extend_schema(**AccountSchema.naver_auth())
+    @lazy_schema("accounts.schemas.AccountSchema.naver_auth")
     def post(self, request):
         code = request.data.get("code")
         state = request.data.get("state")
@@ -332,10 +381,8 @@ class NaverAPIView(APIView):
             naver_response = NaverResponse.create_from_code(code, state, settings.NAVER_CLIENT_ID, settings.NAVER_CLIENT_SECRET)
             
             # 1. 기존 소셜 계정으로 유저 찾기
-            social_account = UserSocialAccount.objects.get(provider='naver', provider_user_id=naver_response.id)
-            user = social_account.user
-            user.last_access = now()
-            user.save(update_fields=["last_access"])
+            user = get_social_user('naver', naver_response.id)
+            last_access_tracker.touch(user)
             response = AuthResponseBuilder(user).with_message("네이버 로그인 성공").build()
             return Response(response, status=status.HTTP_200_OK)
 
@@ -343,14 +390,15 @@ class NaverAPIView(APIView):
         except UserSocialAccount.DoesNotExist:
             user_data = naver_response.to_user_data()
             serializer = SocialSignUpSerializer(data=user_data)
-            if serializer.is_valid():
-                user = serializer.save()
-                response = AuthResponseBuilder(user).with_message("회원가입 성공").build()
-                return Response(response, status=status.HTTP_200_OK)
-
-            else:
-                response = ErrorResponseBuilder().with_message("네이버 회원가입에 실패했습니다.").with_errors(serializer.errors).build()
+            try:
+                serializer.is_valid(raise_exception=True)
+                user = serializer.save()        # Unique collisions are reported by the INSERT
+            except ValidationError as error:
+                response = ErrorResponseBuilder().with_message("네이버 회원가입에 실패했습니다.").with_errors(error.detail).build()
                 return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+            response = AuthResponseBuilder(user).with_message("회원가입 성공").build()
+            return Response(response, status=status.HTTP_200_OK)
             
         except ValueError as error:
             response = ErrorResponseBuilder().with_message("네이버 로그인에 실패했습니다.").with_errors({"error": str(error)}).build()
@@ -359,7 +407,7 @@ class NaverAPIView(APIView):
 
 # Google Sign In API
 class GoogleAPIView(APIView):
-    @extend_schema(**AccountSchema.google_auth())
+    @lazy_schema("accounts.schemas.AccountSchema.google_auth")
     def post(self, request):
         code = request.data.get("code")
         
@@ -368,10 +416,8 @@ class GoogleAPIView(APIView):
             google_response = GoogleResponse.create_from_code(code, settings.GOOGLE_CLIENT_KEY, settings.GOOGLE_CLIENT_SECRET, settings.GOOGLE_CALLBACK_URI)
             
             # 1. 기존 소셜 계정으로 유저 찾기
-            social_account = UserSocialAccount.objects.get(provider='google', provider_user_id=google_response.id)
-            user = social_account.user
-            user.last_access = now()
-            user.save(update_fields=["last_access"])
+            user = get_social_user('google', google_response.id)
+            last_access_tracker.touch(user)
             response = AuthResponseBuilder(user).with_message("구글 로그인 성공").build()
             return Response(response, status=status.HTTP_200_OK)
 
@@ -379,14 +425,15 @@ class GoogleAPIView(APIView):
         except UserSocialAccount.DoesNotExist:
             user_data = google_response.to_user_data()
             serializer = SocialSignUpSerializer(data=user_data)
-            if serializer.is_valid():
-                user = serializer.save()
-                response = AuthResponseBuilder(user).with_message("회원가입 성공").build()
-                return Response(response, status=status.HTTP_200_OK)
-
-            else:
-                response = ErrorResponseBuilder().with_message("구글 회원가입에 실패했습니다.").with_errors(serializer.errors).build()
+            try:
+                serializer.is_valid(raise_exception=True)
+                user = serializer.save()        # Unique collisions are reported by the INSERT
+            except ValidationError as error:
+                response = ErrorResponseBuilder().with_message("구글 회원가입에 실패했습니다.").with_errors(error.detail).build()
                 return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+            response = AuthResponseBuilder(user).with_message("회원가입 성공").build()
+            return Response(response, status=status.HTTP_200_OK)
             
         except ValueError as error:
             response = ErrorResponseBuilder().with_message("구글 로그인에 실패했습니다.").with_errors({"error": str(error)}).build()
@@ -395,7 +442,7 @@ class GoogleAPIView(APIView):
 
 # Kakao Sign In API
 class KakaoAPIView(APIView):
-    @extend_schema(**AccountSchema.kakao_auth())
+    @lazy_schema("accounts.schemas.AccountSchema.kakao_auth")
     def post(self, request):
         code = request.data.get("code")
         
@@ -404,10 +451,8 @@ class KakaoAPIView(APIView):
             kakao_response = KakaoResponse.create_from_code(code, settings.KAKAO_CLIENT_KEY, settings.KAKAO_CALLBACK_URI)
             
             # 1. 기존 소셜 계정으로 유저 찾기
-            social_account = UserSocialAccount.objects.get(provider='kakao', provider_user_id=kakao_response.id)
-            user = social_account.user
-            user.last_access = now()
-            user.save(update_fields=["last_access"])
+            user = get_social_user('kakao', kakao_response.id)
+            last_access_tracker.touch(user)
             response = AuthResponseBuilder(user).with_message("카카오 로그인 성공").build()
             return Response(response, status=status.HTTP_200_OK)
 
@@ -415,14 +460,15 @@ class KakaoAPIView(APIView):
         except UserSocialAccount.DoesNotExist:
             user_data = kakao_response.to_user_data()
             serializer = SocialSignUpSerializer(data=user_data)
-            if serializer.is_valid():
-                user = serializer.save()
-                response = AuthResponseBuilder(user).with_message("회원가입 성공").build()
-                return Response(response, status=status.HTTP_200_OK)
-
-            else:
-                response = ErrorResponseBuilder().with_message("카카오 회원가입에 실패했습니다.").with_errors(serializer.errors).build()
+            try:
+                serializer.is_valid(raise_exception=True)
+                user = serializer.save()        # Unique collisions are reported by the INSERT
+            except ValidationError as error:
+                response = ErrorResponseBuilder().with_message("카카오 회원가입에 실패했습니다.").with_errors(error.detail).build()
                 return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+            response = AuthResponseBuilder(user).with_message("회원가입 성공").build()
+            return Response(response, status=status.HTTP_200_OK)
             
         except ValueError as error:
             response = ErrorResponseBuilder().with_message("카카오 로그인에 실패했습니다.").with_errors({"error": str(error)}).build()
@@ -431,7 +477,7 @@ class KakaoAPIView(APIView):
 
 # Apple Sign In API
 class AppleAPIView(APIView):
-    @extend_schema(**AccountSchema.apple_auth())
+    @lazy_schema("accounts.schemas.AccountSchema.apple_auth")
     def post(self, request):
         pass
 
@@ -440,9 +486,10 @@ class AppleAPIView(APIView):
 # <-------------------------------------------------------------------------------------------------------------------------------->
 # PortOne API
 class PortOneAPIView(APIView):
+    authentication_classes = [FreshJWTAuthentication]     # Reads and writes the current account row
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(**AccountSchema.portone_verification())
+    @lazy_schema("accounts.schemas.AccountSchema.portone_verification")
     def post(self, request):
         identity_code = request.data.get("identity_code")
 
@@ -475,4 +522,20 @@ class PortOneAPIView(APIView):
 
         except Exception as error:
             response = ErrorResponseBuilder().with_message("본인인증에 실패했습니다.").with_errors({"error": str(error)}).build()
-            return Response(response, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+
+# JSON Web Key Set
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class JWKSAPIView(APIView):
+    """Public signing keys (RFC 7517) for verifying tokens without calling this app, e.g. with accounts.jwks.JWKSVerifier"""
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @lazy_schema(exclude=True)
+    def get(self, request):
+        keyring = get_keyring()
+        response = get_conditional_response(request, etag=keyring.etag) or Response(keyring.jwks)
+        response["ETag"] = keyring.etag
+        patch_cache_control(response, public=True, max_age=settings.JWKS_MAX_AGE)
+        return response
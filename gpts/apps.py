@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class GptsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'gpts'
+
+    def ready(self):
+        import gpts.signals
\ No newline at end of file
@@ -0,0 +1,13 @@
+# gpts/signals.py
+app_name = "gpts"
+
+from django.db.models.signals import post_save, post_delete
+
+from server.cache import invalidate_model_cache
+
+from .models import GPTPrompt
+
+# Cache Invalidation
+# <-------------------------------------------------------------------------------------------------------------------------------->
+post_save.connect(invalidate_model_cache, sender=GPTPrompt, dispatch_uid="invalidate_gpts_gptprompt_on_save")
+post_delete.connect(invalidate_model_cache, sender=GPTPrompt, dispatch_uid="invalidate_gpts_gptprompt_on_delete")
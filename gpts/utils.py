@@ -2,13 +2,19 @@
 app_name = "gpts"
 
 import json
-
-from openai import OpenAI
+import functools
 
 from django.conf import settings
 
 from .models import GPTPrompt, GPTChatMessage
 
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    # openai takes ~0.6s to import, so it is loaded on the first GPT request instead of at worker boot
+    from openai import OpenAI
+    return OpenAI(api_key=settings.OPENAI_API_KEY)
+
+
 class GPTService:
     SUMMARY_TRIGGER_TOKENS = 3000
     SUMMARY_TARGET_TOKENS = 800
@@ -16,7 +22,7 @@ class GPTService:
 
     def __init__(self, chat_room):
         self.chat_room = chat_room
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
 
     def _maybe_update_summary(self):
         last = self.chat_room.last_summarized_message
@@ -193,7 +199,7 @@ class GPTService:
 
 class GPTSessionService:
     def __init__(self, model="gpt-4o-mini", prompt: GPTPrompt = None):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
         self.model = model
         self.prompt = prompt
 
@@ -8,19 +8,23 @@ from rest_framework import status
 from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 
-from drf_spectacular.utils import extend_schema
-
+from server.schemas import lazy_schema
 from server.utils import SuccessResponseBuilder, ErrorResponseBuilder
+from server.cache import cached_view
+from server.conditional import conditional_view, model_version
+from server.routers import replica_read
 
 from .models import GPTPrompt, GPTChatRoom, GPTChatMessage
 from .paginations import GPTChatMessagePagination
 from .permissions import IsAuthenticated, IsGPTChatRoomOwner
 from .serializers import GPTPromptSerializer, GPTChatRoomSerializer, GPTChatMessageSerializer
-from .schemas import GPTSchema
 from .utils import GPTService, GPTSessionService
 
 class GPTPromptAPIView(APIView):
-    @extend_schema(**GPTSchema.get_gpt_prompts())
+    @lazy_schema("gpts.schemas.GPTSchema.get_gpt_prompts")
+    @conditional_view(model_version(GPTPrompt))
+    @cached_view(tags=[GPTPrompt])
+    @replica_read
     def get(self, request):
         gpt_prompts = GPTPrompt.objects.filter(is_active=True)
         serializer = GPTPromptSerializer(gpt_prompts, many=True)
@@ -31,14 +35,14 @@ class GPTPromptAPIView(APIView):
 class GPTChatRoomAPIView(APIView):
     permission_classes = [IsAuthenticated]
     
-    @extend_schema(**GPTSchema.get_gpt_chat_rooms())
+    @lazy_schema("gpts.schemas.GPTSchema.get_gpt_chat_rooms")
     def get(self, request):
         gpt_chat_rooms = GPTChatRoom.objects.filter(user=request.user, is_active=True)
         serializer = GPTChatRoomSerializer(gpt_chat_rooms, many=True)
         response = SuccessResponseBuilder().with_message("GPT 채팅방 조회 성공").with_data({"gpt_chat_rooms": serializer.data}).build()
         return Response(response, status=status.HTTP_200_OK)
 
-    @extend_schema(**GPTSchema.create_gpt_chat_room())
+    @lazy_schema("gpts.schemas.GPTSchema.create_gpt_chat_room")
     def post(self, request):
         serializer = GPTChatRoomSerializer(data=request.data)
         if serializer.is_valid():
@@ -53,7 +57,7 @@ class GPTChatRoomAPIView(APIView):
 class GPTChatRoomDetailAPIView(APIView):
     permission_classes = [IsGPTChatRoomOwner]
 
-    @extend_schema(**GPTSchema.get_gpt_chat_room_detail())
+    @lazy_schema("gpts.schemas.GPTSchema.get_gpt_chat_room_detail")
     def get(self, request, gpt_chat_room_id):
         gpt_chat_room = get_object_or_404(GPTChatRoom, id=gpt_chat_room_id, is_active=True)
         self.check_object_permissions(request, gpt_chat_room)
@@ -61,7 +65,7 @@ class GPTChatRoomDetailAPIView(APIView):
         response = SuccessResponseBuilder().with_message("GPT 채팅방 상세 조회 성공").with_data({"gpt_chat_room": serializer.data}).build()
         return Response(response, status=status.HTTP_200_OK)
 
-    @extend_schema(**GPTSchema.update_gpt_chat_room())
+    @lazy_schema("gpts.schemas.GPTSchema.update_gpt_chat_room")
     def put(self, request, gpt_chat_room_id):
         gpt_chat_room = get_object_or_404(GPTChatRoom, id=gpt_chat_room_id, is_active=True)
         self.check_object_permissions(request, gpt_chat_room)
@@ -74,7 +78,7 @@ class GPTChatRoomDetailAPIView(APIView):
             response = ErrorResponseBuilder().with_message("GPT 채팅방 수정 실패").with_errors(serializer.errors).build()
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
-    @extend_schema(**GPTSchema.delete_gpt_chat_room())
+    @lazy_schema("gpts.schemas.GPTSchema.delete_gpt_chat_room")
     def delete(self, request, gpt_chat_room_id):
         gpt_chat_room = get_object_or_404(GPTChatRoom, id=gpt_chat_room_id, is_active=True)
         self.check_object_permissions(request, gpt_chat_room)
@@ -87,7 +91,8 @@ class GPTChatMessageAPIView(APIView):
     permission_classes = [IsGPTChatRoomOwner]
     pagination_class = GPTChatMessagePagination
 
-    @extend_schema(**GPTSchema.get_gpt_chat_message_detail())
+    @lazy_schema("gpts.schemas.GPTSchema.get_gpt_chat_message_detail")
+    @replica_read
     def get(self, request, gpt_chat_room_id):
         gpt_chat_room = get_object_or_404(GPTChatRoom, id=gpt_chat_room_id, is_active=True)
         self.check_object_permissions(request, gpt_chat_room)
@@ -108,7 +113,7 @@ class GPTChatMessageAPIView(APIView):
             response = SuccessResponseBuilder().with_message("GPT 채팅메시지 조회 성공").with_data({"gpt_chat_messages": serializer.data}).build()
         return Response(response, status=status.HTTP_200_OK)
 
-    @extend_schema(**GPTSchema.create_gpt_chat_message())
+    @lazy_schema("gpts.schemas.GPTSchema.create_gpt_chat_message")
     def post(self, request, gpt_chat_room_id):
         gpt_chat_room = get_object_or_404(GPTChatRoom, id=gpt_chat_room_id, is_active=True)
         self.check_object_permissions(request, gpt_chat_room)
@@ -129,7 +134,7 @@ class GPTChatMessageAPIView(APIView):
 class GPTStartAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(**GPTSchema.start_gpt())
+    @lazy_schema("gpts.schemas.GPTSchema.start_gpt")
     def post(self, request):
         prompt_id = request.data.get("prompt")
         message = request.data.get("message")
@@ -152,7 +157,7 @@ class GPTStartAPIView(APIView):
 class GPTSessionAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(**GPTSchema.get_gpt_session())
+    @lazy_schema("gpts.schemas.GPTSchema.get_gpt_session")
     def post(self, request):
         prompt_id = request.data.get("prompt")
         message = request.data.get("message")
@@ -2,14 +2,15 @@
 app_name = "payments"
 
 from django.db.models.signals import post_save
-from django.dispatch import receiver
 
 from .models import Billing
 from .utils import inactivate_billing
 
 # Billing
 # <-------------------------------------------------------------------------------------------------------------------------------->
-@receiver(post_save, sender=Billing)
 def inactivate_billing_key(sender, instance, **kwargs):
     if instance.is_active == False:
-        inactivate_billing(instance)
\ No newline at end of file
+        inactivate_billing(instance)
+
+
+post_save.connect(inactivate_billing_key, sender=Billing, dispatch_uid="inactivate_payments_billing_key_on_save")
@@ -2,14 +2,16 @@
 app_name = 'payments'
 
 import uuid
-import requests
 from datetime import datetime
 
 from django.utils import timezone as django_timezone
 
 from server.settings.base import TOSS_API_SECRET_BASE64, PORTONE_API_SECRET
+from server.utils import lazy_import
 from .models import Billing, Payment
 
+requests = lazy_import("requests")
+
 # Billing
 def create_toss_billing(user, auth_key, customer_key):
     url = "https://api.tosspayments.com/v1/billing/authorizations/issue"
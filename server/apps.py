@@ -0,0 +1,9 @@
+# server/apps.py
+app_name = "server"
+
+from django.apps import AppConfig
+
+
+class ServerConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'server'
@@ -0,0 +1,143 @@
+# server/cache.py
+app_name = "server"
+
+import math
+import time
+import random
+import functools
+
+from rest_framework.response import Response
+
+from django.core.cache import cache
+
+# Keys
+# <-------------------------------------------------------------------------------------------------------------------------------->
+# Global versioning is handled by CACHES['default']['VERSION'] (CACHE_VERSION); tag versions scope individual entries.
+def make_key(*parts):
+    return ":".join(str(part) for part in parts)
+
+
+def tag_name(tag):
+    # Model classes are tagged by their label, e.g. services.notice
+    if hasattr(tag, "_meta"):
+        return tag._meta.label_lower
+    return str(tag)
+
+
+def get_tag_versions(tags):
+    keys = [make_key("tag", tag_name(tag)) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [str(versions[key]) for key in keys]
+
+
+def invalidate_tags(*tags):
+    for tag in tags:
+        key = make_key("tag", tag_name(tag))
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+def invalidate_model_cache(sender, **kwargs):
+    # post_save / post_delete receiver
+    invalidate_tags(sender)
+
+
+def versioned_key(key, tags=()):
+    if not tags:
+        return key
+    return make_key(key, *get_tag_versions(tags))
+
+
+# Cache Aside
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def get_or_set(key, compute, timeout=300, tags=(), lock_timeout=10, beta=1.0, wait_timeout=2):
+    """
+    Stampede-safe cache-aside.
+    Entries are stored as (value, expires_at, compute_time) so that a single caller can recompute early
+    (probabilistic early expiration) while the others keep serving the cached value.
+    A cold miss is computed once per key; concurrent callers wait up to wait_timeout seconds for the result (single flight).
+    """
+    full_key = versioned_key(key, tags)
+    lock_key = make_key("lock", full_key)
+
+    entry = cache.get(full_key)
+    if entry is not None:
+        value, expires_at, delta = entry
+        if time.time() - delta * beta * math.log(1.0 - random.random()) < expires_at:
+            return value
+        if not cache.add(lock_key, 1, lock_timeout):
+            return value
+        owner = True
+
+    else:
+        owner = cache.add(lock_key, 1, lock_timeout)
+        if not owner:
+            deadline = time.monotonic() + wait_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                entry = cache.get(full_key)
+                if entry is not None:
+                    return entry[0]
+                if cache.get(lock_key) is None:
+                    # The holder finished without writing (it raised, e.g. UncacheableResponse): compute here
+                    entry = cache.get(full_key)
+                    if entry is not None:
+                        return entry[0]
+                    owner = cache.add(lock_key, 1, lock_timeout)
+                    break
+
+    try:
+        start = time.time()
+        value = compute()
+        delta = time.time() - start
+        cache.set(full_key, (value, start + timeout, delta), timeout)
+        return value
+    finally:
+        if owner:       # Never release a lock held by another caller
+            cache.delete(lock_key)
+
+
+# Cached View
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class UncacheableResponse(Exception):
+    def __init__(self, response):
+        self.response = response
+
+
+def cached_view(timeout=300, tags=(), per_user=False):
+    """
+    APIView 메서드용 캐시 데코레이터. 200 응답의 data, status, 뷰가 설정한 헤더를 캐시한다.
+    쿠키를 설정한 응답과 200 이외의 응답은 캐시하지 않는다.
+    per_user=True 이면 JWT 인증 사용자별로 키를 분리한다.
+    """
+    def decorator(view_method):
+        @functools.wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            key = make_key("view", type(view).__qualname__, request.method, request.get_full_path())
+            if per_user:
+                key = make_key(key, "user", request.user.pk if request.user.is_authenticated else "anonymous")
+
+            def compute():
+                response = view_method(view, request, *args, **kwargs)
+                if response.status_code != 200 or response.cookies:
+                    raise UncacheableResponse(response)
+                return response.data, response.status_code, list(response.items())
+
+            try:
+                data, status, headers = get_or_set(key, compute, timeout=timeout, tags=tags)
+            except UncacheableResponse as error:
+                return error.response
+
+            response = Response(data, status=status)
+            for header, value in headers:
+                response[header] = value
+            return response
+
+        return wrapper
+    return decorator
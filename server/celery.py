@@ -2,9 +2,53 @@
 
 import os
 from celery import Celery
+from celery.signals import worker_process_shutdown
+from kombu import Queue
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings.dev')  # dev or deploy
 
 app = Celery('server')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
+
+
+# Queues & Routing
+# <-------------------------------------------------------------------------------------------------------------------------------->
+# Separate queues so that slow LLM jobs cannot starve verification emails
+QUEUES = ('default', 'email', 'payments', 'llm', 'maintenance')
+
+app.conf.task_queues = tuple(Queue(name, routing_key=name) for name in QUEUES)
+app.conf.task_default_queue = 'default'
+app.conf.task_routes = {
+    'accounts.tasks.send_verification_*': {'queue': 'email'},
+    'accounts.tasks.sweep_*': {'queue': 'maintenance'},
+    'payments.tasks.*': {'queue': 'payments'},
+    'gpts.tasks.*': {'queue': 'llm'},
+    'server.tasks.*': {'queue': 'maintenance'},
+}
+
+
+# Worker Profiles
+# <-------------------------------------------------------------------------------------------------------------------------------->
+# CELERY_WORKER_PROFILE=email celery -A server worker
+# A profiled worker consumes only its queue; command line options (-c, --prefetch-multiplier) still take precedence.
+WORKER_PROFILES = {
+    'default': {'concurrency': 4, 'prefetch_multiplier': 4},
+    'email': {'concurrency': 8, 'prefetch_multiplier': 4},          # Short, I/O bound
+    'payments': {'concurrency': 4, 'prefetch_multiplier': 1},
+    'llm': {'concurrency': 4, 'prefetch_multiplier': 1},            # Long running: never reserve tasks ahead
+    'maintenance': {'concurrency': 1, 'prefetch_multiplier': 1},
+}
+
+WORKER_PROFILE = os.getenv('CELERY_WORKER_PROFILE')
+if WORKER_PROFILE:
+    profile = WORKER_PROFILES[WORKER_PROFILE]
+    app.conf.task_queues = (Queue(WORKER_PROFILE, routing_key=WORKER_PROFILE),)
+    app.conf.worker_concurrency = profile['concurrency']
+    app.conf.worker_prefetch_multiplier = profile['prefetch_multiplier']
+
+
+@worker_process_shutdown.connect
+def close_email_connections(**kwargs):
+    from server.mail import pool
+    pool.close()
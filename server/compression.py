@@ -0,0 +1,78 @@
+# server/compression.py
+app_name = "server"
+
+import gzip
+import zlib
+
+try:
+    import brotli
+except ImportError:     # Optional: gzip only
+    brotli = None
+
+# Content Negotiation
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def accepted_encodings(accept_encoding):
+    # 'br;q=1.0, gzip;q=0.8, *;q=0' -> {'br', 'gzip'}
+    encodings = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        params = params.strip()
+        quality = params[2:] if params.startswith("q=") else "1"
+        try:
+            if float(quality) > 0:
+                encodings.add(coding.strip().lower())
+        except ValueError:
+            continue
+    return encodings
+
+
+def choose_encoding(accept_encoding, available=("br", "gzip")):
+    encodings = accepted_encodings(accept_encoding or "")
+    for encoding in available:
+        if encoding == "br" and brotli is None:
+            continue
+        if encoding in encodings:
+            return encoding
+    return None
+
+
+# Compressors
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def compress(content, encoding, gzip_level=6, brotli_quality=5):
+    if encoding == "br":
+        return brotli.compress(content, quality=brotli_quality)
+    return gzip.compress(content, compresslevel=gzip_level, mtime=0)
+
+
+class StreamCompressor:
+    """Incremental compressor; every chunk is flushed so streamed output reaches the client without buffering"""
+
+    def __init__(self, encoding, gzip_level=6, brotli_quality=5):
+        if encoding == "br":
+            self.compressor = brotli.Compressor(quality=brotli_quality)
+            self._compress, self._flush, self._finish = self.compressor.process, self.compressor.flush, self.compressor.finish
+        else:
+            # wbits 16 + MAX_WBITS writes a gzip header and trailer
+            self.compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress, self._finish = self.compressor.compress, self.compressor.flush
+            self._flush = lambda: self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def compress(self, chunk):
+        return self._compress(chunk) + self._flush()
+
+    def finish(self):
+        return self._finish()
+
+    def iter(self, chunks):
+        for chunk in chunks:
+            data = self.compress(chunk)
+            if data:
+                yield data
+        yield self.finish()
+
+    async def aiter(self, chunks):
+        async for chunk in chunks:
+            data = self.compress(chunk)
+            if data:
+                yield data
+        yield self.finish()
@@ -0,0 +1,74 @@
+# server/conditional.py
+app_name = "server"
+
+import hashlib
+import functools
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .cache import get_tag_versions
+
+# Validators
+# <-------------------------------------------------------------------------------------------------------------------------------->
+# A validator returns (etag, last_modified) without rendering the response body.
+def make_etag(*parts):
+    # Weak: equal payloads, not byte-identical ones. CACHE_VERSION changes the ETag when the serialized shape changes on deploy.
+    digest = hashlib.md5(":".join(str(part) for part in (settings.CACHE_VERSION, *parts)).encode(), usedforsecurity=False)
+    return "W/" + quote_etag(digest.hexdigest())
+
+
+def model_version(*models):
+    """Stored tag version counters (server.cache, bumped by post_save / post_delete) — no DB query"""
+    def validator(request, *args, **kwargs):
+        return make_etag(request.get_full_path(), *get_tag_versions(models)), None
+    return validator
+
+
+def queryset_version(get_queryset, fields=("modified_at",)):
+    """
+    One aggregate query: count + max(field) for each field, e.g. 'referrer__modified_at' for nested data.
+    get_queryset receives the view arguments: get_queryset(request, *args, **kwargs)
+    """
+    def validator(request, *args, **kwargs):
+        aggregates = {f"max_{index}": Max(field) for index, field in enumerate(fields)}
+        result = get_queryset(request, *args, **kwargs).order_by().aggregate(count=Count("pk"), **aggregates)
+
+        timestamps = [result[name] for name in aggregates if result[name] is not None]
+        last_modified = max(timestamps) if timestamps else None
+        etag = make_etag(request.get_full_path(), result["count"], *(result[name] for name in aggregates))
+        return etag, last_modified
+    return validator
+
+
+# Conditional View
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def conditional_view(validator, private=False):
+    """
+    APIView GET 메서드용 조건부 요청 데코레이터.
+    If-None-Match / If-Modified-Since 가 일치하면 뷰(쿼리, serializer)를 실행하지 않고 304 를 반환한다.
+    private=True 는 사용자별 응답 (공유 캐시 금지).
+    """
+    def decorator(view_method):
+        @functools.wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            etag, last_modified = validator(request, *args, **kwargs)
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = view_method(view, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+            # Clients must revalidate instead of using heuristic freshness
+            patch_cache_control(response, no_cache=True, **({"private": True} if private else {"public": True}))
+            return response
+
+        return wrapper
+    return decorator
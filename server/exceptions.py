@@ -39,6 +39,9 @@ def custom_exception_handler(exc, context):
         elif isinstance(exc, (InvalidToken, TokenError)):
             message = "Token is invalid or expired."
             error_code = 401
+        elif response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
+            message = "Service temporarily unavailable."
+            error_code = 503
         else:
             message = "Server error occurred."
             error_code = response.status_code
@@ -50,7 +53,8 @@ def custom_exception_handler(exc, context):
             .with_errors(error_data) \
             .build()
         
-        return Response(error_response, status=response.status_code)
+        headers = {"Retry-After": response["Retry-After"]} if response.has_header("Retry-After") else None      # Throttled, 503s
+        return Response(error_response, status=response.status_code, headers=headers)
     
     # Django 예외 처리
     if isinstance(exc, DjangoPermissionDenied):
@@ -0,0 +1,72 @@
+# server/gunicorn_config.py
+# gunicorn -c server/gunicorn_config.py
+app_name = "server"
+
+import os
+
+# Loaded by path so that importing the server package (celery.py defaults to dev) cannot pick the settings first
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings.deploy')
+
+from django.db import connections
+
+# Worker model
+# <-------------------------------------------------------------------------------------------------------------------------------->
+# sync    : one request per process, for CPU bound workloads. SSE streams pin a whole worker.
+# gthread : threads per process, I/O bound views and SSE streams share a worker (default).
+# uvicorn : ASGI event loop (server.asgi), sync views run in a thread pool.
+WORKER_CLASS = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+CPU_COUNT = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+
+bind = f"0.0.0.0:{os.getenv('PORT', 80)}"
+
+if WORKER_CLASS == 'uvicorn':
+    wsgi_app = 'server.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+    workers = int(os.getenv('GUNICORN_WORKERS', CPU_COUNT + 1))
+    timeout = 30
+
+elif WORKER_CLASS == 'sync':
+    wsgi_app = 'server.wsgi.deploy:application'
+    worker_class = 'sync'
+    workers = int(os.getenv('GUNICORN_WORKERS', CPU_COUNT * 2 + 1))
+    timeout = 120       # a sync worker cannot heartbeat while it streams
+
+else:
+    wsgi_app = 'server.wsgi.deploy:application'
+    worker_class = 'gthread'
+    workers = int(os.getenv('GUNICORN_WORKERS', CPU_COUNT + 1))
+    threads = int(os.getenv('GUNICORN_THREADS', 8))
+    timeout = 30
+
+# Import Django once in the master and share the memory pages across forks
+preload_app = True
+
+# Recycle workers to bound memory growth; jitter keeps them from restarting together
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Give open SSE streams time to finish on reload / shutdown
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 60))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', timeout))
+keepalive = 5
+
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+accesslog = '-'
+errorlog = '-'
+
+
+# Hooks
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def post_fork(server, worker):
+    # Connections opened while preloading must not be shared between processes
+    connections.close_all()
+
+
+def worker_exit(server, worker):
+    # Write last_access values still buffered in this worker
+    from accounts.access import tracker
+    tracker.flush()
+
+    # Stop this worker's password hashing processes
+    from accounts.hashing import hashing_pool
+    hashing_pool.shutdown()
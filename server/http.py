@@ -0,0 +1,136 @@
+# server/http.py
+app_name = "server"
+
+import time
+import random
+import threading
+import http.cookiejar
+import urllib.parse
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+
+from .metrics import CacheCounter, Histogram
+from .utils import lazy_import
+
+requests = lazy_import("requests")
+urllib3 = lazy_import("urllib3")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class ProviderError(ValueError):
+    """The provider could not be reached or kept failing (ValueError: create_from_code callers already handle it)"""
+
+
+# Provider Client
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class ProviderClient:
+    """
+    외부 provider(OAuth, 본인인증) 호출용 HTTP 클라이언트. 프로세스당 하나의 requests.Session 을 공유하고,
+    HTTPAdapter 가 host 별 keep-alive 연결 풀(PROVIDER_POOL_SIZE)을 유지한다.
+    모든 요청에 connect / read timeout 을 적용하고, 멱등 요청(GET 등)만 jitter 를 둔 지수 backoff 로 재시도한다.
+    연결 자체가 실패한 경우는 요청이 전달되지 않았으므로 POST 도 재시도한다.
+
+        naver = ProviderClient("naver")
+        response = naver.get("https://openapi.naver.com/v1/nid/me", headers=headers)
+        response = await naver.aget(...)        # ASGI views (uvicorn worker)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.session = None
+        self.latency = Histogram(f"provider.{name}_ms")
+        self.retries = CacheCounter(f"provider.{name}.retries")
+        self.errors = CacheCounter(f"provider.{name}.errors")
+
+    def get_session(self):
+        if self.session is None:
+            with self.lock:
+                if self.session is None:
+                    session = requests.Session()
+                    # Retries are handled in request() so that each attempt is measured
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=settings.PROVIDER_POOL_SIZE, max_retries=0)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    # Shared by every user's request: never keep provider cookies
+                    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                    self.session = session
+        return self.session
+
+    def close(self):
+        with self.lock:
+            if self.session is not None:
+                self.session.close()
+                self.session = None
+
+    def resolve(self, url):
+        # PROVIDER_URL_OVERRIDE=http://127.0.0.1:8900 sends https://nid.naver.com/oauth2.0/token to http://127.0.0.1:8900/nid.naver.com/oauth2.0/token
+        override = settings.PROVIDER_URL_OVERRIDE
+        if not override:
+            return url
+        parts = urllib.parse.urlsplit(url)
+        return urllib.parse.urlunsplit(urllib.parse.urlsplit(f"{override.rstrip('/')}/{parts.netloc}{parts.path}")._replace(query=parts.query))
+
+    def backoff(self, attempt):
+        # Full jitter: concurrent callers retrying a failing provider do not arrive together
+        time.sleep(random.uniform(0, settings.PROVIDER_RETRY_BACKOFF * 2 ** attempt))
+
+    @staticmethod
+    def not_sent(error):
+        # No connection was established, so the provider never saw the request
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+    def request(self, method, url, idempotent=None, **kwargs):
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        kwargs.setdefault("timeout", (settings.PROVIDER_CONNECT_TIMEOUT, settings.PROVIDER_READ_TIMEOUT))
+        url = self.resolve(url)
+        session = self.get_session()
+
+        retries = settings.PROVIDER_RETRIES
+        for attempt in range(retries + 1):
+            start = time.perf_counter()
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
+                self.latency.observe((time.perf_counter() - start) * 1000)
+                if attempt < retries and (idempotent or self.not_sent(error)):
+                    self.retries.inc()
+                    self.backoff(attempt)
+                    continue
+                self.errors.inc()
+                raise ProviderError(f"{self.name} request failed: {error.__class__.__name__}") from error
+
+            self.latency.observe((time.perf_counter() - start) * 1000)
+            if idempotent and attempt < retries and response.status_code in RETRY_STATUSES:
+                response.close()
+                self.retries.inc()
+                self.backoff(attempt)
+                continue
+            if response.status_code >= 500:
+                self.errors.inc()
+            return response
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    # Async (ASGI views): the same pooled session, timeouts and retry policy, run off the event loop
+    async def arequest(self, method, url, idempotent=None, **kwargs):
+        return await sync_to_async(self.request, thread_sensitive=False)(method, url, idempotent=idempotent, **kwargs)
+
+    async def aget(self, url, **kwargs):
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url, **kwargs):
+        return await self.arequest("POST", url, **kwargs)
@@ -0,0 +1,173 @@
+# server/mail.py
+app_name = "server"
+
+import time
+import secrets
+import threading
+
+from email.utils import formatdate, make_msgid
+from smtplib import SMTPServerDisconnected
+
+from django.conf import settings
+from django.core.mail import get_connection, EmailMessage, EmailMultiAlternatives, DNS_NAME
+from django.template.loader import render_to_string
+from django.utils.html import escape
+
+from .metrics import Histogram
+
+send_latency = Histogram("email.send_ms")           # SMTP round trip per batch
+delivery_latency = Histogram("email.delivery_ms")   # Request (dispatch) to sent, including queue wait
+
+# Connection Pool
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class ConnectionPool:
+    """
+    Worker 프로세스(스레드)별 이메일 연결을 열어 둔 채 재사용한다.
+    EMAIL_CONNECTION_MAX_IDLE 동안 사용하지 않은 연결은 서버가 끊기 전에 다시 연다.
+    """
+
+    def __init__(self, max_idle=None):
+        self.max_idle = max_idle
+        self.local = threading.local()
+
+    def get(self):
+        connection = getattr(self.local, "connection", None)
+        max_idle = self.max_idle if self.max_idle is not None else settings.EMAIL_CONNECTION_MAX_IDLE
+        if connection is not None and time.monotonic() - self.local.last_used > max_idle:
+            self.close()
+            connection = None
+
+        if connection is None:
+            connection = get_connection(fail_silently=False)
+            connection.open()
+            self.local.connection = connection
+        self.local.last_used = time.monotonic()
+        return connection
+
+    def close(self):
+        connection = getattr(self.local, "connection", None)
+        self.local.connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def send_messages(self, messages):
+        start = time.perf_counter()
+        try:
+            sent = self.get().send_messages(messages)
+        except SMTPServerDisconnected:
+            # The server dropped the idle connection; reconnect once
+            self.close()
+            sent = self.get().send_messages(messages)
+        send_latency.observe((time.perf_counter() - start) * 1000)
+        return sent
+
+
+pool = ConnectionPool()
+
+
+# Prepared Templates
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class PreparedMIME:
+    """Stands in for email.message.Message in the mail backends: the MIME bytes are already built"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def as_bytes(self, linesep="\n"):
+        return self.data.replace(b"\n", linesep.encode()) if linesep != "\n" else self.data
+
+    def get_charset(self):
+        return None
+
+
+class PreparedEmailMessage(EmailMessage):
+    def __init__(self, data, **kwargs):
+        super().__init__(**kwargs)
+        self.data = data
+
+    def message(self):
+        return PreparedMIME(self.data)
+
+
+class EmailTemplate:
+    """
+    HTML 템플릿 렌더링과 MIME 인코딩을 worker 당 한 번만 수행하고, 결과 바이트를 자리표시자 기준으로 미리 분할한다.
+    발송 시에는 수신자, Date, Message-ID, fields 값만 이어 붙인다.
+    fields 는 템플릿에서 출력만 되어야 한다 ({% if %} 등 분기에 쓰이는 값은 미리 렌더링할 수 없음).
+    """
+
+    def __init__(self, subject, from_email, html_template, text, fields=()):
+        self.subject = subject
+        self.from_email = from_email
+        self.html_template = html_template
+        self.text = text                  # str.format template for the plain text part
+        self.fields = tuple(fields)
+        self.lock = threading.Lock()
+        self.pieces = None                # [bytes, (kind, name), bytes, ...] with kind header / text / html
+
+    def compile(self):
+        token = secrets.token_hex(8)
+        marker = lambda kind, name: f"@@{token}:{kind}:{name}@@"     # ASCII: survives HTML escaping and 8bit MIME unchanged
+
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.text.format(**{name: marker("text", name) for name in self.fields}),
+            from_email=self.from_email,
+            to=[marker("header", "to")],
+            headers={"Date": marker("header", "date"), "Message-ID": marker("header", "message_id")},
+        )
+        message.attach_alternative(render_to_string(self.html_template, {name: marker("html", name) for name in self.fields}), "text/html")
+        data = message.message().as_bytes().decode()
+
+        pieces = []
+        for index, part in enumerate(data.split(f"@@{token}:")):
+            if index > 0:
+                placeholder, _, part = part.partition("@@")
+                pieces.append(tuple(placeholder.split(":")))
+            pieces.append(part.encode())
+
+        # Every marker must survive encoding (a quoted-printable or base64 body would break them)
+        expected = {("header", "to"), ("header", "date"), ("header", "message_id")}
+        expected |= {(kind, name) for kind in ("text", "html") for name in self.fields}
+        if {piece for piece in pieces if isinstance(piece, tuple)} != expected:
+            return []
+        return pieces
+
+    def build(self, to, **values):
+        if self.pieces is None:
+            with self.lock:
+                if self.pieces is None:
+                    self.pieces = self.compile()
+
+        headers = {"to": to, "date": formatdate(localtime=settings.EMAIL_USE_LOCALTIME), "message_id": make_msgid(domain=DNS_NAME)}
+        if not self.pieces or not to.isascii() or any(character in to for character in "\r\n"):
+            return self.build_message(to, headers, **values)
+
+        data = b"".join(
+            piece if isinstance(piece, bytes) else self.render_value(piece, headers, values)
+            for piece in self.pieces
+        )
+        return PreparedEmailMessage(data, subject=self.subject, body=self.text.format(**values), from_email=self.from_email, to=[to])
+
+    def render_value(self, piece, headers, values):
+        kind, name = piece
+        if kind == "header":
+            return headers[name].encode()
+        if kind == "html":
+            return escape(values[name]).encode()
+        return str(values[name]).encode()
+
+    def build_message(self, to, headers, **values):
+        # Fallback: regular rendering for values the prepared bytes cannot carry
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.text.format(**values),
+            from_email=self.from_email,
+            to=[to],
+            headers={"Date": headers["date"], "Message-ID": headers["message_id"]},
+        )
+        message.attach_alternative(render_to_string(self.html_template, values), "text/html")
+        return message
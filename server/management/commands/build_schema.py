@@ -0,0 +1,21 @@
+# server/management/commands/build_schema.py
+app_name = "server"
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from server.openapi import build_schema_artifact
+
+
+class Command(BaseCommand):
+    help = "Build the gzipped OpenAPI schema served at /api/schema (OPENAPI_SCHEMA_FILE)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=None, help="Defaults to settings.OPENAPI_SCHEMA_FILE")
+
+    def handle(self, *args, **options):
+        output = options["output"] or settings.OPENAPI_SCHEMA_FILE
+        metadata = build_schema_artifact(output)
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {output} ({metadata['size']} bytes, etag {metadata['etag']}, urlconf {metadata['urlconf_hash']})"
+        ))
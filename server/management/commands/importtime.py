@@ -0,0 +1,44 @@
+# server/management/commands/importtime.py
+app_name = "server"
+
+import os
+import re
+import sys
+import subprocess
+
+from django.core.management.base import BaseCommand, CommandError
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+class Command(BaseCommand):
+    help = "Report module import times of a fresh worker (python -X importtime). Fails when --budget-ms is exceeded."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--module", default="server.urls", help="Module imported after django.setup() (server.urls loads every view)")
+        parser.add_argument("--top", type=int, default=20, help="Number of modules to list")
+        parser.add_argument("--budget-ms", type=float, default=None, help="Maximum total import time in milliseconds")
+
+    def handle(self, *args, **options):
+        code = f"import django; django.setup(); import {options['module']}"
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, env=os.environ.copy())
+        if result.returncode != 0:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+
+        modules = []
+        for line in result.stderr.splitlines():
+            match = LINE_PATTERN.match(line)
+            if match:
+                self_us, cumulative_us, indent, name = match.groups()
+                modules.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+
+        total_ms = sum(self_us for _, self_us, _, _ in modules) / 1000
+        top_level = sorted((module for module in modules if module[3] <= 1), key=lambda module: module[2], reverse=True)
+
+        self.stdout.write(f"{'cumulative (ms)':>16}  {'self (ms)':>10}  module")
+        for name, self_us, cumulative_us, depth in top_level[:options["top"]]:
+            self.stdout.write(f"{cumulative_us / 1000:>16.1f}  {self_us / 1000:>10.1f}  {'  ' * depth}{name}")
+        self.stdout.write(f"Total: {total_ms:.1f} ms across {len(modules)} modules")
+
+        if options["budget_ms"] is not None and total_ms > options["budget_ms"]:
+            raise CommandError(f"Import time {total_ms:.1f} ms exceeds the budget of {options['budget_ms']:.1f} ms")
@@ -0,0 +1,203 @@
+# server/metrics.py
+app_name = "server"
+
+import re
+import time
+import threading
+
+from collections import Counter, deque
+
+from django.core.cache import cache
+
+IN_CLAUSE_PATTERN = re.compile(r"\((?:%s, )+%s\)")
+
+
+# Query Collector
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class QueryCollector:
+    """connection.execute_wrapper 로 등록되어 요청 단위 쿼리 수와 DB 시간을 수집"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.statements[IN_CLAUSE_PATTERN.sub("(...)", sql)] += 1
+
+    @property
+    def duration_ms(self):
+        return self.duration * 1000
+
+    def repeated_statements(self, threshold):
+        return [(sql, count) for sql, count in self.statements.most_common() if count > threshold]
+
+
+# Metrics Registry
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class MetricsRegistry:
+    """요청 기록을 고정 크기 링 버퍼에 보관하고, 조회 시점에 뷰별 집계를 계산"""
+
+    def __init__(self, size=1000):
+        self.lock = threading.Lock()
+        self.records = deque(maxlen=size)
+
+    def resize(self, size):
+        with self.lock:
+            if self.records.maxlen != size:
+                self.records = deque(self.records, maxlen=size)
+
+    def record_request(self, **record):
+        record.setdefault("timestamp", time.time())
+        with self.lock:
+            self.records.append(record)
+
+    def recent(self):
+        with self.lock:
+            return list(self.records)
+
+    def slow_requests(self, threshold_ms, limit=50):
+        records = [record for record in self.recent() if record["duration_ms"] >= threshold_ms or record["n_plus_one"]]
+        records.sort(key=lambda record: record["duration_ms"], reverse=True)
+        return records[:limit]
+
+    def aggregate(self):
+        views = {}
+        for record in self.recent():
+            views.setdefault(record["view"], []).append(record)
+
+        aggregates = {}
+        for view, records in views.items():
+            durations = sorted(record["duration_ms"] for record in records)
+            count = len(records)
+            aggregates[view] = {
+                "count": count,
+                "avg_ms": round(sum(durations) / count, 2),
+                "p95_ms": round(durations[min(count - 1, int(count * 0.95))], 2),
+                "max_ms": round(durations[-1], 2),
+                "avg_queries": round(sum(record["queries"] for record in records) / count, 2),
+                "avg_db_ms": round(sum(record["db_ms"] for record in records) / count, 2),
+                "n_plus_one": sum(1 for record in records if record["n_plus_one"]),
+                "errors": sum(1 for record in records if record["status"] >= 500),
+            }
+        return aggregates
+
+    def clear(self):
+        with self.lock:
+            self.records.clear()
+
+
+registry = MetricsRegistry()
+
+
+# Counters & Histograms
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def cache_incr(key, delta=1):
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        if cache.add(key, delta, None):
+            return delta
+        return cache.incr(key, delta)
+
+
+class CacheCounter:
+    """캐시(Redis)에 저장되는 누적 카운터. 웹 / worker 프로세스 전체 합계가 /metrics 에서 조회된다."""
+
+    def __init__(self, name):
+        self.name = name
+        self.key = f"metrics:counter:{name}"
+        counters[name] = self
+
+    def inc(self, delta=1):
+        cache_incr(self.key, delta)
+
+    def value(self):
+        return cache.get(self.key, 0)
+
+    def clear(self):
+        cache.delete(self.key)
+
+
+class Histogram:
+    """
+    캐시(Redis)에 저장되는 고정 버킷 히스토그램. Celery worker 에서 기록한 값도 웹 프로세스의 /metrics 에서 조회된다.
+    값은 ms 단위이며 bucket 별 개수, 전체 개수와 합계만 저장한다.
+    """
+
+    DEFAULT_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self, name, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.buckets = tuple(buckets)
+        histograms[name] = self
+
+    def key(self, suffix):
+        return f"metrics:histogram:{self.name}:{suffix}"
+
+    def observe(self, value_ms):
+        for suffix, delta in self.deltas(value_ms):
+            cache_incr(self.key(suffix), delta)
+
+    def deltas(self, value_ms):
+        bucket = next((bound for bound in self.buckets if value_ms <= bound), "inf")
+        return ((f"le:{bucket}", 1), ("count", 1), ("sum", int(value_ms)))
+
+    def suffixes(self):
+        return [f"le:{bound}" for bound in [*self.buckets, "inf"]] + ["count", "sum"]
+
+    def values(self):
+        values = cache.get_many([self.key(suffix) for suffix in self.suffixes()])
+        return {suffix: values.get(self.key(suffix), 0) for suffix in self.suffixes()}
+
+    def snapshot(self):
+        values = self.values()
+        count = values["count"]
+
+        cumulative, buckets = 0, {}
+        for bound in [*self.buckets, "inf"]:
+            cumulative += values[f"le:{bound}"]
+            buckets[f"le_{bound}"] = cumulative
+        return {
+            "count": count,
+            "avg_ms": round(values["sum"] / count, 2) if count else None,
+            "buckets": buckets,
+        }
+
+    def clear(self):
+        cache.delete_many([self.key(suffix) for suffix in self.suffixes()])
+
+
+class ProcessHistogram(Histogram):
+    """
+    Histogram 과 같은 버킷을 프로세스 메모리에 기록한다. 요청마다 기록되는 hot path 용으로 캐시 왕복이 없다.
+    /metrics 에는 응답한 프로세스의 값만 보인다 (MetricsRegistry 와 같음).
+    """
+
+    def __init__(self, name, buckets=Histogram.DEFAULT_BUCKETS):
+        super().__init__(name, buckets)
+        self.lock = threading.Lock()
+        self.counts = Counter()
+
+    def observe(self, value_ms):
+        with self.lock:
+            for suffix, delta in self.deltas(value_ms):
+                self.counts[suffix] += delta
+
+    def values(self):
+        with self.lock:
+            return {suffix: self.counts[suffix] for suffix in self.suffixes()}
+
+    def clear(self):
+        with self.lock:
+            self.counts.clear()
+
+
+counters = {}
+histograms = {}
@@ -0,0 +1,196 @@
+# server/middleware.py
+app_name = "server"
+
+import time
+import random
+import logging
+import threading
+
+from contextlib import ExitStack
+
+from rest_framework.exceptions import AuthenticationFailed
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+
+from accounts.authentication import StatelessJWTAuthentication
+
+from .metrics import QueryCollector, registry
+from .profiling import StackSampler, ProfileStore
+from .routers import replica_configured, track_writes, mark_primary_sticky
+from .compression import choose_encoding, compress, StreamCompressor
+
+logger = logging.getLogger(__name__)
+
+
+def get_view_name(request):
+    # e.g. accounts:AccountAPIView.post
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+
+    view = getattr(match.func, "view_class", None) or getattr(match.func, "cls", None)
+    name = view.__name__ if view else match.func.__name__
+    if match.namespace:
+        name = f"{match.namespace}:{name}"
+    return f"{name}.{request.method.lower()}"
+
+
+# Performance Middleware
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class PerformanceMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.PERFORMANCE_SAMPLE_RATE
+        self.n_plus_one_threshold = settings.PERFORMANCE_N_PLUS_ONE_THRESHOLD
+        registry.resize(settings.PERFORMANCE_BUFFER_SIZE)
+
+    def __call__(self, request):
+        # Sampling disabled or not sampled: no wrappers, no timers
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        collector = QueryCollector()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(collector))
+
+            start = time.perf_counter()
+            response = self.get_response(request)
+            duration_ms = (time.perf_counter() - start) * 1000
+
+        view_name = get_view_name(request)
+        repeated = collector.repeated_statements(self.n_plus_one_threshold)
+        if repeated:
+            logger.warning("Possible N+1 in %s: %d x %s", view_name, repeated[0][1], repeated[0][0])
+
+        registry.record_request(
+            view=view_name,
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+            duration_ms=round(duration_ms, 2),
+            queries=collector.count,
+            db_ms=round(collector.duration_ms, 2),
+            n_plus_one=[{"sql": sql, "count": count} for sql, count in repeated[:3]],
+        )
+        return response
+
+
+# Profiling Middleware
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.header = settings.PROFILING_HEADER
+        self.interval = settings.PROFILING_INTERVAL
+        self.store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        # Streaming responses (SSE) are only profiled until the response object is returned
+        with StackSampler(threading.get_ident(), self.interval) as sampler:
+            start = time.perf_counter()
+            response = self.get_response(request)
+            duration_ms = (time.perf_counter() - start) * 1000
+
+        match = getattr(request, "resolver_match", None)
+        url_name = match.view_name if match else "unresolved"
+        path = self.store.save(url_name, sampler, duration_ms)
+        response["X-Profile-Id"] = f"{path.parent.name}/{path.name}"
+        return response
+
+    def should_profile(self, request):
+        if self.header in request.META:
+            return self.is_staff(request)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def is_staff(self, request):
+        # Claims-based user: the staff check adds no User query to the profiled request
+        try:
+            result = StatelessJWTAuthentication().authenticate(request)
+        except AuthenticationFailed:
+            return False
+        return result is not None and result[0].is_staff
+
+
+# Replica Stickiness Middleware
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class ReplicaStickinessMiddleware:
+    """After a request that wrote to the primary, keep the user's reads on the primary for a short window"""
+
+    def __init__(self, get_response):
+        if not replica_configured():
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with track_writes() as tracker:
+            response = self.get_response(request)
+
+        # DRF assigns the JWT user back onto the Django request during authentication
+        user = getattr(request, "user", None)
+        if tracker["written"] and user is not None and user.is_authenticated:
+            mark_primary_sticky(user.pk)
+        return response
+
+
+# Compression Middleware
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class CompressionMiddleware:
+    """
+    Brotli (설치된 경우) / gzip 응답 압축. COMPRESSION_CONTENT_TYPES 의 응답 중 COMPRESSION_MIN_SIZE 이상만 압축한다.
+    스트리밍 응답은 청크 단위로 압축하며, text/event-stream (SSE) 은 압축하지 않는다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+        self.content_types = tuple(settings.COMPRESSION_CONTENT_TYPES)
+        self.options = {"gzip_level": settings.COMPRESSION_GZIP_LEVEL, "brotli_quality": settings.COMPRESSION_BROTLI_QUALITY}
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self.is_compressible(response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request.headers.get("Accept-Encoding"))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            compressor = StreamCompressor(encoding, **self.options)
+            if response.is_async:
+                response.streaming_content = compressor.aiter(response.streaming_content)
+            else:
+                response.streaming_content = compressor.iter(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            if len(response.content) < self.min_size:
+                return response
+            content = compress(response.content, encoding, **self.options)
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response.headers["Content-Length"] = str(len(content))
+
+        # The body is no longer byte-identical to the uncompressed representation
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def is_compressible(self, response):
+        if response.status_code != 200 or response.has_header("Content-Encoding"):
+            return False
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type == "text/event-stream":
+            return False
+        return content_type.startswith(self.content_types)
@@ -0,0 +1,112 @@
+# server/openapi.py
+app_name = "server"
+
+import gzip
+import json
+import hashlib
+import functools
+
+from pathlib import Path
+
+from django.conf import settings
+from django.urls import URLPattern, URLResolver, get_resolver
+
+# URLconf Version
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def iter_url_patterns(patterns, prefix=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_url_patterns(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern):
+            yield prefix + str(pattern.pattern), pattern
+
+
+@functools.lru_cache(maxsize=1)
+def urlconf_hash():
+    """
+    URL 패턴, 뷰 클래스, HTTP 메서드, @lazy_schema factory 로 계산한 URLconf 버전.
+    URLconf 는 프로세스 수명 동안 바뀌지 않으므로 한 번만 계산한다.
+    """
+    digest = hashlib.sha256()
+    for route, pattern in iter_url_patterns(get_resolver().url_patterns):
+        callback = pattern.callback
+        view = getattr(callback, "view_class", None) or getattr(callback, "cls", None)
+        digest.update(f"{route}|{pattern.name}|{callback.__module__}.{getattr(view, '__qualname__', callback.__name__)}".encode())
+
+        for method in getattr(view, "http_method_names", ()):
+            view_method = getattr(view, method, None)
+            if view_method is None or method == "options":
+                continue
+            lazy = getattr(view_method, "lazy_schema", None)
+            digest.update(f"|{method}:{lazy[0] if lazy else ''}:{sorted(lazy[1]) if lazy else ''}".encode())
+    return digest.hexdigest()[:16]
+
+
+# Schema Artifact
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def metadata_path(path):
+    return Path(f"{path}.meta.json")
+
+
+def generate_schema():
+    from drf_spectacular.generators import SchemaGenerator
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+    return OpenApiJsonRenderer().render(schema, renderer_context={})
+
+
+def build_schema_artifact(path=None):
+    """OpenAPI JSON 을 gzip 으로 저장하고 ETag / URLconf 버전을 옆의 .meta.json 에 기록"""
+    path = Path(path or settings.OPENAPI_SCHEMA_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    content = generate_schema()
+    metadata = {
+        "etag": f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+        "urlconf_hash": urlconf_hash(),
+        "size": len(content),
+    }
+    path.write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+    metadata_path(path).write_text(json.dumps(metadata))
+    return metadata
+
+
+class SchemaArtifact:
+    def __init__(self, compressed, etag, urlconf_hash):
+        self.compressed = compressed
+        self.etag = etag
+        self.urlconf_hash = urlconf_hash
+
+    @functools.cached_property
+    def content(self):
+        return gzip.decompress(self.compressed)
+
+
+_artifacts = {}
+
+
+def load_schema_artifact(path=None):
+    """
+    빌드된 스키마를 읽는다. 파일이 없거나 URLconf 버전이 다르면 None.
+    파일 mtime 기준으로 프로세스 메모리에 캐시한다.
+    """
+    path = Path(path or settings.OPENAPI_SCHEMA_FILE)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _artifacts.get(path)
+    if cached is None or cached[0] != mtime:
+        try:
+            metadata = json.loads(metadata_path(path).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        cached = (mtime, SchemaArtifact(path.read_bytes(), metadata["etag"], metadata["urlconf_hash"]))
+        _artifacts[path] = cached
+
+    artifact = cached[1]
+    if artifact.urlconf_hash != urlconf_hash():
+        return None
+    return artifact
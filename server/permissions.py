@@ -0,0 +1,4 @@
+# server/permissions.py
+app_name = "server"
+
+from rest_framework.permissions import IsAdminUser
@@ -0,0 +1,86 @@
+# server/profiling.py
+app_name = "server"
+
+import os
+import re
+import sys
+import time
+import uuid
+import threading
+
+from collections import Counter
+from pathlib import Path
+
+# Stack Sampler
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class StackSampler:
+    """대상 스레드의 스택을 주기적으로 샘플링하여 collapsed-stack (flamegraph) 형식으로 집계"""
+
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}")
+                frame = frame.f_back
+
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self):
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+
+# Profile Store
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class ProfileStore:
+    """URL 이름별 디렉토리에 프로파일을 저장하고, 디렉토리마다 최신 max_files 개만 유지"""
+
+    UNSAFE_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+    def __init__(self, directory, max_files=50):
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    def save(self, url_name, sampler, duration_ms):
+        directory = self.directory / self.UNSAFE_CHARACTERS.sub("_", url_name)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # uuid suffix: gthread requests of one worker can finish in the same second with the same duration
+        path = directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{int(duration_ms)}ms-{os.getpid()}-{uuid.uuid4().hex[:8]}.folded"
+        path.write_text(sampler.collapsed())
+        self.rotate(directory)
+        return path
+
+    def rotate(self, directory):
+        # Other workers rotate the same directory: a globbed file can be gone before its stat
+        profiles = []
+        for path in directory.glob("*.folded"):
+            try:
+                profiles.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        profiles.sort()
+        for _, path in profiles[:-self.max_files]:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,48 @@
+# server/ratelimit.py
+app_name = "server"
+
+import math
+import time
+
+from rest_framework.throttling import BaseThrottle
+
+from django.core.cache import cache
+
+from .cache import make_key
+from .metrics import cache_incr
+
+# Sliding Window Limiter
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class SlidingWindowLimiter:
+    """
+    캐시 기반 sliding window counter. 현재 / 이전 고정 윈도우 카운터를 경과 비율로 가중해 최근 window 초의 요청 수를 추정한다.
+    키당 캐시 연산은 incr 1회 + get 1회.
+    """
+
+    def __init__(self, name, limit, window):
+        self.name = name
+        self.limit = limit
+        self.window = window
+
+    def hit(self, identifier):
+        # Returns (allowed, retry_after_seconds); rejected hits are counted too, so hammering keeps the client blocked
+        now = time.time()
+        index, elapsed = divmod(now, self.window)
+        current_key = make_key("ratelimit", self.name, identifier, int(index))
+        previous_key = make_key("ratelimit", self.name, identifier, int(index) - 1)
+
+        if not cache.add(current_key, 1, self.window * 2):
+            current = cache_incr(current_key)
+        else:
+            current = 1
+        previous = cache.get(previous_key, 0)
+
+        estimated = previous * (1 - elapsed / self.window) + current
+        if estimated <= self.limit:
+            return True, 0
+        return False, math.ceil(self.window - elapsed)
+
+
+def get_client_ip(request):
+    # X-Forwarded-For handling follows REST_FRAMEWORK['NUM_PROXIES']
+    return BaseThrottle().get_ident(request)
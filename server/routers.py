@@ -0,0 +1,102 @@
+# server/routers.py
+app_name = "server"
+
+import functools
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from rest_framework.permissions import SAFE_METHODS
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+REPLICA_DATABASE = "replica"
+
+_use_replica = ContextVar("use_replica", default=False)
+_write_tracker = ContextVar("write_tracker", default=None)
+
+
+def replica_configured():
+    return REPLICA_DATABASE in settings.DATABASES
+
+
+@contextmanager
+def read_replica():
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+# Read-your-writes
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def sticky_key(user_id):
+    return f"db:sticky:{user_id}"
+
+
+def mark_primary_sticky(user_id):
+    cache.set(sticky_key(user_id), 1, settings.DATABASE_REPLICA_STICKY_SECONDS)
+
+
+def is_primary_sticky(user_id):
+    return cache.get(sticky_key(user_id)) is not None
+
+
+@contextmanager
+def track_writes():
+    tracker = {"written": False}
+    token = _write_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _write_tracker.reset(token)
+
+
+def replica_read(view_method):
+    """
+    Safe-method APIView handlers decorated with this read from the replica,
+    unless the authenticated user wrote to the primary within DATABASE_REPLICA_STICKY_SECONDS.
+    """
+    @functools.wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        if not replica_configured() or request.method not in SAFE_METHODS:
+            return view_method(view, request, *args, **kwargs)
+
+        if request.user.is_authenticated and is_primary_sticky(request.user.pk):
+            return view_method(view, request, *args, **kwargs)
+
+        with read_replica():
+            return view_method(view, request, *args, **kwargs)
+
+    return wrapper
+
+
+# Primary / Replica Router
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class PrimaryReplicaRouter:
+    """
+    Writes always go to 'default'. Reads go to 'replica' only inside read_replica(),
+    when the alias is configured and no transaction is open on the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get() or not replica_configured():
+            return "default"
+        if connections["default"].in_atomic_block:
+            return "default"
+        return REPLICA_DATABASE
+
+    def db_for_write(self, model, **hints):
+        tracker = _write_tracker.get()
+        if tracker is not None:
+            tracker["written"] = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
@@ -3,8 +3,12 @@ app_name = "server"
 
 import re
 
+from importlib import import_module
+
 from rest_framework import status, serializers
 
+from django.conf import settings
+
 # Success Response Serializer
 class SuccessResponseSerializer(serializers.Serializer):
     code = serializers.IntegerField(default=0, help_text="Success code")
@@ -34,4 +38,43 @@ class ErrorResponseSerializer(serializers.Serializer):
         if 'data' in kwargs and isinstance(kwargs['data'], dict):
             if 'code' not in kwargs['data']:
                 kwargs['data']['code'] = 1
-        super().__init__(*args, **kwargs)
\ No newline at end of file
+        super().__init__(*args, **kwargs)
+
+
+# Lazy Schema
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def lazy_schema(factory=None, **kwargs):
+    """
+    extend_schema 의 지연 버전. factory 는 'accounts.schemas.AccountSchema.signup' 형태의 경로이며,
+    schema 모듈과 drf_spectacular 는 /api/schema 생성 시점에만 import 된다.
+    """
+    def decorator(view_method):
+        view_method.lazy_schema = (factory, kwargs)
+        return view_method
+    return decorator
+
+
+def resolve_schema_factory(path):
+    module_path, class_name, method_name = path.rsplit(".", 2)
+    return getattr(getattr(import_module(module_path), class_name), method_name)
+
+
+def apply_lazy_schemas(endpoints, **kwargs):
+    # SPECTACULAR_SETTINGS['PREPROCESSING_HOOKS']
+    from drf_spectacular.utils import extend_schema
+
+    # Extensions register on import; loading them here keeps drf_spectacular out of process startup
+    for module_path in settings.OPENAPI_EXTENSION_MODULES:
+        import_module(module_path)
+
+    for path, path_regex, method, callback in endpoints:
+        view_method = getattr(getattr(callback, "cls", None), method.lower(), None)
+        lazy = getattr(view_method, "lazy_schema", None)
+        if lazy is None:
+            continue
+
+        factory, overrides = lazy
+        schema_kwargs = resolve_schema_factory(factory)() if factory else {}
+        extend_schema(**schema_kwargs, **overrides)(view_method)
+        view_method.lazy_schema = None
+    return endpoints
@@ -14,8 +14,6 @@ import os, dotenv
 from pathlib import Path
 from datetime import timedelta
 
-from celery.schedules import crontab
-
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -45,6 +43,7 @@ INSTALLED_APPS = [
     'drf_spectacular',              # Swagger
 
     # My apps
+    'server',
     'services',
     'accounts',
     'users',
@@ -54,21 +53,28 @@ INSTALLED_APPS = [
 
 
 REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': ('rest_framework_simplejwt.authentication.JWTAuthentication',),   # JWT
+    'DEFAULT_AUTHENTICATION_CLASSES': ('accounts.authentication.StatelessJWTAuthentication',),         # JWT (claims based, no User query)
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",                                       # Swagger
     'EXCEPTION_HANDLER': 'server.exceptions.custom_exception_handler',                                  # Custom Exception Handler
 }
 
 
+# JWT signing keys (accounts.keys.KeyRing)
+JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'HS256')                                                     # HS256 (SECRET_KEY), RS256 or EdDSA
+JWT_PRIVATE_KEY_FILES = [path for path in os.getenv('JWT_PRIVATE_KEY_FILES', '').split(',') if path]    # PEM; the first one signs
+JWT_PUBLIC_KEY_FILES = [path for path in os.getenv('JWT_PUBLIC_KEY_FILES', '').split(',') if path]      # Retired keys, still accepted
+JWKS_MAX_AGE = int(os.getenv('JWKS_MAX_AGE', 300))                                                      # seconds (/.well-known/jwks.json)
+
+
 # JWT
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
-    'ROTATE_REFRESH_TOKENS': False,
+    'ROTATE_REFRESH_TOKENS': True,         # accounts.revocation.TokenDenylist: a refresh token is valid once
     'BLACKLIST_AFTER_ROTATION': False,
     'UPDATE_LAST_LOGIN': False,
 
-    'ALGORITHM': 'HS256',
+    'ALGORITHM': JWT_ALGORITHM,
     'SIGNING_KEY': SECRET_KEY,
     'VERIFYING_KEY': None,
     'AUDIENCE': None,
@@ -82,7 +88,7 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'USER_AUTHENTICATION_RULE': 'rest_framework_simplejwt.authentication.default_user_authentication_rule',
 
-    'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
+    'AUTH_TOKEN_CLASSES': ('accounts.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
     'TOKEN_USER_CLASS': 'rest_framework_simplejwt.models.TokenUser',
 
@@ -99,21 +105,58 @@ SPECTACULAR_SETTINGS = {
     'TITLE': 'API',
     'DESCRIPTION': 'API',
     'VERSION': '1.0.0',
+    'PREPROCESSING_HOOKS': ['server.schemas.apply_lazy_schemas'],  # @lazy_schema
 }
+OPENAPI_EXTENSION_MODULES = ['accounts.extensions']                # drf-spectacular extensions, imported by apply_lazy_schemas (schema generation only)
+
+# Prebuilt schema served at /api/schema (python manage.py build_schema)
+OPENAPI_SCHEMA_FILE = os.getenv('OPENAPI_SCHEMA_FILE', os.path.join(BASE_DIR, 'openapi', 'schema.json.gz'))
 
 
 MIDDLEWARE = [
+    'server.middleware.PerformanceMiddleware',  # Performance
+    'server.middleware.ProfilingMiddleware',    # Profiling
+    'server.middleware.CompressionMiddleware',   # gzip / Brotli
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',    # CORS
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'server.middleware.ReplicaStickinessMiddleware',    # Read-your-writes
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
 
+# Performance (0.0 disables sampling, 1.0 records every request)
+PERFORMANCE_SAMPLE_RATE = float(os.getenv('PERFORMANCE_SAMPLE_RATE', 0.0))
+PERFORMANCE_SLOW_THRESHOLD_MS = float(os.getenv('PERFORMANCE_SLOW_THRESHOLD_MS', 500))
+PERFORMANCE_N_PLUS_ONE_THRESHOLD = int(os.getenv('PERFORMANCE_N_PLUS_ONE_THRESHOLD', 5))
+PERFORMANCE_BUFFER_SIZE = int(os.getenv('PERFORMANCE_BUFFER_SIZE', 1000))
+
+# Profiling (staff users can force a profile with the 'X-Profile' header)
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0.0))
+PROFILING_HEADER = 'HTTP_X_PROFILE'
+PROFILING_INTERVAL = float(os.getenv('PROFILING_INTERVAL', 0.005))
+PROFILING_DIR = os.getenv('PROFILING_DIR', os.path.join(BASE_DIR, 'profiles'))
+PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', 50))
+
+# Compression (Brotli requires the optional 'brotli' package; text/event-stream is never compressed)
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))   # bytes
+COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 5))
+COMPRESSION_CONTENT_TYPES = [
+    'application/json',
+    'application/vnd.oai.openapi',
+    'text/html',
+    'text/css',
+    'text/javascript',
+    'application/javascript',
+    'image/svg+xml',
+]
+
+
 ROOT_URLCONF = 'server.urls'
 
 
@@ -142,38 +185,98 @@ DATABASES = {
     }
 }
 
-# Database (PostgreSQL)
-"""
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': os.getenv('POSTGRES_DB'),
-        'USER': os.getenv('POSTGRES_USER'),
-        'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
-        'HOST': os.getenv('POSTGRES_HOST'),
-        'PORT': os.getenv('POSTGRES_PORT'),
+# Database routing (reads go to the 'replica' alias only inside server.routers.read_replica())
+DATABASE_ROUTERS = ['server.routers.PrimaryReplicaRouter']
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv('DATABASE_REPLICA_STICKY_SECONDS', 10))
+
+
+# Cache (Redis when REDIS_URL is set, local memory otherwise)
+REDIS_URL = os.getenv('REDIS_URL')
+CACHE_VERSION = int(os.getenv('CACHE_VERSION', 1))
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'server',
+            'VERSION': CACHE_VERSION,
+            'TIMEOUT': 300,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'server',
+            'VERSION': CACHE_VERSION,
+            'TIMEOUT': 300,
+        }
     }
-}
-"""
 
 
 # EMAIL
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')      # 'django.core.mail.backends.locmem.EmailBackend' for tests
 EMAIL_USE_TLS = True
 EMAIL_USE_SSL = False
 EMAIL_HOST = os.getenv('EMAIL_HOST')
 EMAIL_PORT = os.getenv('EMAIL_PORT')
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
+EMAIL_TIMEOUT = int(os.getenv('EMAIL_TIMEOUT', 10))                           # seconds
+EMAIL_CONNECTION_MAX_IDLE = int(os.getenv('EMAIL_CONNECTION_MAX_IDLE', 60))   # seconds a worker keeps an idle SMTP connection (server.mail)
+EMAIL_BATCH_SIZE = int(os.getenv('EMAIL_BATCH_SIZE', 50))                       # verification mails per send_verification_emails task / SMTP send
+EMAIL_BATCH_INTERVAL = float(os.getenv('EMAIL_BATCH_INTERVAL', 0.5))          # seconds a web process collects verification mails (0 enqueues each one)
 
 
-# Celery
+# Celery (queues, routes and worker profiles: server/celery.py)
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_TASK_IGNORE_RESULT = True                                            # Tasks that need a result set ignore_result=False
+CELERY_RESULT_EXPIRES = int(os.getenv('CELERY_RESULT_EXPIRES', 3600))      # seconds
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', 1))
+CELERY_TASK_REJECT_ON_WORKER_LOST = True                                    # Only applies to acks_late (idempotent) tasks
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    # Redis redelivers unacknowledged (acks_late) tasks after this; keep it above the longest task runtime and ETA
+    'visibility_timeout': int(os.getenv('CELERY_VISIBILITY_TIMEOUT', 3600)),
+}
+CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_BEAT_SCHEDULE = {
+    'sweep-expired-verifications': {
+        'task': 'accounts.tasks.sweep_expired_verifications',
+        'schedule': timedelta(minutes=30),
+    },
 }
 
 
+# User cache (accounts.authentication.UserCache)
+USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', 60))          # seconds a cached User row is trusted without re-reading
+USER_CACHE_SIZE = int(os.getenv('USER_CACHE_SIZE', 1024))      # rows per process
+SOCIAL_ACCOUNT_CACHE_TTL = int(os.getenv('SOCIAL_ACCOUNT_CACHE_TTL', 3600))     # seconds a (provider, provider_user_id) -> user id mapping is cached
+
+
+# Token denylist (accounts.revocation.TokenDenylist)
+TOKEN_DENYLIST_SYNC_INTERVAL = float(os.getenv('TOKEN_DENYLIST_SYNC_INTERVAL', 5))    # seconds until other processes see a revoked access token
+TOKEN_DENYLIST_BLOOM_BITS = int(os.getenv('TOKEN_DENYLIST_BLOOM_BITS', 1 << 20))      # per process and window; ~100k revocations at 1% false positives
+
+
+# Last access (accounts.access.LastAccessTracker)
+LAST_ACCESS_GRANULARITY = int(os.getenv('LAST_ACCESS_GRANULARITY', 300))           # seconds; more recent values are not rewritten
+LAST_ACCESS_FLUSH_INTERVAL = int(os.getenv('LAST_ACCESS_FLUSH_INTERVAL', 10))      # seconds between batched UPDATEs (0 writes immediately)
+
+
+# Verification
+VERIFICATION_BACKEND = os.getenv('VERIFICATION_BACKEND', 'accounts.verification.CacheVerificationBackend' if os.getenv('REDIS_URL') else 'accounts.verification.DatabaseVerificationBackend')
+VERIFICATION_TTL = int(os.getenv('VERIFICATION_TTL', 300))                          # seconds
+VERIFICATION_MAX_ATTEMPTS = int(os.getenv('VERIFICATION_MAX_ATTEMPTS', 5))         # wrong codes before the code is discarded
+VERIFICATION_RESEND_SECONDS = int(os.getenv('VERIFICATION_RESEND_SECONDS', 60))    # Repeated requests within this window are not re-sent
+VERIFICATION_TARGET_LIMIT = int(os.getenv('VERIFICATION_TARGET_LIMIT', 5))         # per target per window
+VERIFICATION_TARGET_WINDOW = int(os.getenv('VERIFICATION_TARGET_WINDOW', 600))     # seconds
+VERIFICATION_IP_LIMIT = int(os.getenv('VERIFICATION_IP_LIMIT', 20))                # per client IP per window
+VERIFICATION_IP_WINDOW = int(os.getenv('VERIFICATION_IP_WINDOW', 3600))            # seconds
+
+
 # Social
 NAVER_CLIENT_ID = os.getenv('NAVER_CLIENT_ID')
 NAVER_CLIENT_SECRET = os.getenv('NAVER_CLIENT_SECRET')
@@ -185,6 +288,14 @@ GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
 GOOGLE_CALLBACK_URI = os.getenv('GOOGLE_CALLBACK_URI')
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 
+# Provider HTTP (server.http.ProviderClient: social login / identity verification calls)
+PROVIDER_CONNECT_TIMEOUT = float(os.getenv('PROVIDER_CONNECT_TIMEOUT', 3.05))   # seconds
+PROVIDER_READ_TIMEOUT = float(os.getenv('PROVIDER_READ_TIMEOUT', 10))           # seconds
+PROVIDER_RETRIES = int(os.getenv('PROVIDER_RETRIES', 2))                        # idempotent requests (and failed connects) only
+PROVIDER_RETRY_BACKOFF = float(os.getenv('PROVIDER_RETRY_BACKOFF', 0.25))       # seconds, doubled per attempt with full jitter
+PROVIDER_POOL_SIZE = int(os.getenv('PROVIDER_POOL_SIZE', 10))                   # keep-alive connections per provider host
+PROVIDER_URL_OVERRIDE = os.getenv('PROVIDER_URL_OVERRIDE')                      # e.g. http://127.0.0.1:8900 (python manage.py fake_providers)
+
 # Authentication
 NICE_CLIENT_ID = os.getenv('NICE_CLIENT_ID')
 NICE_ACCESS_TOKEN = os.getenv('NICE_ACCESS_TOKEN')
@@ -199,6 +310,20 @@ TOSS_API_SECRET_BASE64 = os.getenv('TOSS_API_SECRET_BASE64')
 AUTH_USER_MODEL = 'accounts.User'
 
 
+# Password hashing (accounts.hashing.PasswordHashingPool)
+PASSWORD_HASHERS = [
+    'accounts.hashing.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASH_ITERATIONS = int(os.getenv('PASSWORD_HASH_ITERATIONS', 1_000_000))    # PBKDF2-SHA256 (python manage.py bench_hashing); older hashes are re-encoded on login
+PASSWORD_HASHING_WORKERS = int(os.getenv('PASSWORD_HASHING_WORKERS', 1))            # hashing processes per web worker (0 hashes on the request thread)
+PASSWORD_HASHING_CONCURRENCY = int(os.getenv('PASSWORD_HASHING_CONCURRENCY', 4))    # hashes running or queued per web worker
+PASSWORD_HASHING_WAIT = float(os.getenv('PASSWORD_HASHING_WAIT', 2))                # seconds to wait for a slot before answering 503
+
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -226,6 +351,11 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 STATIC_URL = 'static/'
+STATIC_SERVE = os.getenv('STATIC_SERVE', 'false').lower() == 'true'      # Serve STATIC_ROOT from Django (server.staticfiles.serve_static)
+STATICFILES_FINDERS = [
+    'django.contrib.staticfiles.finders.FileSystemFinder',
+    'server.staticfiles.AppDirectoriesFinder',      # server/static is STATIC_ROOT, not a source
+]
 
 
 # Default primary key field type
@@ -10,6 +10,67 @@ CSRF_TRUSTED_ORIGINS = ['http://localhost:8000']
 
 WSGI_APPLICATION = 'server.wsgi.deploy.application'
 
+ASGI_APPLICATION = 'server.asgi.application'
+
+# Database (PostgreSQL)
+POSTGRES_POOL = os.getenv('POSTGRES_POOL', 'false').lower() == 'true'
+POSTGRES_STATEMENT_TIMEOUT = int(os.getenv('POSTGRES_STATEMENT_TIMEOUT', 30000))    # ms
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv('POSTGRES_DB'),
+        'USER': os.getenv('POSTGRES_USER'),
+        'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
+        'HOST': os.getenv('POSTGRES_HOST'),
+        'PORT': os.getenv('POSTGRES_PORT'),
+        'CONN_MAX_AGE': 0 if POSTGRES_POOL else int(os.getenv('POSTGRES_CONN_MAX_AGE', 60)),   # Pooling replaces persistent connections
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': 5,
+            'options': f'-c statement_timeout={POSTGRES_STATEMENT_TIMEOUT} -c idle_in_transaction_session_timeout={POSTGRES_STATEMENT_TIMEOUT * 2}',
+        },
+    }
+}
+
+if POSTGRES_POOL:
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('POSTGRES_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.getenv('POSTGRES_POOL_MAX_SIZE', 10)),
+        'timeout': int(os.getenv('POSTGRES_POOL_TIMEOUT', 10)),
+    }
+
+if os.getenv('POSTGRES_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.getenv('POSTGRES_REPLICA_HOST'),
+        'PORT': os.getenv('POSTGRES_REPLICA_PORT', os.getenv('POSTGRES_PORT')),
+        'OPTIONS': {
+            **DATABASES['default']['OPTIONS'],
+            'options': f'-c statement_timeout={POSTGRES_STATEMENT_TIMEOUT} -c default_transaction_read_only=on',
+        },
+        'TEST': {'MIRROR': 'default'},
+    }
+
+# Cache
+CACHES['default'] = {
+    'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+    'LOCATION': REDIS_URL or 'redis://redis:6379/1',
+    'KEY_PREFIX': 'server',
+    'VERSION': CACHE_VERSION,
+    'TIMEOUT': 300,
+}
+
+# Static files (hashed names + precompressed .gz / .br, served with immutable cache headers)
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'server.staticfiles.CompressedManifestStaticFilesStorage'},
+}
+STATIC_SERVE = os.getenv('STATIC_SERVE', 'true').lower() == 'true'
+
+# Verification codes live in Redis (TTL expiry, no DB writes)
+VERIFICATION_BACKEND = os.getenv('VERIFICATION_BACKEND', 'accounts.verification.CacheVerificationBackend')
+
 # Celery
 CELERY_BROKER_URL = 'redis://redis:6379/0'
 CELERY_RESULT_BACKEND = 'redis://redis:6379/0'
\ No newline at end of file
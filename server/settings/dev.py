@@ -8,6 +8,9 @@ CORS_ALLOW_ALL_ORIGINS = True
 
 WSGI_APPLICATION = 'server.wsgi.dev.application'
 
+PERFORMANCE_SAMPLE_RATE = 1.0
+
 # Celery
 CELERY_BROKER_URL = 'redis://localhost:6379/0'
-CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
\ No newline at end of file
+CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
+CELERY_TASK_ALWAYS_EAGER = os.getenv('CELERY_TASK_ALWAYS_EAGER', 'true').lower() == 'true'     # Run tasks inline unless a worker is running
@@ -0,0 +1,101 @@
+# server/staticfiles.py
+app_name = "server"
+
+import functools
+import mimetypes
+
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+from .compression import brotli, choose_encoding, compress
+
+# Finders
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class AppDirectoriesFinder(finders.AppDirectoriesFinder):
+    # The server app is installed for its management commands; its static directory is STATIC_ROOT
+    def __init__(self, app_names=None, *args, **kwargs):
+        if app_names is None:
+            app_names = [app_config.name for app_config in apps.get_app_configs() if app_config.name != 'server']
+        super().__init__(app_names, *args, **kwargs)
+
+
+# Compressed Manifest Storage
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """collectstatic 시 해시 파일명(name.<hash>.css) 과 함께 .gz / .br 압축본을 미리 생성"""
+
+    manifest_strict = False     # Missing entries fall back to the unhashed name instead of raising
+    compressible_extensions = (".css", ".js", ".mjs", ".map", ".svg", ".json", ".txt", ".html", ".xml", ".ttf", ".otf", ".eot", ".ico")
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+
+        for name in set(self.hashed_files.values()):
+            if name.endswith(self.compressible_extensions):
+                self.write_compressed(name)
+
+    def write_compressed(self, name):
+        with self.open(name) as file:
+            content = file.read()
+        for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+            if encoding == "br" and brotli is None:
+                continue
+            compressed = compress(content, encoding, gzip_level=9, brotli_quality=11)
+            if len(compressed) < len(content):
+                Path(self.path(name + suffix)).write_bytes(compressed)
+
+
+# Static Serving
+# <-------------------------------------------------------------------------------------------------------------------------------->
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+@functools.lru_cache(maxsize=1)
+def hashed_names():
+    return frozenset(getattr(staticfiles_storage, "hashed_files", {}).values())
+
+
+def serve_static(request, path):
+    """
+    STATIC_ROOT 정적 파일 서빙 (STATIC_SERVE). 미리 압축된 .br / .gz 가 있으면 그대로 전송하고,
+    해시 파일명은 1년 immutable, 그 외는 재검증하도록 캐시 헤더를 설정한다.
+    """
+    try:
+        full_path = Path(safe_join(settings.STATIC_ROOT, path))
+    except SuspiciousFileOperation:
+        raise Http404(path)
+    if not full_path.is_file():
+        raise Http404(path)
+
+    stat = full_path.stat()
+    if not was_modified_since(request.headers.get("If-Modified-Since"), stat.st_mtime):
+        return HttpResponseNotModified()
+
+    content_type, _ = mimetypes.guess_type(path)
+    encoding = choose_encoding(request.headers.get("Accept-Encoding"))
+    encoded_path = full_path.with_name(full_path.name + ENCODING_SUFFIXES[encoding]) if encoding else None
+    if encoded_path is None or not encoded_path.is_file():
+        encoding, encoded_path = None, full_path
+
+    response = FileResponse(encoded_path.open("rb"), content_type=content_type or "application/octet-stream", filename=full_path.name)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Last-Modified"] = http_date(stat.st_mtime)
+    if path in hashed_names():
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    else:
+        response.headers["Cache-Control"] = "public, no-cache"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
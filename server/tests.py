@@ -0,0 +1,275 @@
+# server/tests.py
+app_name = "server"
+
+import os
+import gzip
+import time
+import tempfile
+import threading
+
+from pathlib import Path
+from unittest import mock
+
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from accounts.models import User
+from accounts.tokens import token_service
+
+from .cache import cached_view, get_or_set, make_key, versioned_key
+from .middleware import CompressionMiddleware, ProfilingMiddleware, ReplicaStickinessMiddleware
+from .openapi import SchemaArtifact
+from .profiling import ProfileStore
+from .routers import _use_replica, is_primary_sticky, replica_read
+
+
+# Cache
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class GetOrSetTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def run_concurrently(self, *functions):
+        barrier, results = threading.Barrier(len(functions)), [None] * len(functions)
+
+        def run(index, function):
+            barrier.wait()
+            try:
+                results[index] = function()
+            except Exception as error:
+                results[index] = error
+
+        threads = [threading.Thread(target=run, args=(index, function)) for index, function in enumerate(functions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        results = self.run_concurrently(*[lambda: get_or_set("key", compute)] * 4)
+        self.assertEqual(results, ["value"] * 4)
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(cache.get(make_key("lock", versioned_key("key"))))
+
+    def test_failed_compute_releases_waiters(self):
+        def compute():
+            time.sleep(0.2)
+            raise ValueError("not cacheable")
+
+        start = time.monotonic()
+        results = self.run_concurrently(*[lambda: get_or_set("key", compute, lock_timeout=10)] * 2)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertLess(time.monotonic() - start, 2)        # Not lock_timeout
+        self.assertIsNone(cache.get(make_key("lock", versioned_key("key"))))
+
+    def test_waiter_never_releases_the_holders_lock(self):
+        lock_key = make_key("lock", versioned_key("key"))
+        holding, release = threading.Event(), threading.Event()
+
+        def slow():
+            holding.set()
+            release.wait(5)
+            return "slow"
+
+        holder = threading.Thread(target=get_or_set, args=("key", slow))
+        holder.start()
+        holding.wait(5)
+        self.assertEqual(get_or_set("key", lambda: "fast", wait_timeout=0.1), "fast")     # Gave up waiting and computed
+        self.assertIsNotNone(cache.get(lock_key))
+        release.set()
+        holder.join()
+        self.assertIsNone(cache.get(lock_key))
+
+
+class CachedView(APIView):
+    authentication_classes = []
+    permission_classes = []
+    calls = 0
+    status_code = 200
+
+    @cached_view(tags=["tests"])
+    def get(self, request):
+        CachedView.calls += 1
+        response = Response({"calls": CachedView.calls}, status=self.status_code)
+        response["X-Total-Count"] = "1"
+        response["Cache-Control"] = "max-age=60"
+        return response
+
+
+class CachedViewTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        CachedView.calls = 0
+        self.addCleanup(setattr, CachedView, "status_code", 200)
+
+    def get(self):
+        return CachedView.as_view()(APIRequestFactory().get("/cached"))
+
+    def test_hit_keeps_status_and_headers(self):
+        first, second = self.get(), self.get()
+        self.assertEqual(CachedView.calls, 1)
+        self.assertEqual(second.data, {"calls": 1})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second["X-Total-Count"], "1")
+        self.assertEqual(second["Cache-Control"], "max-age=60")
+
+    def test_other_statuses_are_not_cached(self):
+        CachedView.status_code = 404
+        self.assertEqual([self.get().status_code, self.get().status_code], [404, 404])
+        self.assertEqual(CachedView.calls, 2)
+
+
+# Profiling
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class ProfileStoreTests(SimpleTestCase):
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.directory = Path(temporary.name)
+
+    def test_rotate_skips_files_removed_by_another_worker(self):
+        for index in range(4):
+            path = self.directory / f"{index}.folded"
+            path.write_text("main 1\n")
+            os.utime(path, (index, index))
+        gone = self.directory / "gone.folded"       # Globbed, then unlinked by another worker before the stat
+
+        globbed = list(self.directory.glob("*.folded")) + [gone]
+        with mock.patch.object(Path, "glob", return_value=iter(globbed)):
+            ProfileStore(self.directory, max_files=2).rotate(self.directory)
+        self.assertEqual(sorted(path.name for path in self.directory.iterdir()), ["2.folded", "3.folded"])
+
+
+@override_settings(PROFILING_SAMPLE_RATE=0.0)
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.middleware = ProfilingMiddleware(lambda request: HttpResponse())
+
+    def request(self, user=None):
+        headers = {"HTTP_X_PROFILE": "1"}
+        if user is not None:
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {token_service.pair(user)[0]}"
+        return RequestFactory().get("/", **headers)
+
+    def test_staff_check_uses_token_claims(self):
+        staff = User.objects.create_user(email="staff@example.com", name="Staff", password="password-1234", is_staff=True)
+        member = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+        staff_request, member_request = self.request(staff), self.request(member)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.middleware.should_profile(staff_request))
+            self.assertFalse(self.middleware.should_profile(member_request))
+        self.assertFalse(self.middleware.should_profile(self.request()))
+
+
+# Replica Stickiness
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class ReplicaReadView(APIView):
+    permission_classes = []
+
+    @replica_read
+    def get(self, request):
+        return Response({"replica": _use_replica.get()})
+
+
+@mock.patch("server.middleware.replica_configured", return_value=True)
+@mock.patch("server.routers.replica_configured", return_value=True)
+class ReplicaStickinessTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+
+    def read(self):
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token_service.pair(self.user)[0]}")
+        return ReplicaReadView.as_view()(request).data["replica"]
+
+    def call(self, get_response):
+        request = RequestFactory().post("/")
+        request.user = self.user
+        return ReplicaStickinessMiddleware(get_response)(request)
+
+    def test_reads_stay_on_the_primary_after_a_write(self, *mocks):
+        self.assertTrue(self.read())
+
+        def write(request):
+            User.objects.filter(pk=self.user.pk).update(name="Renamed")
+            return HttpResponse()
+
+        self.call(write)
+        self.assertTrue(is_primary_sticky(self.user.pk))
+        self.assertFalse(self.read())
+
+    def test_requests_without_writes_are_not_sticky(self, *mocks):
+        self.call(lambda request: HttpResponse(User.objects.filter(pk=self.user.pk).exists()))
+        self.assertFalse(is_primary_sticky(self.user.pk))
+        self.assertTrue(self.read())
+
+
+# Compression
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(COMPRESSION_MIN_SIZE=10)
+class CompressionMiddlewareTests(SimpleTestCase):
+    body = b'{"results": [' + b'"row", ' * 200 + b'"row"]}'
+
+    def call(self, response):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_json_is_compressed(self):
+        response = self.call(HttpResponse(self.body, content_type="application/json"))
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertLess(len(response.content), len(self.body))
+
+    def test_event_stream_is_not_compressed(self):
+        response = self.call(StreamingHttpResponse(iter([b"data: 1\n\n"] * 50), content_type="text/event-stream"))
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(b"".join(response.streaming_content), b"data: 1\n\n" * 50)
+
+    def test_encoded_response_is_left_alone(self):
+        response = HttpResponse(self.body, content_type="application/json")
+        response["Content-Encoding"] = "br"
+        response = self.call(response)
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(response.content, self.body)
+
+
+# OpenAPI Schema
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(DEBUG=False, COMPRESSION_MIN_SIZE=10)
+class SchemaAPIViewTests(SimpleTestCase):
+    content = b'{"openapi": "3.0.3", "paths": {' + b'"/path": {}, ' * 100 + b'"/": {}}}'
+
+    def setUp(self):
+        artifact = SchemaArtifact(gzip.compress(self.content), '"schema-etag"', "urlconf")
+        patcher = mock.patch("server.views.load_schema_artifact", return_value=artifact)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def revalidate(self, accept_encoding):
+        response = self.client.get("/api/schema", HTTP_ACCEPT_ENCODING=accept_encoding)
+        self.assertEqual(response.status_code, 200)
+        return response, self.client.get("/api/schema", HTTP_ACCEPT_ENCODING=accept_encoding, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_gzip_client_revalidates(self):
+        response, revalidated = self.revalidate("gzip")
+        self.assertEqual((response["Content-Encoding"], response["ETag"]), ("gzip", '"schema-etag"'))
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_brotli_client_revalidates_with_the_weakened_etag(self):
+        response, revalidated = self.revalidate("br")
+        self.assertEqual((response["Content-Encoding"], response["ETag"]), ("br", 'W/"schema-etag"'))
+        self.assertEqual(revalidated.status_code, 304)
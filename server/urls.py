@@ -14,10 +14,14 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from .utils import lazy_view
+from .staticfiles import serve_static
+from .views import MetricsAPIView, SlowRequestAPIView, SchemaAPIView
+from accounts.views import JWKSAPIView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -26,6 +30,16 @@ urlpatterns = [
     path('users', include('users.urls')),
     path('gpts', include('gpts.urls')),
 
-    path('api/schema', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
+    path('api/schema', SchemaAPIView.as_view(), name='schema'),
+    path('api/docs', lazy_view('drf_spectacular.views.SpectacularSwaggerView', url_name='schema'), name='swagger-ui'),
+
+    path('.well-known/jwks.json', JWKSAPIView.as_view(), name='jwks'),
+
+    path('metrics', MetricsAPIView.as_view(), name='metrics'),
+    path('debug/slow', SlowRequestAPIView.as_view(), name='debug-slow'),
 ]
+
+if settings.STATIC_SERVE:
+    urlpatterns += [
+        re_path(rf'^{settings.STATIC_URL.lstrip("/")}(?P<path>.*)$', serve_static, name='static'),
+    ]
@@ -1,5 +1,11 @@
 # server/utils.py
 
+import sys
+import importlib.util
+
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+
 class SuccessResponseBuilder:
     def __init__(self):
         self.message = "Success"
@@ -81,4 +87,35 @@ def get_page_pagination_data(paginator, page):
         'page_size': paginator.page_size,
         'current_page': paginator.page.number,
         'total_pages': paginator.page.paginator.num_pages
-    }
\ No newline at end of file
+    }
+
+
+# Lazy Loading
+# <-------------------------------------------------------------------------------------------------------------------------------->
+def lazy_import(name):
+    """Module object that is only executed on first attribute access (e.g. requests = lazy_import("requests"))"""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def lazy_view(view_path, **initkwargs):
+    """URLconf entry that imports the view class on the first request"""
+    view = None
+
+    @csrf_exempt
+    def wrapper(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(view_path).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    wrapper.__name__ = view_path.rsplit(".", 1)[1]
+    return wrapper
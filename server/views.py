@@ -0,0 +1,98 @@
+# server/views.py
+app_name = "server"
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+
+from .utils import SuccessResponseBuilder, ErrorResponseBuilder, lazy_view
+from .schemas import lazy_schema
+from .metrics import registry, counters, histograms
+from .permissions import IsAdminUser
+from .openapi import load_schema_artifact
+
+# Monitoring
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class MetricsAPIView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @lazy_schema(exclude=True)
+    def get(self, request):
+        response = SuccessResponseBuilder().with_message("메트릭 조회 성공").with_data({
+            "sample_rate": settings.PERFORMANCE_SAMPLE_RATE,
+            "views": registry.aggregate(),
+            "counters": {name: counter.value() for name, counter in counters.items()},
+            "histograms": {name: histogram.snapshot() for name, histogram in histograms.items()},
+        }).build()
+        return Response(response, status=status.HTTP_200_OK)
+
+
+class SlowRequestAPIView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @lazy_schema(exclude=True)
+    def get(self, request):
+        try:
+            threshold_ms = float(request.query_params.get("threshold_ms", settings.PERFORMANCE_SLOW_THRESHOLD_MS))
+            valid = 0 <= threshold_ms < float("inf")      # Also rejects nan
+        except ValueError:
+            valid = False
+        if not valid:
+            response = ErrorResponseBuilder().with_message("threshold_ms 는 0 이상의 숫자여야 합니다.").with_errors({"threshold_ms": ["A non-negative number is required."]}).build()
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+        response = SuccessResponseBuilder().with_message("느린 요청 조회 성공").with_data({
+            "threshold_ms": threshold_ms,
+            "requests": registry.slow_requests(threshold_ms),
+        }).build()
+        return Response(response, status=status.HTTP_200_OK)
+
+
+# OpenAPI Schema
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class SchemaAPIView(APIView):
+    """
+    manage.py build_schema 로 빌드된 OpenAPI JSON 을 제공한다.
+    DEBUG, 아티팩트 누락, URLconf 버전 불일치, YAML / lang 요청은 실시간 생성으로 처리한다.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    live_view = staticmethod(lazy_view('drf_spectacular.views.SpectacularAPIView'))
+
+    @lazy_schema(exclude=True)
+    def get(self, request):
+        artifact = None if settings.DEBUG or self.wants_live(request) else load_schema_artifact()
+        if artifact is None:
+            # Rendered here so that this view's renderers do not replace SpectacularAPIView's
+            return self.live_view(request._request).render()
+
+        # Weak comparison: CompressionMiddleware sends W/"..." when it brotli-encodes the identity body
+        etags = [etag.removeprefix("W/") for etag in parse_etags(request.headers.get("If-None-Match", ""))]
+        if artifact.etag in etags:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        elif "gzip" in request.headers.get("Accept-Encoding", ""):
+            response = HttpResponse(artifact.compressed, content_type="application/vnd.oai.openapi+json")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(artifact.content, content_type="application/vnd.oai.openapi+json")
+
+        response["ETag"] = artifact.etag
+        response["Cache-Control"] = "public, max-age=0, must-revalidate"
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
+
+    def perform_content_negotiation(self, request, force=False):
+        # Formats are negotiated by the artifact or by SpectacularAPIView, not by this view's renderers
+        return super().perform_content_negotiation(request, force=True)
+
+    def wants_live(self, request):
+        if request.query_params.get("lang") or request.query_params.get("version"):
+            return True
+        if request.query_params.get("format"):
+            return request.query_params["format"] != "json"
+        return "yaml" in request.headers.get("Accept", "")
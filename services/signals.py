@@ -0,0 +1,14 @@
+# services/signals.py
+app_name = "services"
+
+from django.db.models.signals import post_save, post_delete
+
+from server.cache import invalidate_model_cache
+
+from .models import Notice, Event, Ad, FAQ, PrivacyPolicy, Term
+
+# Cache Invalidation
+# <-------------------------------------------------------------------------------------------------------------------------------->
+for model in (Notice, Event, Ad, FAQ, PrivacyPolicy, Term):
+    post_save.connect(invalidate_model_cache, sender=model, dispatch_uid=f"invalidate_{model._meta.label_lower}_on_save")
+    post_delete.connect(invalidate_model_cache, sender=model, dispatch_uid=f"invalidate_{model._meta.label_lower}_on_delete")
@@ -1,3 +1,39 @@
+# services/tests.py
+app_name = 'services'
+
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+
+from .models import Notice
+
+
+# Conditional Requests
+# <-------------------------------------------------------------------------------------------------------------------------------->
+class NoticeConditionalTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.notice = Notice.objects.create(
+            service="SERVICE1", title="Notice", start_date=timezone.now(), end_date=timezone.now() + timezone.timedelta(days=1)
+        )
+
+    def test_matching_etag_skips_the_view(self):
+        response = self.client.get("/services/notices")
+        self.assertEqual(response.status_code, 200)
+
+        with mock.patch("services.views.NoticeSerializer") as serializer, self.assertNumQueries(0):     # Version counters live in the cache
+            response = self.client.get("/services/notices", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        serializer.assert_not_called()
+
+    def test_save_changes_the_etag_and_the_cached_body(self):
+        etag = self.client.get("/services/notices")["ETag"]
+        self.notice.title = "Updated"
+        self.notice.save()
 
-# Create your tests here.
+        response = self.client.get("/services/notices", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["data"]["notices"][0]["title"], "Updated")
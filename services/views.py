@@ -7,17 +7,21 @@ from rest_framework import status
 
 from django.shortcuts import get_object_or_404
 
-from drf_spectacular.utils import extend_schema
-
+from server.schemas import lazy_schema
 from server.utils import SuccessResponseBuilder
+from server.cache import cached_view
+from server.conditional import conditional_view, model_version
+from server.routers import replica_read
 
 from .models import Notice, Event, Ad, FAQ, PrivacyPolicy, Term
 from .serializers import NoticeSerializer, EventSerializer, AdSerializer
 from .serializers import FAQSerializer, PrivacyPolicySerializer, TermSerializer
-from .schemas import ServicesSchema
 
 class NoticeAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_notices())
+    @lazy_schema("services.schemas.ServicesSchema.get_notices")
+    @conditional_view(model_version(Notice))
+    @cached_view(tags=[Notice])
+    @replica_read
     def get(self, request):
         service = request.query_params.get('service')
         if service:
@@ -31,7 +35,10 @@ class NoticeAPIView(APIView):
 
 
 class NoticeDetailAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_notice_detail())
+    @lazy_schema("services.schemas.ServicesSchema.get_notice_detail")
+    @conditional_view(model_version(Notice))
+    @cached_view(tags=[Notice])
+    @replica_read
     def get(self, request, notice_id):
         notice = get_object_or_404(Notice, id=notice_id, is_active=True)
         serializer = NoticeSerializer(notice)
@@ -40,7 +47,10 @@ class NoticeDetailAPIView(APIView):
 
 
 class EventAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_events())
+    @lazy_schema("services.schemas.ServicesSchema.get_events")
+    @conditional_view(model_version(Event))
+    @cached_view(tags=[Event])
+    @replica_read
     def get(self, request):
         service = request.query_params.get('service')
         if service:
@@ -54,7 +64,10 @@ class EventAPIView(APIView):
 
 
 class EventDetailAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_event_detail())
+    @lazy_schema("services.schemas.ServicesSchema.get_event_detail")
+    @conditional_view(model_version(Event))
+    @cached_view(tags=[Event])
+    @replica_read
     def get(self, request, event_id):
         event = get_object_or_404(Event, id=event_id, is_active=True)
         serializer = EventSerializer(event)
@@ -63,7 +76,10 @@ class EventDetailAPIView(APIView):
 
 
 class AdAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_ads())
+    @lazy_schema("services.schemas.ServicesSchema.get_ads")
+    @conditional_view(model_version(Ad))
+    @cached_view(tags=[Ad])
+    @replica_read
     def get(self, request):
         service = request.query_params.get('service')
         if service:
@@ -77,7 +93,10 @@ class AdAPIView(APIView):
 
 
 class AdDetailAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_ad_detail())
+    @lazy_schema("services.schemas.ServicesSchema.get_ad_detail")
+    @conditional_view(model_version(Ad))
+    @cached_view(tags=[Ad])
+    @replica_read
     def get(self, request, ad_id):
         ad = get_object_or_404(Ad, id=ad_id, is_active=True)
         serializer = AdSerializer(ad)
@@ -86,7 +105,10 @@ class AdDetailAPIView(APIView):
 
 
 class FAQAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_faqs())
+    @lazy_schema("services.schemas.ServicesSchema.get_faqs")
+    @conditional_view(model_version(FAQ))
+    @cached_view(tags=[FAQ])
+    @replica_read
     def get(self, request):
         service = request.query_params.get('service')
         if service:
@@ -100,7 +122,10 @@ class FAQAPIView(APIView):
 
 
 class FAQDetailAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_faq_detail())
+    @lazy_schema("services.schemas.ServicesSchema.get_faq_detail")
+    @conditional_view(model_version(FAQ))
+    @cached_view(tags=[FAQ])
+    @replica_read
     def get(self, request, faq_id):
         faq = get_object_or_404(FAQ, id=faq_id, is_active=True)
         serializer = FAQSerializer(faq)
@@ -109,7 +134,10 @@ class FAQDetailAPIView(APIView):
 
 
 class PrivacyPolicyAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_privacy_policies())
+    @lazy_schema("services.schemas.ServicesSchema.get_privacy_policies")
+    @conditional_view(model_version(PrivacyPolicy))
+    @cached_view(tags=[PrivacyPolicy])
+    @replica_read
     def get(self, request):
         service = request.query_params.get('service')
         if service:
@@ -123,7 +151,10 @@ class PrivacyPolicyAPIView(APIView):
 
 
 class PrivacyPolicyDetailAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_privacy_policy_detail())
+    @lazy_schema("services.schemas.ServicesSchema.get_privacy_policy_detail")
+    @conditional_view(model_version(PrivacyPolicy))
+    @cached_view(tags=[PrivacyPolicy])
+    @replica_read
     def get(self, request, privacy_policy_id):
         privacy = get_object_or_404(PrivacyPolicy, id=privacy_policy_id, is_active=True)
         serializer = PrivacyPolicySerializer(privacy)
@@ -132,7 +163,10 @@ class PrivacyPolicyDetailAPIView(APIView):
 
 
 class TermAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_terms())
+    @lazy_schema("services.schemas.ServicesSchema.get_terms")
+    @conditional_view(model_version(Term))
+    @cached_view(tags=[Term])
+    @replica_read
     def get(self, request):
         service = request.query_params.get('service')
         if service:
@@ -146,7 +180,10 @@ class TermAPIView(APIView):
 
 
 class TermDetailAPIView(APIView):
-    @extend_schema(**ServicesSchema.get_term_detail())
+    @lazy_schema("services.schemas.ServicesSchema.get_term_detail")
+    @conditional_view(model_version(Term))
+    @cached_view(tags=[Term])
+    @replica_read
     def get(self, request, term_id):
         term = get_object_or_404(Term, id=term_id, is_active=True)
         serializer = TermSerializer(term)
@@ -2,11 +2,12 @@
 app_name = "users"
 
 from django.db.models.signals import pre_delete
-from django.dispatch import receiver
 
 from .models import PointTransaction
 
-@receiver(pre_delete, sender=PointTransaction)
 def return_point_on_delete(sender, instance, **kwargs):
     instance.user.point = instance.user.point - instance.amount
-    instance.user.save()
\ No newline at end of file
+    instance.user.save()
+
+
+pre_delete.connect(return_point_on_delete, sender=PointTransaction, dispatch_uid="return_users_point_on_delete")
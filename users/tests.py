@@ -1,3 +1,46 @@
-from django.test import TestCase
+# users/tests.py
+app_name = 'users'
 
-# Create your tests here.
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+from accounts.tokens import token_service
+
+from .models import PointTransaction
+
+
+# Conditional Requests
+# <-------------------------------------------------------------------------------------------------------------------------------->
+@override_settings(PASSWORD_HASHING_WORKERS=0, PASSWORD_HASH_ITERATIONS=1000)
+class PointTransactionConditionalTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="member@example.com", name="Member", password="password-1234")
+        PointTransaction.objects.create(user=self.user, amount=100, transaction_type="DEPOSIT")
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {token_service.pair(self.user)[0]}"}
+
+    def get(self, **headers):
+        return self.client.get("/users/point-transactions", **self.headers, **headers)
+
+    def test_matching_etag_skips_the_view(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["data"]["point_transactions"]), 1)
+        self.assertIn("private", response["Cache-Control"])
+
+        with mock.patch("users.views.PointTransactionSerializer") as serializer, self.assertNumQueries(1):     # The version aggregate only
+            response = self.get(HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        serializer.assert_not_called()
+
+    def test_new_transaction_changes_the_etag(self):
+        etag = self.get()["ETag"]
+        PointTransaction.objects.create(user=self.user, amount=50, transaction_type="COUPON")
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.json()["data"]["point_transactions"]), 2)
@@ -6,22 +6,28 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from django.shortcuts import get_object_or_404
+from django.db.models import Q
 
-from drf_spectacular.utils import extend_schema
-
+from server.schemas import lazy_schema
 from server.utils import ErrorResponseBuilder, SuccessResponseBuilder
+from server.routers import replica_read
+from server.conditional import conditional_view, queryset_version
 from accounts.models import User
+from accounts.authentication import FreshJWTAuthentication
 
 from .utils import ReferralHandler
 from .models import Referral, PointCoupon, PointTransaction
 from .permissions import IsAuthenticated
 from .serializers import ReferralSerializer, PointTransactionSerializer
-from .schemas import UserSchema
 
 class ReferralAPIView(APIView):
     permission_classes = [IsAuthenticated]
     
-    @extend_schema(**UserSchema.get_referrals())
+    @lazy_schema("users.schemas.UserSchema.get_referrals")
+    @conditional_view(queryset_version(
+        lambda request: Referral.objects.filter(Q(referrer=request.user) | Q(referree=request.user)),
+        fields=("modified_at", "referrer__modified_at", "referree__modified_at"),
+    ), private=True)
     def get(self, request):
         referrals_given = Referral.objects.filter(referrer=request.user)
         referrals_received = Referral.objects.filter(referree=request.user)
@@ -36,9 +42,10 @@ class ReferralAPIView(APIView):
 
 
 class ReferralDetailAPIView(APIView):
+    authentication_classes = [FreshJWTAuthentication]     # Self-referral check needs the current referral_code
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(**UserSchema.create_referral())
+    @lazy_schema("users.schemas.UserSchema.create_referral")
     def post(self, request, referral_code):
         user = request.user
         if user.referral_code == referral_code:
@@ -60,7 +67,7 @@ class ReferralDetailAPIView(APIView):
 class PointCouponAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(**UserSchema.use_coupon())
+    @lazy_schema("users.schemas.UserSchema.use_coupon")
     def post(self, request, coupon_code):
         coupon = get_object_or_404(PointCoupon, code=coupon_code, is_active=True)
 
@@ -86,7 +93,9 @@ class PointCouponAPIView(APIView):
 class PointTransactionAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(**UserSchema.get_point_transactions())
+    @lazy_schema("users.schemas.UserSchema.get_point_transactions")
+    @conditional_view(queryset_version(lambda request: PointTransaction.objects.filter(user=request.user)), private=True)
+    @replica_read
     def get(self, request):
         transactions = PointTransaction.objects.filter(user=request.user)
         response = SuccessResponseBuilder().with_message("포인트 내역 조회 성공").with_data({"point_transactions": PointTransactionSerializer(transactions, many=True).data}).build()